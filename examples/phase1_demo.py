@@ -2,7 +2,7 @@
 Phase 1 Complete Demo
 
 Demonstrates all Phase 1 features:
-1. HTML parsing with BeautifulSoup
+1. HTML parsing with lxml
 2. PDF parsing with PyMuPDF
 3. Equivalence checking with DeepDiff and TheFuzz
 4. Visual regression testing with SSIM
@@ -213,7 +213,7 @@ def demo_web_scraper():
         <h2>Features</h2>
         <ul>
             <li>PDF parsing with PyMuPDF</li>
-            <li>HTML parsing with BeautifulSoup</li>
+            <li>HTML parsing with lxml</li>
             <li>Web rendering with Playwright</li>
             <li>VLM analysis with Instructor</li>
         </ul>
@@ -8,11 +8,8 @@ This test demonstrates the entire Phase 0 pipeline:
 4. Generate report
 """
 
-import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent))
-
 from vlm_doc_test.parsers import PDFParser
 from vlm_doc_test.validation import EquivalenceChecker
 from vlm_doc_test.schemas.schema_simple import (
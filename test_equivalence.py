@@ -4,12 +4,8 @@ Test the equivalence checking system.
 This demonstrates comparing tool-based extraction with simulated VLM output.
 """
 
-import sys
-from pathlib import Path
 from datetime import datetime
 
-sys.path.insert(0, str(Path(__file__).parent))
-
 from vlm_doc_test.schemas.schema_simple import (
     SimpleDocument,
     DocumentSource,
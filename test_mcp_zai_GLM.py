@@ -23,9 +23,6 @@ from pathlib import Path
 from datetime import datetime
 import argparse
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent))
-
 from vlm_doc_test.schemas.schema_simple import (
     SimpleDocument,
     DocumentMetadata,
@@ -5,12 +5,11 @@ This test suite performs in-depth testing of all Phase 1 components
 with real-world scenarios and edge cases.
 """
 
+import os
 import sys
 from pathlib import Path
 import tempfile
-import shutil
-
-sys.path.insert(0, str(Path(__file__).parent))
+from concurrent.futures import ThreadPoolExecutor
 
 from vlm_doc_test.parsers import HTMLParser, PDFParser
 from vlm_doc_test.validation import (
@@ -176,6 +175,52 @@ def test_html_parser_edge_cases(results, temp_dir):
         results.add_fail("Multiple links", str(e))
 
 
+def _make_multipage_pdf(pdf_path, temp_dir):
+    doc = fitz.open()
+    for i in range(5):
+        page = doc.new_page()
+        page.insert_text((50, 50), f"Page {i+1}", fontsize=18)
+        page.insert_text((50, 100), f"Content for page {i+1}", fontsize=12)
+    doc.save(str(pdf_path))
+    doc.close()
+
+
+def _make_no_meta_pdf(pdf_path, temp_dir):
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((50, 50), "Content", fontsize=12)
+    doc.save(str(pdf_path))
+    doc.close()
+
+
+def _make_image_pdf(pdf_path, temp_dir):
+    doc = fitz.open()
+    page = doc.new_page()
+
+    # Create a simple image
+    img = Image.new('RGB', (100, 100), color='red')
+    img_path = temp_dir / "test_img.png"
+    img.save(img_path)
+
+    # Insert image into PDF
+    page.insert_image(fitz.Rect(50, 50, 150, 150), filename=str(img_path))
+    doc.save(str(pdf_path))
+    doc.close()
+
+
+def _make_large_text_pdf(pdf_path, temp_dir):
+    doc = fitz.open()
+    page = doc.new_page(width=595, height=2000)  # Tall page
+
+    y_pos = 50
+    for i in range(50):
+        page.insert_text((50, y_pos), f"Line {i}: " + "x" * 50, fontsize=10)
+        y_pos += 15
+
+    doc.save(str(pdf_path))
+    doc.close()
+
+
 def test_pdf_parser_edge_cases(results, temp_dir):
     """Test PDF parser with edge cases."""
     print("\n" + "=" * 70)
@@ -184,79 +229,50 @@ def test_pdf_parser_edge_cases(results, temp_dir):
 
     parser = PDFParser()
 
-    # Test 1: Multi-page PDF
-    try:
-        pdf_path = temp_dir / "multipage.pdf"
-        doc = fitz.open()
-        for i in range(5):
-            page = doc.new_page()
-            page.insert_text((50, 50), f"Page {i+1}", fontsize=18)
-            page.insert_text((50, 100), f"Content for page {i+1}", fontsize=12)
-        doc.save(str(pdf_path))
-        doc.close()
-
-        parsed = parser.parse(str(pdf_path))
+    def check_multipage(parsed):
         assert len(parsed.content) >= 10, "Should extract from all pages"
-        results.add_pass("Multi-page PDF (5 pages)")
-    except Exception as e:
-        results.add_fail("Multi-page PDF", str(e))
 
-    # Test 2: PDF with no metadata
-    try:
-        pdf_path = temp_dir / "no_meta.pdf"
-        doc = fitz.open()
-        page = doc.new_page()
-        page.insert_text((50, 50), "Content", fontsize=12)
-        doc.save(str(pdf_path))
-        doc.close()
-
-        parsed = parser.parse(str(pdf_path))
+    def check_no_meta(parsed):
         assert parsed.metadata is not None, "Should handle missing metadata"
-        results.add_pass("PDF with no metadata")
-    except Exception as e:
-        results.add_fail("PDF with no metadata", str(e))
 
-    # Test 3: PDF with images
-    try:
-        pdf_path = temp_dir / "with_images.pdf"
-        doc = fitz.open()
-        page = doc.new_page()
-
-        # Create a simple image
-        img = Image.new('RGB', (100, 100), color='red')
-        img_path = temp_dir / "test_img.png"
-        img.save(img_path)
-
-        # Insert image into PDF
-        page.insert_image(fitz.Rect(50, 50, 150, 150), filename=str(img_path))
-        doc.save(str(pdf_path))
-        doc.close()
-
-        parsed = parser.parse(str(pdf_path), extract_images=True)
+    def check_images(parsed):
         assert len(parsed.figures) >= 1, "Should extract images"
-        results.add_pass("PDF with embedded images")
-    except Exception as e:
-        results.add_fail("PDF with embedded images", str(e))
-
-    # Test 4: Large text content
-    try:
-        pdf_path = temp_dir / "large_text.pdf"
-        doc = fitz.open()
-        page = doc.new_page(width=595, height=2000)  # Tall page
-
-        y_pos = 50
-        for i in range(50):
-            page.insert_text((50, y_pos), f"Line {i}: " + "x" * 50, fontsize=10)
-            y_pos += 15
-
-        doc.save(str(pdf_path))
-        doc.close()
 
-        parsed = parser.parse(str(pdf_path))
+    def check_large_text(parsed):
         assert len(parsed.content) >= 40, "Should handle large text content"
-        results.add_pass("PDF with large text content (50 lines)")
-    except Exception as e:
-        results.add_fail("PDF with large text", str(e))
+
+    # (pass name, fail name, file name, builder, parse kwargs, check)
+    cases = [
+        ("Multi-page PDF (5 pages)", "Multi-page PDF",
+         "multipage.pdf", _make_multipage_pdf, {}, check_multipage),
+        ("PDF with no metadata", "PDF with no metadata",
+         "no_meta.pdf", _make_no_meta_pdf, {}, check_no_meta),
+        ("PDF with embedded images", "PDF with embedded images",
+         "with_images.pdf", _make_image_pdf, {"extract_images": True}, check_images),
+        ("PDF with large text content (50 lines)", "PDF with large text",
+         "large_text.pdf", _make_large_text_pdf, {}, check_large_text),
+    ]
+
+    def build(case):
+        pdf_path = temp_dir / case[2]
+        case[3](pdf_path, temp_dir)
+        return pdf_path
+
+    # Build the next fixture on a worker thread while the current one is
+    # parsed; at most one fixture is ever built ahead of the parser.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending = pool.submit(build, cases[0])
+        for i, (pass_name, fail_name, _, _, parse_kwargs, check) in enumerate(cases):
+            future = pending
+            if i + 1 < len(cases):
+                pending = pool.submit(build, cases[i + 1])
+            try:
+                pdf_path = future.result()
+                parsed = parser.parse(str(pdf_path), **parse_kwargs)
+                check(parsed)
+                results.add_pass(pass_name)
+            except Exception as e:
+                results.add_fail(fail_name, str(e))
 
 
 def test_equivalence_checker_scenarios(results, temp_dir):
@@ -382,15 +398,13 @@ def test_visual_regression_scenarios(results, temp_dir):
     # Test 3: Gradual changes
     try:
         img1 = Image.new('RGB', (200, 200), color='white')
-        img2 = Image.new('RGB', (200, 200), color='white')
-        pixels2 = img2.load()
 
         # Add gradual noise
-        np.random.seed(42)
-        for x in range(200):
-            for y in range(200):
-                if np.random.random() < 0.01:  # 1% noise
-                    pixels2[x, y] = (200, 200, 200)
+        rng = np.random.default_rng(42)
+        mask = rng.random((200, 200)) < 0.01  # 1% noise
+        arr = np.full((200, 200, 3), 255, dtype=np.uint8)
+        arr[mask] = 200
+        img2 = Image.fromarray(arr)
 
         path1 = temp_dir / "grad1.png"
         path2 = temp_dir / "grad2.png"
@@ -421,13 +435,28 @@ def test_visual_regression_scenarios(results, temp_dir):
         results.add_fail("Different aspect ratios", str(e))
 
 
+def _make_comparison_results(scores, match_quality=None, details=None):
+    """Build ComparisonResult fixtures for the given scores in one pass."""
+    from vlm_doc_test.validation.equivalence import ComparisonResult, MatchQuality
+
+    match_quality = match_quality or MatchQuality.GOOD
+    return [
+        ComparisonResult(
+            match_quality=match_quality,
+            score=score,
+            details=dict(details or {}),
+        )
+        for score in scores
+    ]
+
+
 def test_reporter_scenarios(results, temp_dir):
     """Test reporter with various scenarios."""
     print("\n" + "=" * 70)
     print("5. Reporter Scenarios")
     print("=" * 70)
 
-    from vlm_doc_test.validation.equivalence import ComparisonResult, MatchQuality
+    from vlm_doc_test.validation.equivalence import MatchQuality
     from vlm_doc_test.validation.visual_regression import VisualComparisonResult
 
     reporter = ValidationReporter()
@@ -445,12 +474,9 @@ def test_reporter_scenarios(results, temp_dir):
     try:
         report = reporter.start_report("Multi Test")
 
-        for i in range(10):
-            comp_result = ComparisonResult(
-                match_quality=MatchQuality.GOOD,
-                score=0.85 + (i * 0.01),
-                details={},
-            )
+        for comp_result in _make_comparison_results(
+            [0.85 + (i * 0.01) for i in range(10)]
+        ):
             report.add_comparison(comp_result)
 
         report = reporter.finalize_report(report)
@@ -463,10 +489,8 @@ def test_reporter_scenarios(results, temp_dir):
     # Test 3: All report formats
     try:
         report = reporter.start_report("Format Test")
-        comp_result = ComparisonResult(
-            match_quality=MatchQuality.EXCELLENT,
-            score=0.97,
-            details={'test': 'data'},
+        comp_result, = _make_comparison_results(
+            [0.97], MatchQuality.EXCELLENT, details={'test': 'data'}
         )
         report.add_comparison(comp_result)
         report = reporter.finalize_report(report)
@@ -570,11 +594,13 @@ def main():
 
     results = TestResults()
 
-    # Create temporary directory
-    temp_dir = Path(tempfile.mkdtemp(prefix="phase1_test_"))
-    print(f"\nUsing temporary directory: {temp_dir}")
+    # Create temporary directory (tmpfs-backed when available, so the
+    # PDF/PNG fixtures never touch disk)
+    tmp_root = "/dev/shm" if os.path.isdir("/dev/shm") else None
+    with tempfile.TemporaryDirectory(prefix="phase1_test_", dir=tmp_root) as td:
+        temp_dir = Path(td)
+        print(f"\nUsing temporary directory: {temp_dir}")
 
-    try:
         # Run all test suites
         test_html_parser_edge_cases(results, temp_dir)
         test_pdf_parser_edge_cases(results, temp_dir)
@@ -583,10 +609,7 @@ def main():
         test_reporter_scenarios(results, temp_dir)
         test_integration_workflow(results, temp_dir)
 
-    finally:
-        # Cleanup
-        shutil.rmtree(temp_dir)
-        print(f"\nCleaned up temporary directory")
+    print(f"\nCleaned up temporary directory")
 
     # Print results
     results.print_summary()
@@ -14,16 +14,107 @@ Usage:
     # Full test (downloads models on first run):
     python test_phase3_quick.py --full
 
+    # Full test without the confirmation prompt (required when not on a terminal):
+    python test_phase3_quick.py --full --yes
+
     # Just run pytest:
     pytest vlm_doc_test/tests/test_pipeline_comparison.py -v
 """
 
 import sys
 import argparse
+import atexit
+import hashlib
+from functools import lru_cache
 from pathlib import Path
 
-# Add project to path
-sys.path.insert(0, str(Path(__file__).parent))
+OUTPUT_DIR = Path(__file__).parent / "test_output"
+
+# One-page PDF specs: tuples of ((x, y), text, fontsize), or
+# ((x0, y0, x1, y1), html, css) for content laid out in a single HTML box
+QUICK_PDF_SPEC = (
+    ((100, 100), "Phase 3 Quick Test", 16),
+    ((100, 150), "This is a simple test document.", 11),
+)
+
+_FULL_TABLE = (
+    ("Pipeline", "Speed", "Accuracy"),
+    ("PyMuPDF", "Very Fast", "Good"),
+    ("Marker", "Moderate", "Excellent"),
+    ("Docling", "Moderate", "Excellent"),
+)
+
+FULL_PDF_SPEC = (
+    # Title
+    ((100, 100), "Phase 3 Full Comparison Test", 16),
+    # Content
+    ((100, 150), """
+This document tests all Phase 3 PDF extraction pipelines:
+
+1. PyMuPDF (fitz) - Fast, coordinate-aware extraction
+2. Marker-PDF - High-fidelity Markdown conversion
+3. Docling + Granite Vision - Local VLM analysis
+
+Each pipeline has different strengths and trade-offs.
+    """.strip(), 10),
+    # Simple table
+    (
+        (100, 350, 500, 500),
+        "<table>" + "".join(
+            "<tr>" + "".join(f"<td>{cell}</td>" for cell in cells) + "</tr>"
+            for cells in _FULL_TABLE
+        ) + "</table>",
+        "td{padding:2px;font-size:9px}",
+    ),
+)
+
+INDIVIDUAL_PDF_SPEC = (
+    ((100, 100), "Individual Parser Test", 16),
+    ((100, 150), "Testing each parser individually.", 11),
+)
+
+
+@lru_cache(maxsize=1)
+def _fast_docling_parser():
+    """Docling parser on the pypdfium2 backend with OCR off (born-digital PDFs)."""
+    from vlm_doc_test.parsers import DoclingParser, DoclingConfig
+
+    return DoclingParser(DoclingConfig(backend="pypdfium2", ocr_enabled=False))
+
+
+@lru_cache(maxsize=None)
+def _build_test_pdf(pdf_path: Path, content_spec: tuple) -> Path:
+    """
+    Write a one-page test PDF, skipping the build if it is already current.
+
+    A ``.sha256`` sidecar records the spec the file was built from, so
+    repeated calls (and repeated runs) reuse the existing file.
+    """
+    digest = hashlib.sha256(repr(content_spec).encode("utf-8")).hexdigest()
+    sidecar = pdf_path.with_name(pdf_path.name + ".sha256")
+
+    if (
+        pdf_path.exists()
+        and pdf_path.stat().st_size > 0
+        and sidecar.exists()
+        and sidecar.read_text() == digest
+    ):
+        return pdf_path
+
+    import fitz
+
+    pdf_path.parent.mkdir(exist_ok=True)
+    doc = fitz.open()
+    page = doc.new_page()
+    for position, text, style in content_spec:
+        if len(position) == 4:
+            page.insert_htmlbox(fitz.Rect(position), text, css=style)
+        else:
+            page.insert_text(position, text, fontsize=style)
+    doc.save(pdf_path)
+    doc.close()
+    sidecar.write_text(digest)
+    return pdf_path
 
 
 def test_imports():
@@ -62,27 +153,20 @@ def test_quick_comparison():
     print("="*70)
 
     try:
-        import fitz
+        from vlm_doc_test.parsers import PDFParser
         from vlm_doc_test.validation.pipeline_comparison import PDFPipelineComparison
 
         # Create a simple test PDF
-        output_dir = Path(__file__).parent / "test_output"
-        output_dir.mkdir(exist_ok=True)
-
+        output_dir = OUTPUT_DIR
         pdf_path = output_dir / "test_quick.pdf"
 
         print(f"\n1. Creating test PDF: {pdf_path}")
-        doc = fitz.open()
-        page = doc.new_page()
-        page.insert_text((100, 100), "Phase 3 Quick Test", fontsize=16)
-        page.insert_text((100, 150), "This is a simple test document.", fontsize=11)
-        doc.save(pdf_path)
-        doc.close()
+        _build_test_pdf(pdf_path, QUICK_PDF_SPEC)
         print("   ✓ PDF created")
 
         # Compare with PyMuPDF only (very fast)
         print("\n2. Running pipeline comparison (PyMuPDF only)...")
-        comparison = PDFPipelineComparison()
+        comparison = PDFPipelineComparison(parsers={"pymupdf": PDFParser()})
         result = comparison.compare_all(pdf_path, pipelines=["pymupdf"])
 
         print(f"\n   Results:")
@@ -126,11 +210,22 @@ def test_quick_comparison():
     except Exception as e:
         print(f"\n❌ Quick comparison failed: {e}")
         import traceback
+        sys.stdout.flush()
         traceback.print_exc()
         return False
 
 
-def test_full_comparison():
+def _confirm(prompt: str, assume_yes: bool = False) -> bool:
+    """Ask for confirmation; non-interactive runs only proceed with --yes."""
+    if assume_yes:
+        return True
+    if not sys.stdin.isatty():
+        print("\nNo terminal to confirm on; pass --yes to run unattended.")
+        return False
+    return input(prompt).lower() == 'y'
+
+
+def test_full_comparison(assume_yes=False):
     """Test 3: Full comparison with all pipelines (downloads models on first run)."""
     print("\n" + "="*70)
     print("TEST 3: Full Pipeline Comparison (All Parsers)")
@@ -140,68 +235,33 @@ def test_full_comparison():
     print("   - Granite Vision: ~258MB")
     print("   - Subsequent runs will be faster (models cached)")
 
-    proceed = input("\nProceed with full test? (y/N): ")
-    if proceed.lower() != 'y':
+    if not _confirm("\nProceed with full test? (y/N): ", assume_yes):
         print("Skipped full comparison test.")
         return True
 
     try:
-        import fitz
         from vlm_doc_test.validation.pipeline_comparison import PDFPipelineComparison
 
         # Create a test PDF with more content
-        output_dir = Path(__file__).parent / "test_output"
-        output_dir.mkdir(exist_ok=True)
-
+        output_dir = OUTPUT_DIR
         pdf_path = output_dir / "test_full.pdf"
 
         print(f"\n1. Creating test PDF: {pdf_path}")
-        doc = fitz.open()
-        page = doc.new_page()
-
-        # Title
-        page.insert_text((100, 100), "Phase 3 Full Comparison Test", fontsize=16)
-
-        # Content
-        content = """
-This document tests all Phase 3 PDF extraction pipelines:
-
-1. PyMuPDF (fitz) - Fast, coordinate-aware extraction
-2. Marker-PDF - High-fidelity Markdown conversion
-3. Docling + Granite Vision - Local VLM analysis
-
-Each pipeline has different strengths and trade-offs.
-        """.strip()
-        page.insert_text((100, 150), content, fontsize=10)
-
-        # Simple table
-        table_y = 350
-        table_data = [
-            ["Pipeline", "Speed", "Accuracy"],
-            ["PyMuPDF", "Very Fast", "Good"],
-            ["Marker", "Moderate", "Excellent"],
-            ["Docling", "Moderate", "Excellent"],
-        ]
-
-        for row in table_data:
-            x = 100
-            for cell in row:
-                page.insert_text((x, table_y), cell, fontsize=9)
-                x += 120
-            table_y += 20
-
-        doc.save(pdf_path)
-        doc.close()
+        _build_test_pdf(pdf_path, FULL_PDF_SPEC)
         print("   ✓ PDF created")
 
         # Compare all pipelines
         print("\n2. Running full pipeline comparison...")
         print("   This may take 30-60 seconds on first run...")
 
-        comparison = PDFPipelineComparison()
+        comparison = PDFPipelineComparison(
+            parsers={"docling": _fast_docling_parser()}
+        )
         result = comparison.compare_all(
             pdf_path,
-            pipelines=["pymupdf", "marker", "docling"]
+            pipelines=["pymupdf", "marker", "docling"],
+            parallel=True,
+            warmup=True,
         )
 
         print(f"\n   Overall Results:")
@@ -251,6 +311,7 @@ Each pipeline has different strengths and trade-offs.
     except Exception as e:
         print(f"\n❌ Full comparison failed: {e}")
         import traceback
+        sys.stdout.flush()
         traceback.print_exc()
         return False
 
@@ -262,21 +323,13 @@ def test_individual_parsers():
     print("="*70)
 
     try:
-        import fitz
-        from vlm_doc_test.parsers import PDFParser, MarkerParser, DoclingParser
+        from vlm_doc_test.parsers import PDFParser, get_marker_parser
 
         # Create test PDF
-        output_dir = Path(__file__).parent / "test_output"
-        output_dir.mkdir(exist_ok=True)
-        pdf_path = output_dir / "test_individual.pdf"
+        pdf_path = OUTPUT_DIR / "test_individual.pdf"
 
         print(f"\nCreating test PDF: {pdf_path}")
-        doc = fitz.open()
-        page = doc.new_page()
-        page.insert_text((100, 100), "Individual Parser Test", fontsize=16)
-        page.insert_text((100, 150), "Testing each parser individually.", fontsize=11)
-        doc.save(pdf_path)
-        doc.close()
+        _build_test_pdf(pdf_path, INDIVIDUAL_PDF_SPEC)
         print("✓ PDF created")
 
         # Test PyMuPDF Parser
@@ -290,7 +343,7 @@ def test_individual_parsers():
         # Test Marker Parser (may fail if models not available)
         print("\n2. Testing Marker Parser...")
         try:
-            marker_parser = MarkerParser()
+            marker_parser = get_marker_parser()
             doc2 = marker_parser.parse(pdf_path)
             print(f"   ✓ Parsed with Marker")
             print(f"   • Content elements: {len(doc2.content)}")
@@ -301,7 +354,7 @@ def test_individual_parsers():
         # Test Docling Parser (may fail if models not available)
         print("\n3. Testing Docling Parser...")
         try:
-            docling_parser = DoclingParser()
+            docling_parser = _fast_docling_parser()
             doc3 = docling_parser.parse(pdf_path)
             print(f"   ✓ Parsed with Docling")
             print(f"   • Content elements: {len(doc3.content)}")
@@ -317,6 +370,7 @@ def test_individual_parsers():
     except Exception as e:
         print(f"\n❌ Individual parser testing failed: {e}")
         import traceback
+        sys.stdout.flush()
         traceback.print_exc()
         return False
 
@@ -338,9 +392,21 @@ def main():
         action="store_true",
         help="Run pytest suite"
     )
+    parser.add_argument(
+        "-y", "--yes", "--no-prompt",
+        dest="yes",
+        action="store_true",
+        help="Don't prompt before the full test (for unattended benchmark runs)"
+    )
 
     args = parser.parse_args()
 
+    # Block-buffer stdout: the harness prints line by line, and each
+    # line-buffered print would otherwise be its own write() syscall.
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+        atexit.register(sys.stdout.flush)
+
     print("\n" + "="*70)
     print("PHASE 3 TESTING GUIDE")
     print("="*70)
@@ -351,6 +417,7 @@ def main():
         print("  --quick   Run quick tests (PyMuPDF only, ~5 seconds)")
         print("  --full    Run full tests (all parsers, ~60 seconds first run)")
         print("  --pytest  Run pytest suite")
+        print("  --yes     Skip the confirmation prompt before --full")
         print("\nExamples:")
         print("  python test_phase3_quick.py --quick")
         print("  python test_phase3_quick.py --full")
@@ -370,12 +437,14 @@ def main():
         print("\n" + "="*70)
         print("Running pytest suite...")
         print("="*70)
-        import subprocess
-        result = subprocess.run(
-            ["pytest", "vlm_doc_test/tests/test_pipeline_comparison.py", "-v"],
-            cwd=Path(__file__).parent
-        )
-        return result.returncode
+        import importlib.util
+        import pytest
+        sys.stdout.flush()
+        test_file = Path(__file__).parent / "vlm_doc_test/tests/test_pipeline_comparison.py"
+        pytest_args = [str(test_file), "-v"]
+        if importlib.util.find_spec("xdist") is not None:
+            pytest_args += ["-n", "auto"]
+        return int(pytest.main(pytest_args))
 
     if args.quick:
         results.append(("Quick Comparison", test_quick_comparison()))
@@ -383,7 +452,7 @@ def main():
 
     if args.full:
         results.append(("Quick Comparison", test_quick_comparison()))
-        results.append(("Full Comparison", test_full_comparison()))
+        results.append(("Full Comparison", test_full_comparison(assume_yes=args.yes)))
 
     # Summary
     print("\n" + "="*70)
@@ -26,6 +26,9 @@ def test_simple_document_creation():
         )
     )
 
+    assert doc.id == "test-001"
+    assert doc.category == DocumentCategory.BLOG_POST
+
     print("✅ Successfully created SimpleDocument:")
     print(f"   ID: {doc.id}")
     print(f"   Format: {doc.format}")
@@ -42,11 +45,13 @@ def test_simple_document_creation():
         level=1
     ))
 
+    assert doc.content[0].content == "Test Heading"
     print(f"✅ Added content element: {doc.content[0].content}")
     print()
 
     # Test JSON serialization
     json_output = doc.model_dump_json(indent=2)
+    assert '"test-001"' in json_output
     print("✅ Successfully serialized to JSON:")
     print(json_output[:200] + "...")
     print()
@@ -63,6 +68,9 @@ def test_bounding_box():
         confidence=0.95
     )
 
+    assert (bbox.x, bbox.y, bbox.width, bbox.height) == (100.0, 200.0, 400.0, 300.0)
+    assert bbox.confidence == 0.95
+
     print("✅ Successfully created BoundingBox:")
     print(f"   Page: {bbox.page}")
     print(f"   Coordinates: ({bbox.x}, {bbox.y})")
@@ -77,41 +85,23 @@ def test_imports():
     print()
 
     # Core dependencies
-    try:
-        import pydantic
-        print(f"✅ pydantic {pydantic.VERSION}")
-    except ImportError as e:
-        print(f"❌ pydantic: {e}")
-
-    try:
-        import instructor
-        print("✅ instructor")
-    except ImportError as e:
-        print(f"❌ instructor: {e}")
-
-    try:
-        import pymupdf
-        print(f"✅ pymupdf {pymupdf.version}")
-    except ImportError as e:
-        print(f"❌ pymupdf: {e}")
-
-    try:
-        import pdfplumber
-        print("✅ pdfplumber")
-    except ImportError as e:
-        print(f"❌ pdfplumber: {e}")
-
-    try:
-        from deepdiff import DeepDiff
-        print("✅ deepdiff")
-    except ImportError as e:
-        print(f"❌ deepdiff: {e}")
-
-    try:
-        from thefuzz import fuzz
-        print("✅ thefuzz")
-    except ImportError as e:
-        print(f"❌ thefuzz: {e}")
+    import pydantic
+    print(f"✅ pydantic {pydantic.VERSION}")
+
+    import instructor
+    print("✅ instructor")
+
+    import pymupdf
+    print(f"✅ pymupdf {pymupdf.version}")
+
+    import pdfplumber
+    print("✅ pdfplumber")
+
+    from deepdiff import DeepDiff
+    print("✅ deepdiff")
+
+    from thefuzz import fuzz
+    print("✅ thefuzz")
 
     print()
 
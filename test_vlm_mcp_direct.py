@@ -6,11 +6,6 @@ This script demonstrates how to use GLM-4.6V for document understanding
 by analyzing screenshots and extracting structured information.
 """
 
-from pathlib import Path
-import sys
-
-sys.path.insert(0, str(Path(__file__).parent))
-
 
 def test_vlm_parsing_concept():
     """
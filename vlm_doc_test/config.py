@@ -5,6 +5,7 @@ Loads configuration from environment variables or .env file.
 """
 
 import os
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 from dotenv import load_dotenv
@@ -16,29 +17,56 @@ if env_path.exists():
 
 
 class VLMConfig:
-    """Configuration for VLM API access."""
+    """
+    Configuration for VLM API access.
+
+    The environment is snapshotted once at construction; each setting is
+    parsed lazily on first access and memoized.
+    """
 
     def __init__(self):
         """Initialize configuration from environment variables."""
-        # GLM-4.6V API configuration
-        self.glm_api_key: Optional[str] = os.getenv("GLM_API_KEY")
-        self.glm_api_base: str = os.getenv(
-            "GLM_API_BASE",
-            "https://open.bigmodel.cn/api/paas/v4"
-        )
-
-        # OpenAI-compatible fallback (for testing with other providers)
-        self.openai_api_key: Optional[str] = os.getenv("OPENAI_API_KEY")
-        self.openai_api_base: Optional[str] = os.getenv("OPENAI_API_BASE")
-
-        # Default model settings
-        self.default_model: str = os.getenv("VLM_DEFAULT_MODEL", "glm-4v-plus")
-        self.max_tokens: int = int(os.getenv("VLM_MAX_TOKENS", "8000"))
-        self.temperature: float = float(os.getenv("VLM_TEMPERATURE", "0.1"))
-
-        # Retry settings
-        self.max_retries: int = int(os.getenv("VLM_MAX_RETRIES", "3"))
-        self.retry_delay: float = float(os.getenv("VLM_RETRY_DELAY", "1.0"))
+        self._env = dict(os.environ)
+
+    # GLM-4.6V API configuration
+    @cached_property
+    def glm_api_key(self) -> Optional[str]:
+        return self._env.get("GLM_API_KEY")
+
+    @cached_property
+    def glm_api_base(self) -> str:
+        return self._env.get("GLM_API_BASE", "https://open.bigmodel.cn/api/paas/v4")
+
+    # OpenAI-compatible fallback (for testing with other providers)
+    @cached_property
+    def openai_api_key(self) -> Optional[str]:
+        return self._env.get("OPENAI_API_KEY")
+
+    @cached_property
+    def openai_api_base(self) -> Optional[str]:
+        return self._env.get("OPENAI_API_BASE")
+
+    # Default model settings
+    @cached_property
+    def default_model(self) -> str:
+        return self._env.get("VLM_DEFAULT_MODEL", "glm-4v-plus")
+
+    @cached_property
+    def max_tokens(self) -> int:
+        return int(self._env.get("VLM_MAX_TOKENS", "8000"))
+
+    @cached_property
+    def temperature(self) -> float:
+        return float(self._env.get("VLM_TEMPERATURE", "0.1"))
+
+    # Retry settings
+    @cached_property
+    def max_retries(self) -> int:
+        return int(self._env.get("VLM_MAX_RETRIES", "3"))
+
+    @cached_property
+    def retry_delay(self) -> float:
+        return float(self._env.get("VLM_RETRY_DELAY", "1.0"))
 
     def has_glm_credentials(self) -> bool:
         """Check if GLM API credentials are configured."""
@@ -52,6 +80,9 @@ class VLMConfig:
         """
         Validate configuration.
 
+        Checked on every call, so settings assigned after construction
+        are taken into account.
+
         Returns:
             Tuple of (is_valid, error_message)
         """
@@ -5,12 +5,11 @@ This module provides parsers for extracting structured data from various
 document formats (PDF, HTML, images, etc.) and converting them to our schemas.
 """
 
+import importlib
+
 from .pdf_parser import PDFParser
 from .html_parser import HTMLParser
 from .table_extractor import TableExtractor, TableSettings
-from .marker_parser import MarkerParser, MarkerConfig
-from .docling_parser import DoclingParser, DoclingConfig
-from .vlm_parser import VLMParser, VLMParserWithMCP, create_vlm_parser
 
 # Adaptive parsing (Phase 4)
 from .adaptive_config import (
@@ -26,11 +25,39 @@ from .adaptive_config import (
 from .adaptive_parser import (
     AdaptivePDFParser,
     AdaptiveResult,
+    BatchAdaptiveResults,
     ParserAttempt,
     parse_pdf_adaptive,
 )
 from .confidence_calculator import ConfidenceCalculator, calculate_confidence
 
+# Heavier parsers are imported on first attribute access (PEP 562), so
+# PyMuPDF-only callers don't pay for their dependency chains.
+_LAZY_IMPORTS = {
+    "MarkerParser": "marker_parser",
+    "MarkerConfig": "marker_parser",
+    "get_marker_parser": "marker_parser",
+    "DoclingParser": "docling_parser",
+    "DoclingConfig": "docling_parser",
+    "get_docling_parser": "docling_parser",
+    "VLMParser": "vlm_parser",
+    "VLMParserWithMCP": "vlm_parser",
+    "create_vlm_parser": "vlm_parser",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 __all__ = [
     # Existing parsers
     "PDFParser",
@@ -39,14 +66,17 @@ __all__ = [
     "TableSettings",
     "MarkerParser",
     "MarkerConfig",
+    "get_marker_parser",
     "DoclingParser",
     "DoclingConfig",
+    "get_docling_parser",
     "VLMParser",
     "VLMParserWithMCP",
     "create_vlm_parser",
     # Adaptive parsing (Phase 4)
     "AdaptivePDFParser",
     "AdaptiveResult",
+    "BatchAdaptiveResults",
     "ParserAttempt",
     "AdaptivePipelineConfig",
     "ParserType",
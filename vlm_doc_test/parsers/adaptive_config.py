@@ -5,10 +5,13 @@ Defines thresholds, pipeline order, and behavior settings for
 the adaptive parsing strategy.
 """
 
-from dataclasses import dataclass, field
-from typing import List, Optional, Dict
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from typing import Optional, Dict, Tuple
 from enum import Enum
 
+import numpy as np
+
 from ..schemas.base import DocumentCategory
 
 
@@ -20,12 +23,29 @@ class ParserType(str, Enum):
     VLM = "vlm"              # ~5s/page, vision model (expensive)
 
 
-@dataclass
+@lru_cache(maxsize=64)
+def _truncated_pipeline(
+    pipeline: Tuple[ParserType, ...],
+    max_parser: Optional[ParserType],
+) -> Tuple[ParserType, ...]:
+    """
+    Parsers in ``pipeline`` up to and including ``max_parser``.
+
+    Returns the pipeline unchanged when ``max_parser`` is None or not in it.
+    Memoized, so repeated limits return the same tuple.
+    """
+    if max_parser is None or max_parser not in pipeline:
+        return pipeline
+    return pipeline[:pipeline.index(max_parser) + 1]
+
+
+@dataclass(frozen=True, slots=True)
 class EscalationThresholds:
     """
     Thresholds that control when to escalate to more expensive parsers.
 
-    All values are confidence scores (0.0 - 1.0).
+    All values are confidence scores (0.0 - 1.0). Instances are immutable
+    so they can be shared between configs and categories.
     """
     # Overall document confidence threshold
     min_overall_confidence: float = 0.70
@@ -42,6 +62,17 @@ class EscalationThresholds:
     # If more than this ratio of pages need VLM, escalate entire document
     max_vlm_page_ratio: float = 0.30
 
+    # (overall, content, table, figure) thresholds for should_escalate_batch
+    _threshold_arr: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_threshold_arr", np.array([
+            self.min_overall_confidence,
+            self.min_content_confidence,
+            self.min_table_confidence,
+            self.min_figure_confidence,
+        ]))
+
     def should_escalate(
         self,
         overall_score: float,
@@ -68,13 +99,29 @@ class EscalationThresholds:
 
         return False
 
+    def should_escalate_batch(self, scores: np.ndarray) -> np.ndarray:
+        """
+        Vectorized should_escalate over many score rows (e.g. one per page).
+
+        Args:
+            scores: (N, 4) array of (overall, content, table, figure) scores;
+                NaN marks a missing score, which never triggers escalation
+
+        Returns:
+            (N,) bool array, True where ANY score falls below its threshold
+        """
+        scores = np.asarray(scores, dtype=np.float64).reshape(-1, 4)
+        # NaN compares False, so missing scores pass trivially
+        return (scores < self._threshold_arr).any(axis=1)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class CategoryThresholds:
     """
     Category-specific threshold overrides.
 
     Different document types have different quality requirements.
+    The category lookup table is built once, at construction.
     """
     # Academic papers need high accuracy for tables and metadata
     academic_paper: EscalationThresholds = field(default_factory=lambda: EscalationThresholds(
@@ -111,44 +158,54 @@ class CategoryThresholds:
     # Default for other categories
     default: EscalationThresholds = field(default_factory=EscalationThresholds)
 
-    def get_for_category(
-        self, category: Optional[DocumentCategory]
-    ) -> EscalationThresholds:
-        """Get thresholds for a specific document category."""
-        if category is None:
-            return self.default
+    _map: Dict[DocumentCategory, EscalationThresholds] = field(
+        init=False, repr=False, compare=False
+    )
 
-        category_map = {
+    def __post_init__(self):
+        object.__setattr__(self, "_map", {
             DocumentCategory.ACADEMIC_PAPER: self.academic_paper,
             DocumentCategory.PLOT_VISUALIZATION: self.plot_visualization,
             DocumentCategory.TECHNICAL_DOCUMENTATION: self.technical_documentation,
             DocumentCategory.BLOG_POST: self.blog_post,
             DocumentCategory.NEWS_ARTICLE: self.blog_post,  # Similar to blog
-        }
+        })
+
+    def get_for_category(
+        self, category: Optional[DocumentCategory]
+    ) -> EscalationThresholds:
+        """Get thresholds for a specific document category."""
+        return self._map.get(category, self.default)
+
 
-        return category_map.get(category, self.default)
+# Thresholds are immutable, so every config shares the same default instances
+_SHARED_DEFAULT_THRESHOLDS = EscalationThresholds()
+_SHARED_CATEGORY_THRESHOLDS = CategoryThresholds()
 
 
-@dataclass
+@dataclass(slots=True)
 class AdaptivePipelineConfig:
     """
     Configuration for the adaptive PDF parsing pipeline.
 
     Controls parser order, thresholds, and behavior settings.
     """
-    # Parser escalation order (tried in sequence until confidence is met)
-    pipeline_order: List[ParserType] = field(default_factory=lambda: [
+    # Parser escalation order (tried in sequence until confidence is met);
+    # any sequence is accepted and stored as a tuple
+    pipeline_order: Tuple[ParserType, ...] = (
         ParserType.PYMUPDF,
         ParserType.MARKER,
         ParserType.DOCLING,
         ParserType.VLM,
-    ])
+    )
 
     # Escalation thresholds
-    thresholds: EscalationThresholds = field(default_factory=EscalationThresholds)
+    thresholds: EscalationThresholds = field(default_factory=lambda: _SHARED_DEFAULT_THRESHOLDS)
 
     # Category-specific thresholds (overrides default thresholds)
-    category_thresholds: CategoryThresholds = field(default_factory=CategoryThresholds)
+    category_thresholds: CategoryThresholds = field(
+        default_factory=lambda: _SHARED_CATEGORY_THRESHOLDS
+    )
 
     # Behavior settings
     enable_per_page_decisions: bool = True
@@ -163,12 +220,68 @@ class AdaptivePipelineConfig:
     stop_on_success: bool = True
     """When True, stop escalation when confidence threshold is met."""
 
-    cache_parser_results: bool = True
-    """When True, cache intermediate parser results for debugging."""
+    retain_intermediate_documents: bool = False
+    """When True, keep every attempt's document in AdaptiveResult.attempts.
+
+    By default only the best attempt keeps its document, so superseded
+    documents can be garbage-collected during batch runs."""
+
+    confidence_eval_interval: int = 1
+    """Score every Nth page first; skip full scoring when clearly below threshold.
+
+    1 (the default) always scores every page. The sampled estimate is
+    built from page-level scores (the mean of a page's text, layout, table
+    and figure scores), not the document-level weighting the thresholds
+    are calibrated for, and has no structure score or page data, so
+    larger values can change escalation decisions."""
+
+    confidence_abstain_margin: float = 0.05
+    """Margin by which the sampled estimate must clear a threshold."""
+
+    speculative_escalation: bool = False
+    """When True, start the next parser while the current one is still running.
+
+    Escalating documents then take roughly the time of the slowest parser
+    instead of the sum. Speculative work cannot be cancelled once started:
+    when the current tier turns out good enough, the next parser (e.g.
+    Marker or Docling on the GPU) still runs to completion and its result
+    is discarded, and once a tier has been loaded every later document
+    starts it. Close the AdaptivePDFParser to stop its worker threads."""
+
+    preload_parsers: bool = False
+    """When True, import and construct every pipeline parser up front.
+
+    By default parsers are strictly lazy per type, so documents that never
+    escalate never pay the Marker/Docling import cost, and speculative
+    escalation only overlaps parsers that are already loaded."""
+
+    cache_parser_results: bool = False
+    """When True, reuse parser results for unchanged files across parse() calls.
+
+    Results are keyed on the file's path, modification time and size, so
+    edited files are re-parsed. Each hit returns a deep copy of the cached
+    document and confidence, and reports the duration of the original
+    parse. Holds up to RESULT_CACHE_SIZE documents in memory."""
 
     # VLM settings
     vlm_batch_size: int = 4
-    """Number of pages to batch for VLM analysis."""
+    """Number of pages rendered ahead of the VLM requests in hybrid extraction."""
+
+    max_concurrent_vlm_tasks: int = 4
+    """Maximum VLM requests in flight at once during hybrid extraction."""
+
+    _threshold_by_category: Optional[Dict[Optional[DocumentCategory], EscalationThresholds]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name, value):
+        if name == "pipeline_order":
+            # A tuple can be hashed by _truncated_pipeline as is
+            value = tuple(value)
+        object.__setattr__(self, name, value)
+        if name in ("thresholds", "category_thresholds"):
+            # Rebuild the category mapping on the next lookup
+            object.__setattr__(self, "_threshold_by_category", None)
 
     def get_thresholds(
         self, category: Optional[DocumentCategory] = None
@@ -177,10 +290,18 @@ class AdaptivePipelineConfig:
         Get effective thresholds for a document category.
 
         Uses category-specific thresholds if available, otherwise default.
+        The mapping is resolved on first use and again after ``thresholds``
+        or ``category_thresholds`` is reassigned.
         """
-        if category:
-            return self.category_thresholds.get_for_category(category)
-        return self.thresholds
+        threshold_by_category = self._threshold_by_category
+        if threshold_by_category is None:
+            threshold_by_category = {
+                category: self.category_thresholds.get_for_category(category)
+                for category in DocumentCategory
+            }
+            threshold_by_category[None] = self.thresholds
+            self._threshold_by_category = threshold_by_category
+        return threshold_by_category[category]
 
     def get_parser_limit(self) -> Optional[ParserType]:
         """
@@ -196,22 +317,9 @@ class AdaptivePipelineConfig:
 
         Useful for testing or cost control.
         """
-        try:
-            limit_idx = self.pipeline_order.index(max_parser) + 1
-            new_order = self.pipeline_order[:limit_idx]
-        except ValueError:
-            new_order = self.pipeline_order
-
-        return AdaptivePipelineConfig(
-            pipeline_order=new_order,
-            thresholds=self.thresholds,
-            category_thresholds=self.category_thresholds,
-            enable_per_page_decisions=self.enable_per_page_decisions,
-            enable_hybrid_extraction=self.enable_hybrid_extraction,
-            max_vlm_pages=self.max_vlm_pages,
-            stop_on_success=self.stop_on_success,
-            cache_parser_results=self.cache_parser_results,
-            vlm_batch_size=self.vlm_batch_size,
+        return replace(
+            self,
+            pipeline_order=_truncated_pipeline(self.pipeline_order, max_parser),
         )
 
 
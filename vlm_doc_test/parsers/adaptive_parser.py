@@ -5,12 +5,21 @@ Uses fast local parsers first and only escalates to expensive VLM analysis
 when extraction quality is uncertain or poor.
 """
 
+import math
+import queue
+import tempfile
+import threading
 import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Tuple, Union
 from datetime import datetime
 
+import numpy as np
+
 from ..schemas.schema_simple import (
     SimpleDocument,
     DocumentSource,
@@ -19,7 +28,7 @@ from ..schemas.schema_simple import (
     Table,
     Figure,
 )
-from ..schemas.base import DocumentFormat, DocumentCategory
+from ..schemas.base import BoundingBox, DocumentFormat, DocumentCategory
 from ..schemas.confidence import ExtractionConfidence, PageConfidence
 
 from .adaptive_config import (
@@ -27,54 +36,178 @@ from .adaptive_config import (
     ParserType,
     FULL_PIPELINE,
     EscalationThresholds,
+    _truncated_pipeline,
 )
-from .confidence_calculator import ConfidenceCalculator, calculate_confidence
+from .confidence_calculator import ConfidenceCalculator
+
+
+# Maximum parser results kept per AdaptivePDFParser
+RESULT_CACHE_SIZE = 128
 
+# Resolution for pages rendered for VLM analysis
+VLM_RENDER_DPI = 150
 
-@dataclass
+# Normal quantile for the 95% interval on sampled confidence estimates
+SAMPLED_CONFIDENCE_Z = 1.96
+
+
+@dataclass(slots=True)
 class ParserAttempt:
     """Record of a single parser attempt."""
     parser_type: ParserType
     document: Optional[SimpleDocument]
     confidence: Optional[ExtractionConfidence]
-    duration_seconds: float
+    duration_ns: int
     success: bool
     error: Optional[str] = None
+    confidence_sampled: bool = False
+    """True when confidence is a page-sampled estimate (clearly below threshold)."""
+
+    @property
+    def duration_seconds(self) -> float:
+        """Attempt duration in seconds."""
+        return self.duration_ns / 1e9
 
     def summary(self) -> Dict[str, Any]:
         """Get summary dict for reporting."""
         return {
             "parser": self.parser_type.value,
             "success": self.success,
-            "duration_seconds": round(self.duration_seconds, 3),
+            "duration_seconds": round(self.duration_ns / 1e9, 3),
             "confidence_score": round(self.confidence.overall_score, 3) if self.confidence else None,
             "error": self.error,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class AdaptiveResult:
     """Result from adaptive parsing."""
     document: SimpleDocument
     final_parser: ParserType
     confidence: ExtractionConfidence
     attempts: List[ParserAttempt] = field(default_factory=list)
-    total_duration_seconds: float = 0.0
+    total_duration_ns: int = 0
     used_hybrid: bool = False
     vlm_pages: List[int] = field(default_factory=list)
 
+    @property
+    def total_duration_seconds(self) -> float:
+        """Total parsing duration in seconds."""
+        return self.total_duration_ns / 1e9
+
     def summary(self) -> Dict[str, Any]:
         """Get summary dict for reporting."""
         return {
             "final_parser": self.final_parser.value,
             "confidence": self.confidence.summary(),
-            "total_duration_seconds": round(self.total_duration_seconds, 3),
+            "total_duration_seconds": round(self.total_duration_ns / 1e9, 3),
             "used_hybrid": self.used_hybrid,
             "vlm_pages": self.vlm_pages,
             "attempts": [a.summary() for a in self.attempts],
         }
 
 
+class BatchAdaptiveResults:
+    """
+    Column-wise (structure-of-arrays) store of parser attempts.
+
+    Aggregates over thousands of attempts (e.g. evaluation runs with
+    ``parse_pdf_adaptive``) become single NumPy reductions instead of
+    attribute lookups on each ParserAttempt.
+
+    Example usage:
+        batch = BatchAdaptiveResults()
+        for pdf in pdfs:
+            batch.extend(parser.parse(pdf))
+        print(batch.summary())
+    """
+
+    PARSER_TYPES = tuple(ParserType)
+    """Parser types in code order; ``parser_types[i]`` indexes this tuple."""
+
+    def __init__(self, capacity: int = 64):
+        """
+        Initialize empty storage.
+
+        Args:
+            capacity: Initial number of attempts to allocate for
+        """
+        capacity = max(1, capacity)
+        self._size = 0
+        self._parser_types = np.empty(capacity, dtype=np.int8)
+        self._durations = np.empty(capacity, dtype=np.float32)
+        self._overall_scores = np.empty(capacity, dtype=np.float32)
+        self._success = np.empty(capacity, dtype=np.bool_)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, attempt: ParserAttempt):
+        """Add one attempt, doubling storage when full."""
+        if self._size == len(self._durations):
+            self._grow(2 * len(self._durations))
+
+        i = self._size
+        self._parser_types[i] = self.PARSER_TYPES.index(attempt.parser_type)
+        self._durations[i] = attempt.duration_seconds
+        self._overall_scores[i] = (
+            attempt.confidence.overall_score if attempt.confidence else np.nan
+        )
+        self._success[i] = attempt.success
+        self._size += 1
+
+    def extend(self, result: AdaptiveResult):
+        """Add every attempt of an adaptive parsing result."""
+        for attempt in result.attempts:
+            self.append(attempt)
+
+    def _grow(self, capacity: int):
+        for name in ("_parser_types", "_durations", "_overall_scores", "_success"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+
+    @property
+    def parser_types(self) -> np.ndarray:
+        """int8 parser codes (see PARSER_TYPES)."""
+        return self._parser_types[:self._size]
+
+    @property
+    def durations(self) -> np.ndarray:
+        """float32 attempt durations in seconds."""
+        return self._durations[:self._size]
+
+    @property
+    def overall_scores(self) -> np.ndarray:
+        """float32 overall confidence scores (NaN for failed attempts)."""
+        return self._overall_scores[:self._size]
+
+    @property
+    def success(self) -> np.ndarray:
+        """bool success flags."""
+        return self._success[:self._size]
+
+    def summary(self) -> Dict[str, Any]:
+        """Get aggregate statistics for reporting."""
+        if self._size == 0:
+            return {"attempts": 0}
+
+        scores = self.overall_scores[~np.isnan(self.overall_scores)]
+        counts = np.bincount(self.parser_types, minlength=len(self.PARSER_TYPES))
+        return {
+            "attempts": self._size,
+            "total_duration_seconds": round(float(self.durations.sum(dtype=np.float64)), 3),
+            "success_rate": round(float(self.success.mean()), 3),
+            "mean_confidence": round(float(scores.mean()), 3) if scores.size else None,
+            "attempts_per_parser": {
+                parser_type.value: int(count)
+                for parser_type, count in zip(self.PARSER_TYPES, counts)
+                if count
+            },
+        }
+
+
 class AdaptivePDFParser:
     """
     Adaptive PDF parser with intelligent escalation.
@@ -104,12 +237,58 @@ class AdaptivePDFParser:
         self.config = config or FULL_PIPELINE
         self.confidence_calculator = ConfidenceCalculator()
         self._parsers: Dict[ParserType, Any] = {}
+        self._parsers_lock = threading.Lock()
+        # Each stage handles one document at a time: parsers such as PyMuPDF
+        # are not thread-safe, and different stages still run concurrently
+        self._stage_locks: Dict[ParserType, threading.Lock] = {
+            parser_type: threading.Lock() for parser_type in ParserType
+        }
+        self._result_cache: "OrderedDict[Tuple, Tuple[SimpleDocument, ExtractionConfidence, bool, int]]" = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        if self.config.speculative_escalation and len(self.config.pipeline_order) > 1:
+            self._executor = ThreadPoolExecutor(
+                max_workers=len(self.config.pipeline_order),
+                thread_name_prefix="adaptive-parser",
+            )
+        if self.config.preload_parsers:
+            for parser_type in self.config.pipeline_order:
+                try:
+                    self._get_parser(parser_type)
+                except Exception:
+                    # Unavailable parsers fail again (and are recorded) on use
+                    pass
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+    def close(self):
+        """
+        Shut down the speculative escalation threads and confidence workers.
+
+        Waits for speculative attempts that already started (they cannot be
+        cancelled). The parser stays usable afterwards, without speculation.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        self.confidence_calculator.close()
 
     def _get_parser(self, parser_type: ParserType):
-        """Lazy-load parser instance."""
-        if parser_type not in self._parsers:
-            self._parsers[parser_type] = self._create_parser(parser_type)
-        return self._parsers[parser_type]
+        """Lazy-load parser instance (at most once, even across threads)."""
+        parser = self._parsers.get(parser_type)
+        if parser is None:
+            with self._parsers_lock:
+                parser = self._parsers.get(parser_type)
+                if parser is None:
+                    parser = self._create_parser(parser_type)
+                    self._parsers[parser_type] = parser
+        return parser
 
     def _create_parser(self, parser_type: ParserType):
         """Create parser instance by type."""
@@ -142,6 +321,10 @@ class AdaptivePDFParser:
         """
         Parse PDF with adaptive escalation.
 
+        With ``speculative_escalation`` enabled, each tier's confidence
+        scoring overlaps with the next tier's parsing, so scoring only adds
+        to wall time for the last parser tried.
+
         Args:
             pdf_path: Path to PDF file
             category: Document category hint for threshold selection
@@ -155,57 +338,88 @@ class AdaptivePDFParser:
         if not pdf_path.exists():
             raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         attempts: List[ParserAttempt] = []
 
         # Force VLM mode
         if force_vlm:
-            return self._parse_with_vlm(pdf_path, category, start_time)
+            return self._parse_with_vlm(pdf_path, category, start_ns)
 
         # Get effective thresholds for this category
         thresholds = self.config.get_thresholds(category)
 
-        # Determine effective pipeline
-        pipeline = self.config.pipeline_order
-        if max_escalation_level:
-            try:
-                limit_idx = pipeline.index(max_escalation_level) + 1
-                pipeline = pipeline[:limit_idx]
-            except ValueError:
-                pass  # Keep original pipeline if level not found
+        # Determine effective pipeline (whole pipeline if level not found)
+        pipeline = _truncated_pipeline(self.config.pipeline_order, max_escalation_level)
 
         # Try parsers in order
         best_result: Optional[ParserAttempt] = None
         best_document: Optional[SimpleDocument] = None
         best_confidence: Optional[ExtractionConfidence] = None
-
-        for parser_type in pipeline:
-            attempt = self._try_parser(pdf_path, parser_type, category)
+        best_score = -math.inf
+
+        # With speculative escalation the next parser is already running
+        # while the current attempt is parsed and scored
+        executor = self._executor
+        next_attempt: Optional[Future] = None
+
+        for idx, parser_type in enumerate(pipeline):
+            current_attempt = next_attempt
+            next_attempt = None
+            # Only speculate on parsers that are already loaded, so a cold
+            # Marker/Docling import is paid only once escalation is decided
+            if (
+                executor is not None
+                and idx + 1 < len(pipeline)
+                and pipeline[idx + 1] in self._parsers
+            ):
+                next_attempt = executor.submit(
+                    self._try_parser, pdf_path, pipeline[idx + 1], category
+                )
+
+            if current_attempt is not None:
+                attempt = current_attempt.result()
+            else:
+                attempt = self._try_parser(pdf_path, parser_type, category)
             attempts.append(attempt)
 
             if not attempt.success:
                 continue
 
-            # Update best result if this is better
-            if best_confidence is None or (
-                attempt.confidence and
-                attempt.confidence.overall_score > best_confidence.overall_score
-            ):
+            # Update best result if this is better; unless configured to
+            # retain them, superseded documents are released right away
+            confidence = attempt.confidence
+            score = confidence.overall_score
+            if score > best_score:
+                if best_result is not None and not self.config.retain_intermediate_documents:
+                    best_result.document = None
+                best_score = score
                 best_result = attempt
                 best_document = attempt.document
-                best_confidence = attempt.confidence
+                best_confidence = confidence
+            elif not self.config.retain_intermediate_documents:
+                attempt.document = None
 
             # Check if we meet threshold
-            if attempt.confidence and not thresholds.should_escalate(
-                overall_score=attempt.confidence.overall_score,
-                content_score=attempt.confidence.content_score,
-                table_score=attempt.confidence.table_score,
-                figure_score=attempt.confidence.figure_score,
+            if not thresholds.should_escalate(
+                overall_score=score,
+                content_score=confidence.content_score,
+                table_score=confidence.table_score,
+                figure_score=confidence.figure_score,
             ):
                 # Confidence is good enough, stop here
                 if self.config.stop_on_success:
                     break
 
+        if next_attempt is not None:
+            # Escalation was not needed; discard the speculative attempt
+            # (cancel() only helps if it has not started yet, otherwise it
+            # runs to completion in the background)
+            next_attempt.cancel()
+
+        if best_result is not None and best_result.confidence_sampled:
+            # The estimate was only good enough to decide on escalation
+            best_confidence = self.confidence_calculator.calculate(best_document)
+
         # Check if we need hybrid extraction
         used_hybrid = False
         vlm_pages = []
@@ -227,11 +441,12 @@ class AdaptivePDFParser:
 
             if hybrid_result:
                 best_document = hybrid_result
-                best_confidence = calculate_confidence(hybrid_result)
+                # Unchanged pages are reused from the calculator's page cache
+                best_confidence = self.confidence_calculator.calculate(hybrid_result)
                 used_hybrid = True
                 vlm_pages = best_confidence.get_vlm_pages() if best_confidence else []
 
-        total_duration = time.time() - start_time
+        total_duration_ns = time.perf_counter_ns() - start_ns
 
         # Ensure we have a result
         if best_document is None or best_confidence is None:
@@ -242,11 +457,61 @@ class AdaptivePDFParser:
             final_parser=best_result.parser_type if best_result else pipeline[-1],
             confidence=best_confidence,
             attempts=attempts,
-            total_duration_seconds=total_duration,
+            total_duration_ns=total_duration_ns,
             used_hybrid=used_hybrid,
             vlm_pages=vlm_pages,
         )
 
+    def parse_many(
+        self,
+        pdf_paths: Iterable[Union[str, Path]],
+        category: Optional[DocumentCategory] = None,
+        max_in_flight: Optional[int] = None,
+    ) -> Iterator[AdaptiveResult]:
+        """
+        Parse several PDFs with their escalation stages overlapped.
+
+        Each parser stage handles one document at a time, but stages run
+        concurrently, so the PyMuPDF pass of one document runs while another
+        is in Marker or Docling; batch throughput is then bounded by the
+        slowest stage rather than the sum of all stages.
+
+        Args:
+            pdf_paths: PDFs to parse (consumed lazily)
+            category: Document category hint applied to every document
+            max_in_flight: Documents parsed at once. Defaults to one per
+                pipeline stage.
+
+        Yields:
+            AdaptiveResult per PDF, in input order
+
+        Raises:
+            The exception parse() raised for a document, when it is reached
+        """
+        max_in_flight = max(1, max_in_flight or len(self.config.pipeline_order))
+        pending: "deque[Future]" = deque()
+        paths = iter(pdf_paths)
+
+        pool = ThreadPoolExecutor(
+            max_workers=max_in_flight, thread_name_prefix="adaptive-batch"
+        )
+        try:
+            for pdf_path in paths:
+                pending.append(pool.submit(self.parse, pdf_path, category))
+                if len(pending) == max_in_flight:
+                    break
+
+            # Results are yielded in input order; later documents keep
+            # parsing while an earlier one is being waited on
+            while pending:
+                result = pending.popleft().result()
+                next_path = next(paths, None)
+                if next_path is not None:
+                    pending.append(pool.submit(self.parse, next_path, category))
+                yield result
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
     def _try_parser(
         self,
         pdf_path: Path,
@@ -258,7 +523,31 @@ class AdaptivePDFParser:
 
         Returns ParserAttempt with results or error information.
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
+
+        cache_key = None
+        if self.config.cache_parser_results:
+            stat = pdf_path.stat()
+            cache_key = (
+                str(pdf_path.resolve()), stat.st_mtime_ns, stat.st_size,
+                parser_type, category,
+            )
+            with self._result_cache_lock:
+                cached = self._result_cache.get(cache_key)
+                if cached is not None:
+                    self._result_cache.move_to_end(cache_key)
+            if cached is not None:
+                # Copies, so callers cannot change each other's results; the
+                # duration is the original parse's
+                document, confidence, sampled, duration_ns = cached
+                return ParserAttempt(
+                    parser_type=parser_type,
+                    document=document.model_copy(deep=True),
+                    confidence=confidence.model_copy(deep=True),
+                    duration_ns=duration_ns,
+                    success=True,
+                    confidence_sampled=sampled,
+                )
 
         try:
             parser = self._get_parser(parser_type)
@@ -269,37 +558,94 @@ class AdaptivePDFParser:
                 # For now, skip VLM in standard parsing (use hybrid mode instead)
                 raise NotImplementedError("VLM parser requires rendered images")
 
-            document = parser.parse(pdf_path, category=category)
+            with self._stage_locks[parser_type]:
+                document = parser.parse(pdf_path, category=category)
 
             # Calculate confidence
-            confidence = self.confidence_calculator.calculate(document)
-
-            duration = time.time() - start_time
+            confidence, sampled = self._calculate_confidence(document, category)
+            duration_ns = time.perf_counter_ns() - start_ns
+
+            if cache_key is not None:
+                # The cache keeps its own copies of what this caller receives
+                entry = (
+                    document.model_copy(deep=True), confidence.model_copy(deep=True),
+                    sampled, duration_ns,
+                )
+                with self._result_cache_lock:
+                    self._result_cache[cache_key] = entry
+                    if len(self._result_cache) > RESULT_CACHE_SIZE:
+                        self._result_cache.popitem(last=False)
 
             return ParserAttempt(
                 parser_type=parser_type,
                 document=document,
                 confidence=confidence,
-                duration_seconds=duration,
+                duration_ns=duration_ns,
                 success=True,
+                confidence_sampled=sampled,
             )
 
         except Exception as e:
-            duration = time.time() - start_time
             return ParserAttempt(
                 parser_type=parser_type,
                 document=None,
                 confidence=None,
-                duration_seconds=duration,
+                duration_ns=time.perf_counter_ns() - start_ns,
                 success=False,
                 error=str(e),
             )
 
+    def _calculate_confidence(
+        self,
+        document: SimpleDocument,
+        category: Optional[DocumentCategory],
+    ) -> Tuple[ExtractionConfidence, bool]:
+        """
+        Score a document, sampling pages first on long documents.
+
+        With ``confidence_eval_interval`` above 1, every such page is scored
+        first; if the 95% upper bound of any sampled page-level score (plus
+        the abstain margin) is below its document-level threshold, the
+        sampled means are returned without full scoring. The estimate has
+        no structure score or page confidences.
+
+        Returns:
+            (confidence, sampled) where sampled marks an estimate
+        """
+        stride = self.config.confidence_eval_interval
+        if stride > 1:
+            stats = self.confidence_calculator.calculate_sampled(document, stride=stride)
+            thresholds = self.config.get_thresholds(category)
+            limits = {
+                "overall": thresholds.min_overall_confidence,
+                "content": thresholds.min_content_confidence,
+                "table": thresholds.min_table_confidence,
+                "figure": thresholds.min_figure_confidence,
+            }
+            margin = self.config.confidence_abstain_margin
+
+            for name, (mean, std, n) in stats.items():
+                upper = mean + SAMPLED_CONFIDENCE_Z * std / math.sqrt(n)
+                if upper + margin < limits[name]:
+                    sampled_pages = stats["overall"][2]
+                    return ExtractionConfidence(
+                        overall_score=stats["overall"][0],
+                        content_score=stats["content"][0],
+                        table_score=stats["table"][0] if "table" in stats else None,
+                        figure_score=stats["figure"][0] if "figure" in stats else None,
+                        issues=[
+                            f"Estimated from {sampled_pages} sampled pages: "
+                            f"{name} score clearly below threshold"
+                        ],
+                    ), True
+
+        return self.confidence_calculator.calculate(document), False
+
     def _parse_with_vlm(
         self,
         pdf_path: Path,
         category: Optional[DocumentCategory],
-        start_time: float,
+        start_ns: int,
     ) -> AdaptiveResult:
         """
         Force VLM parsing for entire document.
@@ -308,9 +654,7 @@ class AdaptivePDFParser:
         """
         # First, try PyMuPDF to get page count and basic structure
         try:
-            from .pdf_parser import PDFParser
-            pymupdf_parser = PDFParser()
-            page_count = pymupdf_parser.get_page_count(str(pdf_path))
+            page_count = self._get_parser(ParserType.PYMUPDF).get_page_count(str(pdf_path))
         except Exception:
             page_count = 1
 
@@ -358,15 +702,181 @@ class AdaptivePDFParser:
             vlm_pages = sorted(vlm_pages, key=lambda p: page_scores.get(p, 1.0))
             vlm_pages = vlm_pages[:self.config.max_vlm_pages]
 
-        # Note: Actual VLM integration would require:
-        # 1. Render pages to images using PyMuPDF
-        # 2. Send images to VLM (via MCP or direct API)
-        # 3. Parse VLM response and merge with base document
+        try:
+            vlm_documents = self._analyze_pages_with_vlm(pdf_path, vlm_pages, category)
+        except Exception:
+            # VLM unavailable (e.g. no MCP environment) or a page failed
+            return None
+
+        vlm_contents: Dict[int, List[ContentElement]] = {}
+        vlm_tables: Dict[int, List[Table]] = {}
+        vlm_figures: Dict[int, List[Figure]] = {}
+        for page_num, vlm_document in vlm_documents.items():
+            prefix = f"vlm_p{page_num}_"
+            vlm_contents[page_num] = [
+                e.model_copy(update={"id": prefix + e.id}) for e in vlm_document.content
+            ]
+            vlm_tables[page_num] = [
+                t.model_copy(update={"id": prefix + t.id}) for t in vlm_document.tables
+            ]
+            vlm_figures[page_num] = [
+                f.model_copy(update={"id": prefix + f.id}) for f in vlm_document.figures
+            ]
+
+        return self._merge_documents(base_document, vlm_contents, vlm_tables, vlm_figures)
+
+    def _analyze_pages_with_vlm(
+        self,
+        pdf_path: Path,
+        page_numbers: List[int],
+        category: Optional[DocumentCategory],
+    ) -> Dict[int, SimpleDocument]:
+        """
+        Render pages and run them through the VLM concurrently.
+
+        A background thread renders pages (at most ``vlm_batch_size`` ahead of
+        the VLM requests) and each page is sent to the VLM as soon as its
+        image exists; at most ``max_concurrent_vlm_tasks`` VLM requests are
+        in flight at once. The first failed request stops the rendering.
+
+        Args:
+            pdf_path: Path to PDF
+            page_numbers: 1-based pages to analyze
+            category: Document category hint for the VLM prompt
+
+        Returns:
+            VLM document per page number, in page order, with every element
+            placed on that page
+
+        Raises:
+            The first exception raised by rendering or a VLM request
+        """
+        futures: Dict[int, Future] = {}
+        page_sizes: Dict[int, Tuple[float, float]] = {}
+        failed: List[Future] = []
+
+        with tempfile.TemporaryDirectory(prefix="adaptive_vlm_") as image_dir:
+            # Start rendering before the VLM parser is even loaded
+            rendered: "queue.Queue" = queue.Queue(maxsize=max(1, self.config.vlm_batch_size))
+            stop = threading.Event()
+
+            def on_vlm_done(future: Future):
+                # Stop rendering (and submitting) at the first failed request
+                if not future.cancelled() and future.exception() is not None:
+                    failed.append(future)
+                    stop.set()
+
+            renderer = threading.Thread(
+                target=self._render_pages,
+                args=(pdf_path, page_numbers, Path(image_dir), rendered, stop),
+                name="adaptive-render",
+                daemon=True,
+            )
+            renderer.start()
+
+            pool = ThreadPoolExecutor(
+                max_workers=max(1, self.config.max_concurrent_vlm_tasks),
+                thread_name_prefix="adaptive-vlm",
+            )
+            try:
+                vlm_parser = self._get_parser(ParserType.VLM)
+                while not stop.is_set():
+                    item = rendered.get()
+                    if item is None:
+                        break
+                    if isinstance(item, BaseException):
+                        raise item
+                    page_num, image_path, page_size = item
+                    page_sizes[page_num] = page_size
+                    futures[page_num] = pool.submit(vlm_parser.parse, image_path, category=category)
+                    futures[page_num].add_done_callback(on_vlm_done)
+
+                if failed:
+                    raise failed[0].exception()
+                return {
+                    page_num: self._place_on_page(
+                        futures[page_num].result(), page_num, page_sizes[page_num]
+                    )
+                    for page_num in sorted(futures)
+                }
+            finally:
+                # On failure, drop requests that have not started yet and
+                # unblock the renderer before its images are deleted
+                stop.set()
+                while renderer.is_alive():
+                    try:
+                        rendered.get(timeout=0.05)
+                    except queue.Empty:
+                        pass
+                pool.shutdown(wait=True, cancel_futures=True)
+
+    def _render_pages(
+        self,
+        pdf_path: Path,
+        page_numbers: List[int],
+        image_dir: Path,
+        rendered: "queue.Queue",
+        stop: threading.Event,
+    ):
+        """
+        Render pages to PNG files, reporting each as
+        ``(page_num, path, (width, height))`` with the page size in points.
+
+        Puts None once every page is rendered or ``stop`` is set, or the
+        exception on failure.
+        """
+        import pymupdf as fitz
+
+        # Rendering shares PyMuPDF with the PYMUPDF stage
+        stage_lock = self._stage_locks[ParserType.PYMUPDF]
+        try:
+            with stage_lock:
+                pdf = fitz.open(pdf_path)
+            try:
+                for page_num in page_numbers:
+                    if stop.is_set():
+                        break
+                    image_path = image_dir / f"page_{page_num}.png"
+                    with stage_lock:
+                        page = pdf[page_num - 1]
+                        page.get_pixmap(dpi=VLM_RENDER_DPI).save(str(image_path))
+                        page_size = (page.rect.width, page.rect.height)
+                    rendered.put((page_num, image_path, page_size))
+            finally:
+                with stage_lock:
+                    pdf.close()
+        except Exception as e:
+            rendered.put(e)
+            return
+        rendered.put(None)
 
-        # For now, return base document with a note that VLM would be used
-        # Full implementation requires MCP tools or direct VLM API access
+    @staticmethod
+    def _place_on_page(
+        document: SimpleDocument, page_num: int, page_size: Tuple[float, float]
+    ) -> SimpleDocument:
+        """
+        Give every element of a VLM page document a box on that page.
 
-        return base_document
+        The VLM reports no positions, so the elements of each kind are
+        stacked top to bottom in reading order, in disjoint full-width bands
+        that never count as overlapping blocks.
+        """
+        width, height = page_size
+
+        def placed(items):
+            band = height / max(len(items), 1)
+            return [
+                item.model_copy(update={"bbox": BoundingBox(
+                    page=page_num, x=0.0, y=i * band, width=width, height=band / 2,
+                )})
+                for i, item in enumerate(items)
+            ]
+
+        return document.model_copy(update={
+            "content": placed(document.content),
+            "tables": placed(document.tables),
+            "figures": placed(document.figures),
+        })
 
     def _merge_documents(
         self,
@@ -381,33 +891,20 @@ class AdaptivePDFParser:
         Replaces content for specific pages while keeping good pages from base.
         """
         # Get page numbers to replace
-        vlm_page_numbers = set(vlm_contents.keys())
-
-        # Filter base content to keep only good pages
-        merged_content = [
-            elem for elem in base_document.content
-            if elem.bbox is None or elem.bbox.page not in vlm_page_numbers
-        ]
-
-        # Add VLM content
-        for page_num in sorted(vlm_contents.keys()):
-            merged_content.extend(vlm_contents[page_num])
-
-        # Merge tables
-        merged_tables = [
-            table for table in base_document.tables
-            if table.bbox is None or table.bbox.page not in vlm_page_numbers
-        ]
-        for page_num in sorted(vlm_tables.keys()):
-            merged_tables.extend(vlm_tables[page_num])
-
-        # Merge figures
-        merged_figures = [
-            figure for figure in base_document.figures
-            if figure.bbox is None or figure.bbox.page not in vlm_page_numbers
-        ]
-        for page_num in sorted(vlm_figures.keys()):
-            merged_figures.extend(vlm_figures[page_num])
+        vlm_page_numbers = set(vlm_contents)
+        sorted_pages = sorted(vlm_page_numbers | vlm_tables.keys() | vlm_figures.keys())
+
+        def merge(base_items, vlm_items):
+            # Keep base items from good pages (or without a page), then
+            # append VLM items in page order
+            return [
+                item for item in base_items
+                if getattr(item.bbox, "page", None) not in vlm_page_numbers
+            ] + list(chain.from_iterable(vlm_items.get(p, ()) for p in sorted_pages))
+
+        merged_content = merge(base_document.content, vlm_contents)
+        merged_tables = merge(base_document.tables, vlm_tables)
+        merged_figures = merge(base_document.figures, vlm_figures)
 
         # Create merged document
         return SimpleDocument(
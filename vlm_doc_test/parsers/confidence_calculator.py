@@ -5,10 +5,20 @@ Computes confidence scores based on heuristics to determine whether
 a fast parser's output is reliable or if escalation to VLM is needed.
 """
 
+import hashlib
+import math
+import multiprocessing
 import re
 import statistics
-from typing import List, Optional, Tuple
-from collections import Counter
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain, repeat
+from typing import Dict, List, Optional, Tuple
+from collections import Counter, OrderedDict, defaultdict
+from dataclasses import dataclass, fields
+
+import numpy as np
 
 from ..schemas.schema_simple import SimpleDocument, ContentElement, Table, Figure
 from ..schemas.confidence import (
@@ -22,6 +32,373 @@ from ..schemas.confidence import (
 )
 
 
+# Maximum per-page confidences kept per calculator
+PAGE_CACHE_SIZE = 4096
+
+# Uncached pages per calculate() call below which pages are scored inline,
+# since shipping pages to worker processes costs about as much as scoring
+PARALLEL_PAGE_MIN = 16
+
+# ASCII bytes for which str.isalnum() is true
+_ASCII_ALNUM_MASK = np.array([chr(c).isalnum() for c in range(128)])
+
+# Maps every ASCII byte to its class: b" " for str.isspace() whitespace,
+# b"a" for str.isalnum() characters and b"p" for anything else
+_ASCII_CLASS = bytes(
+    ord(" ") if chr(c).isspace() else ord("a") if chr(c).isalnum() else ord("p")
+    for c in range(128)
+) + b"p" * 128
+
+# str.isspace() lookup by code point; U+3000 is the highest whitespace
+# code point, so larger code points are clipped to a False entry
+_SPACE_MASK = np.array([chr(c).isspace() for c in range(0x3002)])
+_SPACE_MASK[-1] = False
+
+# Runs of characters for which str.isalnum() is false
+_NON_ALNUM_RE = re.compile(r"[\W_]+")
+
+
+def _count_char_classes(text: str, replacement_chars) -> Tuple[int, int, int, int, int]:
+    """
+    Count alphanumeric, whitespace and replacement characters, words, and
+    broken words (single-character words that are not alphanumeric).
+
+    Uses C-level bytes/str operations (and NumPy lookups for non-ASCII
+    text) instead of per-character or per-word Python loops. Counts match
+    str.isalnum()/str.isspace() and the words of text.split() exactly.
+    """
+    if text.isascii():
+        # One translate reduces the text to its character classes; a word
+        # starts wherever a non-space follows a space (or the start)
+        classes = text.encode("ascii").translate(_ASCII_CLASS)
+        alphanumeric = classes.count(b"a")
+        whitespace = classes.count(b" ")
+        words = (
+            classes.count(b" a") + classes.count(b" p")
+            + (bool(classes) and not classes.startswith(b" "))
+        )
+        # Doubling the spaces keeps adjacent " p " matches from overlapping
+        broken = (b" " + classes.replace(b" ", b"  ") + b" ").count(b" p ")
+    else:
+        codes = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+        is_space = _SPACE_MASK[np.minimum(codes, len(_SPACE_MASK) - 1)]
+        whitespace = int(np.count_nonzero(is_space))
+        after_space = np.concatenate(([True], is_space[:-1]))
+        before_space = np.concatenate((is_space[1:], [True]))
+        word_start = ~is_space & after_space
+        words = int(np.count_nonzero(word_start))
+
+        # Classify the ASCII code points with a table lookup and leave only
+        # the non-ASCII remainder to [^\W_], which matches exactly the
+        # str.isalnum() characters
+        is_ascii = codes < 128
+        rest = codes[~is_ascii].tobytes().decode("utf-32-le", "surrogatepass")
+        alphanumeric = (
+            int(np.count_nonzero(_ASCII_ALNUM_MASK[codes[is_ascii]]))
+            + len(_NON_ALNUM_RE.sub("", rest))
+        )
+        singles = codes[word_start & before_space].tobytes().decode("utf-32-le", "surrogatepass")
+        broken = len(singles) - len(_NON_ALNUM_RE.sub("", singles))
+    replacement = sum(text.count(c) for c in replacement_chars)
+    return alphanumeric, whitespace, replacement, words, broken
+
+# Boxes per page up to which overlap detection compares pairs in plain
+# Python (cheaper than building arrays), and above which it sweeps instead of
+# comparing all pairs at once
+OVERLAP_PAIRWISE_LIMIT = 24
+OVERLAP_BROADCAST_LIMIT = 256
+# Boxes per page from which the sweep is JIT-compiled when numba is available
+# (below, importing and compiling it would rarely pay off)
+OVERLAP_JIT_MIN = 200
+
+
+def _overlap_sweep(x0, y0, x1, y1) -> bool:
+    """Check boxes sorted by left edge for overlap, stopping at the first."""
+    n = len(x0)
+    for i in range(n):
+        for j in range(i + 1, n):
+            if x0[j] > x1[i]:
+                break
+            if y0[j] <= y1[i] and y0[i] <= y1[j]:
+                return True
+    return False
+
+
+@lru_cache(maxsize=1)
+def _overlap_sweep_kernel():
+    """JIT-compiled _overlap_sweep, or None without numba."""
+    try:
+        # Imported on first use; numba is slow to import
+        from numba import njit
+    except ImportError:  # numba is optional; fall back to NumPy
+        return None
+    return njit(cache=True)(_overlap_sweep)
+
+
+def _page_has_overlap(rects: np.ndarray) -> bool:
+    """Check whether any two boxes (x0, y0, x1, y1) overlap or touch."""
+    if len(rects) <= OVERLAP_PAIRWISE_LIMIT:
+        # Compare plain float tuples; cheaper than NumPy calls on few boxes
+        pairs = rects.tolist()
+        for i, (ax0, ay0, ax1, ay1) in enumerate(pairs):
+            for bx0, by0, bx1, by1 in pairs[i + 1:]:
+                if ax0 <= bx1 and bx0 <= ax1 and ay0 <= by1 and by0 <= ay1:
+                    return True
+        return False
+
+    x0, y0, x1, y1 = rects.T
+    kernel = _overlap_sweep_kernel() if len(rects) >= OVERLAP_JIT_MIN else None
+
+    if kernel is None and len(rects) <= OVERLAP_BROADCAST_LIMIT:
+        overlap = (
+            (x0[:, None] <= x1[None, :]) & (x0[None, :] <= x1[:, None])
+            & (y0[:, None] <= y1[None, :]) & (y0[None, :] <= y1[:, None])
+        )
+        np.fill_diagonal(overlap, False)
+        return bool(overlap.any())
+
+    # Sweep: after sorting by left edge, box i can only overlap the boxes
+    # that start before its right edge
+    order = np.argsort(x0, kind="stable")
+    x0, x1, y0, y1 = x0[order], x1[order], y0[order], y1[order]
+    if kernel is not None:
+        return bool(kernel(x0, y0, x1, y1))
+    ends = np.searchsorted(x0, x1, side="right")
+    for i in range(len(x0) - 1):
+        j = ends[i]
+        if j > i + 1 and np.any(
+            (y0[i + 1:j] <= y1[i]) & (y0[i] <= y1[i + 1:j])
+        ):
+            return True
+    return False
+
+
+# Multi-column detection: histogram of block x positions across the page
+# width (assumed 600 points), the blocks each column peak needs, and the
+# bins between the outermost peaks (a quarter of the page width, so an
+# indented list or code block next to the body text is not a column)
+COLUMN_PAGE_WIDTH = 600
+COLUMN_BINS = 32
+COLUMN_MIN_BLOCKS = 3
+COLUMN_MIN_GAP_BINS = 8
+
+
+@dataclass(frozen=True, slots=True)
+class _LayoutColumns:
+    """Struct-of-arrays view of content elements' boxes and types."""
+    page: np.ndarray  # 1 for elements without a bbox
+    x: np.ndarray  # NaN for elements without a bbox, as are y/width/height
+    y: np.ndarray
+    width: np.ndarray
+    height: np.ndarray
+    is_heading: np.ndarray
+
+    def take(self, order: np.ndarray) -> "_LayoutColumns":
+        return _LayoutColumns(*(getattr(self, f.name)[order] for f in fields(self)))
+
+
+_NO_BOX = (1.0, math.nan, math.nan, math.nan, math.nan)
+
+
+def _layout_columns(content_elements: List[ContentElement]) -> _LayoutColumns:
+    """Read every element's bbox and type once into NumPy columns."""
+    n = len(content_elements)
+    boxes = np.array(
+        [
+            (b.page, b.x, b.y, b.width, b.height) if (b := elem.bbox) else _NO_BOX
+            for elem in content_elements
+        ],
+        dtype=np.float64,
+    ).reshape(n, 5)
+    return _LayoutColumns(
+        page=boxes[:, 0].astype(np.int64),
+        x=boxes[:, 1],
+        y=boxes[:, 2],
+        width=boxes[:, 3],
+        height=boxes[:, 4],
+        is_heading=np.fromiter(
+            (elem.type == "heading" for elem in content_elements), dtype=bool, count=n
+        ),
+    )
+
+
+def _group_by_page(
+    content_elements: List[ContentElement],
+) -> Tuple[List[ContentElement], _LayoutColumns, Dict[int, Tuple[int, int]]]:
+    """
+    Order content elements by page and find each page's run.
+
+    Parsed content is normally already in page order, in which case the
+    elements are not sorted again. Returns the ordered elements, their
+    layout columns, and the ``(start, stop)`` run of each page, ascending.
+    """
+    columns = _layout_columns(content_elements)
+    page = columns.page
+    if len(page) > 1 and np.any(page[1:] < page[:-1]):
+        order = np.argsort(page, kind="stable")
+        columns = columns.take(order)
+        content_elements = [content_elements[i] for i in order.tolist()]
+        page = columns.page
+
+    starts = np.flatnonzero(np.diff(page, prepend=page[:1] - 1)).tolist()
+    stops = starts[1:] + [len(page)]
+    runs = dict(zip(page[starts].tolist(), zip(starts, stops)))
+    return content_elements, columns, runs
+
+
+def _group_placed_by_page(items) -> Dict[int, list]:
+    """Group tables or figures with a bbox by page number, in one pass."""
+    by_page = defaultdict(list)
+    for item in items:
+        if item.bbox:
+            by_page[item.bbox.page].append(item)
+    return by_page
+
+
+def _layout_metrics(columns: _LayoutColumns, lengths: List[int]) -> List[LayoutMetrics]:
+    """
+    Layout metrics for consecutive groups of elements of the given lengths.
+
+    Within each group, elements must be ordered by page so that each page's
+    boxes are contiguous; overlap is only checked between boxes on the same
+    page.
+    """
+    n_groups = len(lengths)
+    group = np.repeat(np.arange(n_groups), lengths)
+    headings = np.bincount(group[columns.is_heading], minlength=n_groups)
+
+    boxed = ~np.isnan(columns.x)
+    group, page = group[boxed], columns.page[boxed]
+    x0, y0 = columns.x[boxed], columns.y[boxed]
+
+    # Per-group sample variance of x positions, two passes in floats
+    counts = np.bincount(group, minlength=n_groups)
+    means = np.bincount(group, weights=x0, minlength=n_groups) / np.maximum(counts, 1)
+    squares = np.bincount(group, weights=(x0 - means[group]) ** 2, minlength=n_groups)
+    variances = np.where(counts > 1, squares / np.maximum(counts - 1, 1), 0.0)
+
+    # Detect multi-column layout: two peaks in a histogram of x positions
+    # across the page width, each holding several blocks (so a lone
+    # centered heading or page number is not a column) and far apart
+    on_page = (x0 >= 0) & (x0 <= COLUMN_PAGE_WIDTH)
+    bins = np.minimum(
+        (x0[on_page] * (COLUMN_BINS / COLUMN_PAGE_WIDTH)).astype(np.int64), COLUMN_BINS - 1
+    )
+    hist = np.bincount(
+        group[on_page] * COLUMN_BINS + bins, minlength=n_groups * COLUMN_BINS
+    ).reshape(n_groups, COLUMN_BINS)
+    # Pad with empty bins so edge bins can peak; a plateau counts once
+    padded = np.pad(hist, ((0, 0), (1, 1)))
+    column_peaks = (
+        (padded[:, 1:-1] > padded[:, :-2]) & (padded[:, 1:-1] >= padded[:, 2:])
+        & (hist >= COLUMN_MIN_BLOCKS)
+    )
+    first_peak = column_peaks.argmax(axis=1)
+    last_peak = COLUMN_BINS - 1 - column_peaks[:, ::-1].argmax(axis=1)
+    multi_column = column_peaks.any(axis=1) & (last_peak - first_peak >= COLUMN_MIN_GAP_BINS)
+
+    # Check each run of boxes sharing a group and page for overlaps
+    overlapping = np.zeros(n_groups, dtype=bool)
+    rects = np.column_stack((
+        x0, y0, x0 + columns.width[boxed], y0 + columns.height[boxed],
+    ))
+    run_starts = np.flatnonzero(
+        (np.diff(group, prepend=-1) != 0) | (np.diff(page, prepend=-1) != 0)
+    ).tolist()
+    run_group = group.tolist()
+    for start, stop in zip(run_starts, run_starts[1:] + [len(rects)]):
+        g = run_group[start]
+        if stop - start > 1 and not overlapping[g] and _page_has_overlap(rects[start:stop]):
+            overlapping[g] = True
+
+    return [
+        LayoutMetrics(
+            x_position_variance=variance,
+            heading_count=heading_count,
+            has_multi_column=multi,
+            has_overlapping_blocks=overlap,
+        )
+        for variance, heading_count, multi, overlap in zip(
+            variances.tolist(), headings.tolist(),
+            multi_column.tolist(), overlapping.tolist(),
+        )
+    ]
+
+
+@dataclass(frozen=True, slots=True)
+class _TextCounts:
+    """Raw counts behind TextQualityMetrics for the joined text of some blocks."""
+    blocks: int = 0
+    empty_blocks: int = 0
+    chars: int = 0
+    alphanumeric: int = 0
+    whitespace: int = 0
+    replacement: int = 0
+    words: int = 0
+    broken_words: int = 0
+
+
+def _count_text(content_elements: List[ContentElement], replacement_chars) -> _TextCounts:
+    """Count the text of content elements as joined with single spaces."""
+    if not content_elements:
+        return _TextCounts()
+
+    all_text = " ".join(elem.content for elem in content_elements)
+    alphanumeric, whitespace, replacement, words, broken = _count_char_classes(
+        all_text, replacement_chars
+    )
+    return _TextCounts(
+        blocks=len(content_elements),
+        empty_blocks=sum(1 for elem in content_elements if not elem.content.strip()),
+        chars=len(all_text),
+        alphanumeric=alphanumeric,
+        whitespace=whitespace,
+        replacement=replacement,
+        words=words,
+        # Broken words: single char, isolated punctuation
+        broken_words=broken,
+    )
+
+
+def _join_counts(parts: List[_TextCounts]) -> _TextCounts:
+    """Counts for the space-joined texts of several non-empty groups of blocks."""
+    separators = max(0, len(parts) - 1)
+    return _TextCounts(
+        blocks=sum(p.blocks for p in parts),
+        empty_blocks=sum(p.empty_blocks for p in parts),
+        chars=sum(p.chars for p in parts) + separators,
+        alphanumeric=sum(p.alphanumeric for p in parts),
+        whitespace=sum(p.whitespace for p in parts) + separators,
+        replacement=sum(p.replacement for p in parts),
+        # Separators are whitespace, so they never join or split words
+        words=sum(p.words for p in parts),
+        broken_words=sum(p.broken_words for p in parts),
+    )
+
+
+def _score_page(
+    thresholds, page_num, content_elements, tables, figures, layout_metrics
+) -> Tuple[PageConfidence, _TextCounts]:
+    """Score one page in a worker process (module-level so it pickles)."""
+    calculator = _worker_calculator(thresholds)
+    text_counts = _count_text(content_elements, calculator.REPLACEMENT_CHARS)
+    page_conf = calculator._calculate_page_confidence(
+        page_num=page_num,
+        content_elements=content_elements,
+        tables=tables,
+        figures=figures,
+        text_counts=text_counts,
+        layout_metrics=layout_metrics,
+    )
+    return page_conf, text_counts
+
+
+@lru_cache(maxsize=8)
+def _worker_calculator(thresholds: Tuple[float, float, float]) -> "ConfidenceCalculator":
+    """Per-process calculator for the given thresholds."""
+    return ConfidenceCalculator(*thresholds)
+
+
 class ConfidenceCalculator:
     """
     Calculate extraction confidence from parsed document output.
@@ -49,6 +426,7 @@ class ConfidenceCalculator:
         min_text_confidence: float = 0.65,
         min_table_confidence: float = 0.60,
         min_page_confidence: float = 0.65,
+        page_workers: int = 1,
     ):
         """
         Initialize confidence calculator.
@@ -57,37 +435,132 @@ class ConfidenceCalculator:
             min_text_confidence: Threshold below which text is flagged
             min_table_confidence: Threshold below which tables are flagged
             min_page_confidence: Threshold below which pages are flagged for VLM
+            page_workers: Worker processes for scoring pages of long
+                documents; 1 scores every page in the calling thread
         """
         self.min_text_confidence = min_text_confidence
         self.min_table_confidence = min_table_confidence
         self.min_page_confidence = min_page_confidence
+        self.page_workers = page_workers
+        self._page_cache: "OrderedDict[Tuple[str, int], Tuple[PageConfidence, _TextCounts]]" = OrderedDict()
+        self._page_cache_lock = threading.Lock()
+        self._page_pool: Optional[ProcessPoolExecutor] = None
+        self._page_pool_lock = threading.Lock()
+
+    def _get_page_pool(self) -> ProcessPoolExecutor:
+        """Lazily start the page-scoring worker processes."""
+        with self._page_pool_lock:
+            if self._page_pool is None:
+                # Spawned workers are safe to start from threaded callers
+                self._page_pool = ProcessPoolExecutor(
+                    max_workers=self.page_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._page_pool
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+    def close(self):
+        """
+        Shut down the page-scoring worker processes, if any were started.
+
+        The calculator stays usable; a later parallel calculation starts
+        a new pool.
+        """
+        with self._page_pool_lock:
+            pool, self._page_pool = self._page_pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
 
     def calculate(self, document: SimpleDocument) -> ExtractionConfidence:
         """
         Calculate extraction confidence for a document.
 
+        Per-page confidences are cached by a hash of the page's content, so
+        rescoring a document where only some pages changed (e.g. after
+        hybrid VLM extraction) only recomputes those pages.
+
         Args:
             document: Parsed SimpleDocument
 
         Returns:
             ExtractionConfidence with overall and per-page scores
         """
-        # Group content by page
-        pages_content = self._group_content_by_page(document)
-
-        # Calculate per-page confidence
-        page_confidences = []
-        for page_num, content in pages_content.items():
-            page_tables = [t for t in document.tables if t.bbox and t.bbox.page == page_num]
-            page_figures = [f for f in document.figures if f.bbox and f.bbox.page == page_num]
-
-            page_conf = self._calculate_page_confidence(
-                page_num=page_num,
-                content_elements=content,
-                tables=page_tables,
-                figures=page_figures,
+        # Group content by page, reading every bbox once
+        all_content, columns, page_runs = _group_by_page(document.content)
+        tables_by_page = _group_placed_by_page(document.tables)
+        figures_by_page = _group_placed_by_page(document.figures)
+
+        # Calculate per-page confidence, scoring only pages not in the cache;
+        # each page's raw text counts are kept to derive the document's
+        page_results: List[Optional[Tuple[PageConfidence, _TextCounts]]] = []
+        misses = []
+        for page_num, (start, stop) in page_runs.items():
+            content = all_content[start:stop]
+            page_tables = tables_by_page.get(page_num, [])
+            page_figures = figures_by_page.get(page_num, [])
+
+            cache_key = (
+                self._page_content_hash(content, page_tables, page_figures),
+                page_num,
             )
-            page_confidences.append(page_conf)
+            with self._page_cache_lock:
+                cached = self._page_cache.get(cache_key)
+                if cached is not None:
+                    self._page_cache.move_to_end(cache_key)
+
+            if cached is None:
+                misses.append((
+                    len(page_results), cache_key, page_num, content, page_tables, page_figures,
+                    start, stop,
+                ))
+            page_results.append(cached)
+
+        if misses:
+            indices, cache_keys, page_nums, contents, tables, figures, starts, stops = zip(
+                *misses
+            )
+            # Layout of all missed pages at once, from their slices of the columns
+            if len(misses) < len(page_runs):
+                columns = columns.take(np.concatenate([
+                    np.arange(start, stop) for start, stop in zip(starts, stops)
+                ]))
+            layouts = _layout_metrics(columns, [len(content) for content in contents])
+            if self.page_workers > 1 and len(misses) >= PARALLEL_PAGE_MIN:
+                thresholds = (
+                    self.min_text_confidence,
+                    self.min_table_confidence,
+                    self.min_page_confidence,
+                )
+                scored = self._get_page_pool().map(
+                    _score_page, repeat(thresholds), page_nums, contents, tables, figures,
+                    layouts,
+                    chunksize=max(1, len(misses) // (4 * self.page_workers)),
+                )
+            else:
+                scored = (
+                    self._score_page_with_counts(
+                        page_num, content, page_tables, page_figures, layout_metrics
+                    )
+                    for page_num, content, page_tables, page_figures, layout_metrics
+                    in zip(page_nums, contents, tables, figures, layouts)
+                )
+
+            for idx, cache_key, result in zip(indices, cache_keys, scored):
+                page_results[idx] = result
+                with self._page_cache_lock:
+                    self._page_cache[cache_key] = result
+                    if len(self._page_cache) > PAGE_CACHE_SIZE:
+                        self._page_cache.popitem(last=False)
+
+        page_confidences = [page_conf for page_conf, _ in page_results]
+        document_counts = _join_counts([counts for _, counts in page_results])
 
         # Handle documents with no page information
         if not page_confidences:
@@ -105,7 +578,7 @@ class ConfidenceCalculator:
         pages_needing_vlm = sum(1 for pc in page_confidences if pc.needs_vlm)
 
         # Calculate overall scores
-        content_score = self._calculate_content_score(document)
+        content_score = self._calculate_content_score(document, document_counts)
         structure_score = self._calculate_structure_score(document)
         table_score = self._calculate_tables_score(document.tables) if document.tables else None
         figure_score = self._calculate_figures_score(document.figures) if document.figures else None
@@ -128,10 +601,10 @@ class ConfidenceCalculator:
 
         overall_score = sum(s * w for s, w in zip(scores, weights))
 
-        # Collect all issues
-        all_issues = []
-        for pc in page_confidences:
-            all_issues.extend(pc.issues)
+        # Collect all issues, deduplicated in page order
+        all_issues = list(dict.fromkeys(
+            chain.from_iterable(pc.issues for pc in page_confidences)
+        ))
 
         return ExtractionConfidence(
             overall_score=overall_score,
@@ -142,20 +615,84 @@ class ConfidenceCalculator:
             page_confidences=page_confidences,
             total_pages=total_pages,
             pages_needing_vlm=pages_needing_vlm,
-            issues=list(set(all_issues)),  # Deduplicate
+            issues=all_issues,
         )
 
+    def calculate_sampled(
+        self,
+        document: SimpleDocument,
+        stride: int,
+        min_samples: int = 4,
+    ) -> Dict[str, Tuple[float, float, int]]:
+        """
+        Estimate page-level scores from every ``stride``-th page.
+
+        Much cheaper than ``calculate`` on long documents; callers can use
+        the spread to decide whether the full calculation is needed.
+
+        Args:
+            document: Parsed SimpleDocument
+            stride: Score one page out of every ``stride``
+            min_samples: Minimum sampled pages needed for an estimate
+
+        Returns:
+            ``(mean, std, n)`` per dimension ("overall", "content", "table",
+            "figure"), omitting dimensions with fewer than ``min_samples``
+            scores; empty if the document has too few pages to sample
+        """
+        pages_content = self._group_content_by_page(document)
+        sampled_pages = sorted(pages_content)[::max(1, stride)]
+        if len(sampled_pages) < min_samples:
+            return {}
+
+        tables_by_page = _group_placed_by_page(document.tables)
+        figures_by_page = _group_placed_by_page(document.figures)
+        samples: Dict[str, List[float]] = {
+            "overall": [], "content": [], "table": [], "figure": [],
+        }
+        for page_num in sampled_pages:
+            page_conf = self._calculate_page_confidence(
+                page_num=page_num,
+                content_elements=pages_content[page_num],
+                tables=tables_by_page.get(page_num, []),
+                figures=figures_by_page.get(page_num, []),
+            )
+            samples["overall"].append(page_conf.overall_score)
+            samples["content"].append(page_conf.text_score)
+            if page_conf.table_score is not None:
+                samples["table"].append(page_conf.table_score)
+            if page_conf.figure_score is not None:
+                samples["figure"].append(page_conf.figure_score)
+
+        return {
+            name: (statistics.fmean(values), statistics.stdev(values), len(values))
+            for name, values in samples.items()
+            if len(values) >= min_samples
+        }
+
+    @staticmethod
+    def _page_content_hash(
+        content_elements: List[ContentElement],
+        tables: List[Table],
+        figures: List[Figure],
+    ) -> str:
+        """Hash everything per-page scoring depends on."""
+        def box(bbox):
+            return (bbox.x, bbox.y, bbox.width, bbox.height) if bbox else None
+
+        page_state = (
+            [(e.type, e.content, box(e.bbox)) for e in content_elements],
+            [(t.rows, box(t.bbox)) for t in tables],
+            [(f.caption, f.label, box(f.bbox)) for f in figures],
+        )
+        return hashlib.blake2b(repr(page_state).encode(), digest_size=16).hexdigest()
+
     def _group_content_by_page(
         self, document: SimpleDocument
     ) -> dict[int, List[ContentElement]]:
-        """Group content elements by page number."""
-        pages = {}
-        for elem in document.content:
-            page_num = elem.bbox.page if elem.bbox else 1
-            if page_num not in pages:
-                pages[page_num] = []
-            pages[page_num].append(elem)
-        return pages
+        """Group content elements by page number, in page order."""
+        content, _, page_runs = _group_by_page(document.content)
+        return {page_num: content[start:stop] for page_num, (start, stop) in page_runs.items()}
 
     def _calculate_page_confidence(
         self,
@@ -163,19 +700,24 @@ class ConfidenceCalculator:
         content_elements: List[ContentElement],
         tables: List[Table],
         figures: List[Figure],
+        text_counts: Optional[_TextCounts] = None,
+        layout_metrics: Optional[LayoutMetrics] = None,
     ) -> PageConfidence:
-        """Calculate confidence for a single page."""
+        """Calculate confidence for a single page, reusing counts and layout if given."""
         issues = []
 
         # Calculate text quality
-        text_metrics = self._calculate_text_metrics(content_elements)
+        if text_counts is None:
+            text_counts = _count_text(content_elements, self.REPLACEMENT_CHARS)
+        text_metrics = self._text_metrics_from_counts(text_counts)
         text_score = self._text_metrics_to_score(text_metrics)
 
         if text_score < self.min_text_confidence:
             issues.append(f"Page {page_num}: Low text quality ({text_score:.2f})")
 
         # Calculate layout metrics
-        layout_metrics = self._calculate_layout_metrics(content_elements)
+        if layout_metrics is None:
+            layout_metrics = self._calculate_layout_metrics(content_elements)
         layout_score = self._layout_metrics_to_score(layout_metrics)
 
         if layout_metrics.has_multi_column:
@@ -220,51 +762,57 @@ class ConfidenceCalculator:
             issues=issues,
         )
 
+    def _score_page_with_counts(
+        self,
+        page_num: int,
+        content_elements: List[ContentElement],
+        tables: List[Table],
+        figures: List[Figure],
+        layout_metrics: Optional[LayoutMetrics] = None,
+    ) -> Tuple[PageConfidence, _TextCounts]:
+        """Score a page and return its raw text counts alongside."""
+        text_counts = _count_text(content_elements, self.REPLACEMENT_CHARS)
+        page_conf = self._calculate_page_confidence(
+            page_num=page_num,
+            content_elements=content_elements,
+            tables=tables,
+            figures=figures,
+            text_counts=text_counts,
+            layout_metrics=layout_metrics,
+        )
+        return page_conf, text_counts
+
     def _calculate_text_metrics(
         self, content_elements: List[ContentElement]
     ) -> TextQualityMetrics:
         """Calculate text quality metrics from content elements."""
-        if not content_elements:
-            return TextQualityMetrics(empty_block_ratio=1.0)
-
-        all_text = " ".join(elem.content for elem in content_elements)
+        return self._text_metrics_from_counts(
+            _count_text(content_elements, self.REPLACEMENT_CHARS)
+        )
 
-        if not all_text.strip():
+    def _text_metrics_from_counts(self, counts: _TextCounts) -> TextQualityMetrics:
+        """Derive text quality metrics from raw text counts."""
+        # No blocks, or only whitespace
+        if not counts.blocks or counts.whitespace == counts.chars:
             return TextQualityMetrics(empty_block_ratio=1.0)
 
-        total_chars = len(all_text)
-
-        # Count character types
-        alphanumeric = sum(1 for c in all_text if c.isalnum())
-        whitespace = sum(1 for c in all_text if c.isspace())
-        replacement = sum(1 for c in all_text if c in self.REPLACEMENT_CHARS)
-
-        alphanumeric_ratio = alphanumeric / total_chars if total_chars > 0 else 0
-        whitespace_ratio = whitespace / total_chars if total_chars > 0 else 0
-        replacement_ratio = replacement / total_chars if total_chars > 0 else 0
+        total_chars = counts.chars
 
         # Word-level analysis
-        words = all_text.split()
-        if words:
-            avg_word_length = sum(len(w) for w in words) / len(words)
-            # Count broken words (single char, isolated punctuation)
-            broken = sum(1 for w in words if len(w) == 1 and not w.isalnum())
-            broken_word_ratio = broken / len(words)
+        if counts.words:
+            avg_word_length = (total_chars - counts.whitespace) / counts.words
+            broken_word_ratio = counts.broken_words / counts.words
         else:
             avg_word_length = 0
             broken_word_ratio = 1.0
 
-        # Count empty blocks
-        empty_blocks = sum(1 for elem in content_elements if not elem.content.strip())
-        empty_block_ratio = empty_blocks / len(content_elements)
-
         return TextQualityMetrics(
-            alphanumeric_ratio=alphanumeric_ratio,
-            replacement_char_ratio=replacement_ratio,
-            whitespace_ratio=whitespace_ratio,
+            alphanumeric_ratio=counts.alphanumeric / total_chars,
+            replacement_char_ratio=counts.replacement / total_chars,
+            whitespace_ratio=counts.whitespace / total_chars,
             avg_word_length=avg_word_length,
             broken_word_ratio=broken_word_ratio,
-            empty_block_ratio=empty_block_ratio,
+            empty_block_ratio=counts.empty_blocks / counts.blocks,
         )
 
     def _text_metrics_to_score(self, metrics: TextQualityMetrics) -> float:
@@ -310,68 +858,19 @@ class ConfidenceCalculator:
         if not content_elements:
             return LayoutMetrics()
 
-        # Get x positions of elements with bounding boxes
-        x_positions = []
-        for elem in content_elements:
-            if elem.bbox:
-                x_positions.append(elem.bbox.x)
-
-        # Calculate x-position variance
-        x_variance = 0.0
-        if len(x_positions) > 1:
-            x_variance = statistics.variance(x_positions)
-
-        # Detect multi-column layout (high x-position variance)
-        # Normalize variance by page width (assume 600 points)
-        normalized_variance = x_variance / (600 ** 2)
-        has_multi_column = normalized_variance > 0.02
-
-        # Count headings
-        heading_count = sum(1 for elem in content_elements if elem.type == "heading")
-
-        # Check for overlapping blocks (simplified)
-        has_overlapping = self._check_overlapping_blocks(content_elements)
-
-        return LayoutMetrics(
-            x_position_variance=x_variance,
-            heading_count=heading_count,
-            has_multi_column=has_multi_column,
-            has_overlapping_blocks=has_overlapping,
-        )
+        columns = _layout_columns(content_elements)
+        columns = columns.take(np.argsort(columns.page, kind="stable"))
+        return _layout_metrics(columns, [len(content_elements)])[0]
 
     def _check_overlapping_blocks(self, content_elements: List[ContentElement]) -> bool:
-        """Check if any content elements have overlapping bounding boxes."""
-        elements_with_bbox = [e for e in content_elements if e.bbox]
-
-        for i, elem1 in enumerate(elements_with_bbox):
-            for elem2 in elements_with_bbox[i + 1:]:
-                if elem1.bbox.page != elem2.bbox.page:
-                    continue
-
-                # Check for overlap
-                if self._boxes_overlap(elem1.bbox, elem2.bbox):
-                    return True
-
-        return False
-
-    def _boxes_overlap(self, box1, box2) -> bool:
-        """Check if two bounding boxes overlap."""
-        # Box format: x, y, width, height
-        x1_min, y1_min = box1.x, box1.y
-        x1_max = box1.x + box1.width
-        y1_max = box1.y + box1.height
-
-        x2_min, y2_min = box2.x, box2.y
-        x2_max = box2.x + box2.width
-        y2_max = box2.y + box2.height
-
-        # Check for no overlap
-        if x1_max < x2_min or x2_max < x1_min:
-            return False
-        if y1_max < y2_min or y2_max < y1_min:
-            return False
+        """
+        Check if any content elements have overlapping bounding boxes.
 
-        return True
+        Boxes on the same page are tested all-pairs with NumPy broadcasting;
+        pages with more than OVERLAP_BROADCAST_LIMIT boxes use a sweep over
+        boxes sorted by left edge instead. Touching edges count as overlap.
+        """
+        return self._calculate_layout_metrics(content_elements).has_overlapping_blocks
 
     def _layout_metrics_to_score(self, metrics: LayoutMetrics) -> float:
         """Convert layout metrics to confidence score."""
@@ -410,23 +909,24 @@ class ConfidenceCalculator:
 
         score = 1.0
 
-        # Check row consistency (all rows same column count)
-        col_counts = [len(row) for row in table.rows]
-        if col_counts:
-            most_common_cols = Counter(col_counts).most_common(1)[0][0]
-            consistent_rows = sum(1 for c in col_counts if c == most_common_cols)
-            row_consistency = consistent_rows / len(col_counts)
-
-            if row_consistency < 0.8:
-                score -= 0.3
+        # Column counts, cell count and blank cells with C-level passes;
+        # cells are validated as str, so filter(str.strip) keeps exactly the
+        # non-blank ones
+        col_counts = list(map(len, table.rows))
+        total_cells = sum(col_counts)
+        empty_cells = total_cells - len(list(filter(str.strip, chain.from_iterable(table.rows))))
+
+        # Check row consistency (all rows same column count); uniform tables,
+        # including single rows, skip counting every width
+        consistent_rows = col_counts.count(col_counts[0])
+        if consistent_rows < len(col_counts):
+            _, consistent_rows = Counter(col_counts).most_common(1)[0]
+        row_consistency = consistent_rows / len(col_counts)
+
+        if row_consistency < 0.8:
+            score -= 0.3
 
         # Check empty cell ratio
-        total_cells = sum(len(row) for row in table.rows)
-        empty_cells = sum(
-            1 for row in table.rows for cell in row
-            if not cell or not str(cell).strip()
-        )
-
         if total_cells > 0:
             empty_ratio = empty_cells / total_cells
             if empty_ratio > 0.5:
@@ -466,19 +966,32 @@ class ConfidenceCalculator:
 
         return sum(figure_scores) / len(figure_scores) if figure_scores else 1.0
 
-    def _calculate_content_score(self, document: SimpleDocument) -> float:
-        """Calculate overall content extraction score."""
+    def _calculate_content_score(
+        self, document: SimpleDocument, text_counts: Optional[_TextCounts] = None
+    ) -> float:
+        """
+        Calculate overall content extraction score.
+
+        Args:
+            document: Parsed SimpleDocument
+            text_counts: Counts for all of the document's content, e.g.
+                joined from its pages' counts; computed if not given
+        """
         if not document.content:
             return 0.3  # No content is suspicious
 
-        all_text = " ".join(elem.content for elem in document.content)
+        if text_counts is None:
+            text_counts = _count_text(document.content, self.REPLACEMENT_CHARS)
 
-        if len(all_text.strip()) < 50:
-            return 0.4  # Very little content
+        # The stripped text is at least as long as its non-whitespace part,
+        # so only short texts need the exact check
+        if text_counts.chars - text_counts.whitespace < 50:
+            all_text = " ".join(elem.content for elem in document.content)
+            if len(all_text.strip()) < 50:
+                return 0.4  # Very little content
 
         # Use text metrics for overall content scoring
-        text_metrics = self._calculate_text_metrics(document.content)
-        return self._text_metrics_to_score(text_metrics)
+        return self._text_metrics_to_score(self._text_metrics_from_counts(text_counts))
 
     def _calculate_structure_score(self, document: SimpleDocument) -> float:
         """Calculate document structure extraction score."""
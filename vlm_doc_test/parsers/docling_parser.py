@@ -5,6 +5,9 @@ This module provides document conversion using Docling's VLM pipeline,
 which uses IBM's Granite Vision model for local document understanding.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 from dataclasses import dataclass
@@ -12,6 +15,7 @@ from datetime import datetime
 
 from ..schemas.schema_simple import SimpleDocument, DocumentSource, DocumentMetadata, ContentElement, Table, Figure
 from ..schemas.base import DocumentFormat, DocumentCategory, BoundingBox
+from ..utils.batch_utils import run_batch_conversion
 from ..utils.markdown_utils import parse_markdown_to_content
 
 
@@ -24,6 +28,8 @@ class DoclingConfig:
     extract_tables: bool = True
     extract_figures: bool = True
     ocr_enabled: bool = True
+    artifacts_path: Optional[str] = None  # Pre-fetched model artifacts directory
+    backend: Optional[str] = None  # PDF backend: None (Docling default) or "pypdfium2"
 
 
 class DoclingParser:
@@ -53,18 +59,42 @@ class DoclingParser:
     def _get_converter(self):
         """Lazy load document converter."""
         if self._converter is None:
+            if self.config.backend not in (None, "pypdfium2"):
+                raise ValueError(f"Unknown Docling backend: {self.config.backend}")
+
             from docling.document_converter import DocumentConverter, PdfFormatOption
             from docling.datamodel.base_models import InputFormat
 
+            format_kwargs = {}
+
+            if self.config.backend == "pypdfium2":
+                # ~15-20% faster than the default dlparse backend
+                from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
+                format_kwargs["backend"] = PyPdfiumDocumentBackend
+
             if self.config.use_vlm:
                 # Use VLM pipeline
                 from docling.pipeline.vlm_pipeline import VlmPipeline
 
+                format_kwargs["pipeline_cls"] = VlmPipeline
+                if self.config.artifacts_path:
+                    from docling.datamodel.pipeline_options import VlmPipelineOptions
+                    format_kwargs["pipeline_options"] = VlmPipelineOptions(
+                        artifacts_path=self.config.artifacts_path,
+                    )
+            elif self.config.artifacts_path or not self.config.ocr_enabled:
+                # Standard pipeline with non-default options
+                from docling.datamodel.pipeline_options import PdfPipelineOptions
+
+                format_kwargs["pipeline_options"] = PdfPipelineOptions(
+                    do_ocr=self.config.ocr_enabled,
+                    artifacts_path=self.config.artifacts_path,
+                )
+
+            if format_kwargs:
                 self._converter = DocumentConverter(
                     format_options={
-                        InputFormat.PDF: PdfFormatOption(
-                            pipeline_cls=VlmPipeline,
-                        ),
+                        InputFormat.PDF: PdfFormatOption(**format_kwargs),
                     }
                 )
             else:
@@ -73,6 +103,23 @@ class DoclingParser:
 
         return self._converter
 
+    def warmup(self) -> None:
+        """
+        Load the converter and run it once on a tiny in-memory PDF.
+
+        Model weights are loaded on the first conversion; warming up keeps
+        that cost out of the first real document (e.g. before timing runs).
+        """
+        from io import BytesIO
+        import fitz
+        from docling.datamodel.base_models import DocumentStream
+
+        converter = self._get_converter()
+        with fitz.open() as doc:
+            doc.new_page().insert_text((72, 72), "Warm-up", fontsize=12)
+            pdf_bytes = doc.tobytes()
+        converter.convert(DocumentStream(name="warmup.pdf", stream=BytesIO(pdf_bytes)))
+
     def parse(
         self,
         file_path: Path,
@@ -168,6 +215,26 @@ class DoclingParser:
         result = converter.convert(str(file_path))
         return result.document.model_dump()
 
+    def parse_to_json_bytes(
+        self,
+        file_path: Path,
+    ) -> bytes:
+        """
+        Parse document straight to indented JSON.
+
+        Serializes the Docling document with pydantic's JSON encoder, without
+        building the intermediate dict that ``parse_to_dict`` returns.
+
+        Args:
+            file_path: Path to document file
+
+        Returns:
+            UTF-8 encoded JSON
+        """
+        converter = self._get_converter()
+        result = converter.convert(str(file_path))
+        return result.document.model_dump_json(indent=2).encode('utf-8')
+
     def _get_format(self, file_path: Path) -> DocumentFormat:
         """Determine document format from file extension."""
         suffix = file_path.suffix.lower()
@@ -273,35 +340,36 @@ class DoclingParser:
         file_paths: List[Path],
         output_dir: Path,
         format: str = "markdown",
+        max_workers: int = 1,
     ) -> List[Path]:
         """
         Batch convert multiple documents.
 
+        Files are independent, so with ``max_workers > 1`` they are converted
+        in worker processes; each worker loads one converter at start-up and
+        reuses it for all of its files. Every worker holds its own copy of
+        the models, so parallelism is opt-in.
+
         Args:
             file_paths: List of document paths
             output_dir: Output directory
             format: Output format ("markdown", "json")
+            max_workers: Worker processes (default: 1, which converts in
+                this process with this parser's converter)
 
         Returns:
-            List of output file paths
+            List of output file paths, in the order of ``file_paths``
         """
-        output_dir.mkdir(parents=True, exist_ok=True)
-        output_paths = []
-
-        for file_path in file_paths:
-            output_name = file_path.stem + (".md" if format == "markdown" else ".json")
-            output_path = output_dir / output_name
-
-            if format == "markdown":
-                self.parse_to_markdown(file_path, output_path)
-            elif format == "json":
-                import json
-                data = self.parse_to_dict(file_path)
-                output_path.write_text(json.dumps(data, indent=2), encoding='utf-8')
-
-            output_paths.append(output_path)
+        return run_batch_conversion(
+            self, file_paths, output_dir, format, max_workers, _load_batch_parser
+        )
 
-        return output_paths
+    def _convert_file(self, file_path: Path, output_path: Path, format: str) -> None:
+        """Convert one document and write it to ``output_path``."""
+        if format == "markdown":
+            self.parse_to_markdown(file_path, output_path)
+        elif format == "json":
+            output_path.write_bytes(self.parse_to_json_bytes(file_path))
 
     def compare_with_marker(
         self,
@@ -310,25 +378,30 @@ class DoclingParser:
         """
         Compare Docling output with Marker-PDF.
 
+        Both parsers run concurrently in threads, so the comparison takes as
+        long as the slower one; each reported time is measured while the
+        other parser is also running.
+
         Args:
             pdf_path: Path to PDF file
 
         Returns:
             Comparison results
         """
-        from .marker_parser import MarkerParser
+        from .marker_parser import get_marker_parser
         import time
 
-        # Time Docling extraction
-        start = time.time()
-        docling_doc = self.parse(pdf_path)
-        docling_time = time.time() - start
+        def timed(parse):
+            start = time.perf_counter()
+            document = parse(pdf_path)
+            return document, time.perf_counter() - start
 
-        # Time Marker extraction
-        start = time.time()
-        marker_parser = MarkerParser()
-        marker_doc = marker_parser.parse(pdf_path)
-        marker_time = time.time() - start
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="compare") as executor:
+            docling_future = executor.submit(timed, self.parse)
+            # Shared parser: Marker's models are only loaded by the first comparison
+            marker_future = executor.submit(timed, get_marker_parser().parse)
+            docling_doc, docling_time = docling_future.result()
+            marker_doc, marker_time = marker_future.result()
 
         # Compare results
         comparison = {
@@ -350,3 +423,22 @@ class DoclingParser:
         }
 
         return comparison
+
+
+def _load_batch_parser(config: DoclingConfig) -> DoclingParser:
+    """Create a parser with its converter loaded, for a batch worker process."""
+    parser = DoclingParser(config)
+    parser._get_converter()
+    return parser
+
+
+@lru_cache(maxsize=1)
+def get_docling_parser() -> DoclingParser:
+    """
+    Get a process-wide DoclingParser so its converter is only loaded once.
+
+    Uses pre-fetched model artifacts from ``DOCLING_ARTIFACTS_PATH`` if set.
+    """
+    return DoclingParser(DoclingConfig(
+        artifacts_path=os.getenv("DOCLING_ARTIFACTS_PATH"),
+    ))
@@ -1,15 +1,18 @@
 """
-HTML parser using BeautifulSoup for web page extraction.
+HTML parser using lxml for web page extraction.
 
 This parser extracts structured content from HTML documents including
 text, headings, links, images, and tables with semantic structure.
 """
 
-from bs4 import BeautifulSoup, Tag, NavigableString
+import lxml.html
+from lxml import etree
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Tuple, Union, Iterable, BinaryIO, TextIO
+from dataclasses import dataclass, field
 from datetime import datetime
-import re
+import itertools
+import string
 
 from ..schemas.schema_simple import (
     SimpleDocument,
@@ -24,9 +27,111 @@ from ..schemas.schema_simple import (
 from ..schemas.base import DocumentFormat, DocumentCategory, BoundingBox
 
 
+# XPath queries, compiled once and evaluated in C by libxml2
+# Text inside <template> is inert markup, not page text
+_TEXT_NODES = etree.XPath("descendant::text()[not(ancestor::template)]", smart_strings=False)
+_CLASS_VALUES = etree.XPath("//@class", smart_strings=False)
+
+_CONTENT_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p')
+_NON_CONTENT_TAGS = ('script', 'style', 'noscript')
+_LANDMARK_TAGS = ('main', 'article', 'body')
+# Tags visited by HTMLParser._collect; everything else is skipped in C
+_WALK_TAGS = (
+    _CONTENT_TAGS + _NON_CONTENT_TAGS + _LANDMARK_TAGS
+    + ('div', 'figure', 'img', 'table', 'a', 'title', 'meta')
+)
+_WALK_TAG_SET = frozenset(_WALK_TAGS)
+_CONTENT_DIV_WORDS = ('content', 'main', 'article')
+# Class name fragments hinting at a document category
+_ACADEMIC_CLASS_WORDS = ('abstract', 'citation', 'reference')
+_BLOG_CLASS_WORDS = ('blog', 'post', 'author')
+# Class names are matched ignoring ASCII case only, like CSS [class*=... i]
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+# Path and domain separators in document IDs built from URLs
+_URL_ID_TABLE = str.maketrans({'/': '_', '.': '_'})
+# Read size for HTMLParser.parse_stream
+_STREAM_CHUNK_SIZE = 32 * 1024
+
+
+@dataclass
+class _PageElements:
+    """Elements of interest, collected in document order by one tree walk."""
+
+    title: Optional[etree._Element] = None
+    # First <meta> for each name attribute and each property attribute
+    meta_by_name: Dict[str, etree._Element] = field(default_factory=dict)
+    meta_by_property: Dict[str, etree._Element] = field(default_factory=dict)
+    # script/style/noscript; elements inside them are not collected below
+    non_content: List[etree._Element] = field(default_factory=list)
+    # Headings and paragraphs
+    blocks: List[etree._Element] = field(default_factory=list)
+    # First main, article, content div and body: the element and the slice
+    # of blocks inside it
+    landmarks: Dict[str, Tuple[etree._Element, int, int]] = field(default_factory=dict)
+    figures: List[etree._Element] = field(default_factory=list)
+    # <img> elements outside any <figure>
+    images: List[etree._Element] = field(default_factory=list)
+    tables: List[etree._Element] = field(default_factory=list)
+    # <a> elements with an href
+    links: List[etree._Element] = field(default_factory=list)
+
+
+def _first(elements) -> Optional[etree._Element]:
+    """First element of an XPath result or element iterator, if any."""
+    return next(iter(elements), None)
+
+
+_ASCII_WHITESPACE = " \t\n\r\f"
+
+
+def _text(element: etree._Element) -> str:
+    """
+    Concatenated text of an element, skipping comments.
+
+    Text nodes of only ASCII whitespace (indentation between tags) count as
+    a single newline or space.
+    """
+    return "".join(
+        node if node.strip(_ASCII_WHITESPACE) else ("\n" if "\n" in node else " ")
+        for node in _TEXT_NODES(element)
+    )
+
+
+def _lexbor_class_contains(*words: str, tag: str = '') -> str:
+    """CSS selector: the class attribute contains any word, ignoring case."""
+    return ', '.join(f'{tag}[class*="{word}" i]' for word in words)
+
+
+# CSS selectors for the selectolax backend, matching the lxml rules above
+_LEXBOR_CONTENT_SELECTOR = ', '.join(_CONTENT_TAGS)
+_LEXBOR_CONTENT_DIV = _lexbor_class_contains(*_CONTENT_DIV_WORDS, tag='div')
+_LEXBOR_ACADEMIC_CLASS = _lexbor_class_contains(*_ACADEMIC_CLASS_WORDS)
+_LEXBOR_BLOG_CLASS = _lexbor_class_contains(*_BLOG_CLASS_WORDS)
+
+
+def _lexbor_text(node) -> str:
+    """Concatenated text of a selectolax node, as _text() for lxml elements."""
+    return "".join(
+        text if text.strip(_ASCII_WHITESPACE) else ("\n" if "\n" in text else " ")
+        for text in (
+            child.text_content
+            for child in node.traverse(include_text=True)
+            if child.is_text_node
+        )
+    )
+
+
+def _lexbor_clean_text(node) -> str:
+    """Text of a selectolax node with whitespace runs collapsed to one space."""
+    return ' '.join(node.text(deep=True, separator=' ').split())
+
+
 class HTMLParser:
     """
-    HTML parser using BeautifulSoup for web page extraction.
+    HTML parser using lxml for web page extraction.
+
+    The page is parsed into an lxml tree once and walked once; every
+    extractor works from the elements collected by that walk.
 
     Features:
     - Semantic structure detection (headings, paragraphs, sections)
@@ -42,11 +147,24 @@ class HTMLParser:
         Initialize HTML parser.
 
         Args:
-            parser: BeautifulSoup parser to use ("lxml", "html.parser", etc.)
+            parser: HTML parser backend: "lxml" (libxml2) or "selectolax"
+                (lexbor, an HTML5 parser; requires the selectolax package)
         """
+        if parser == "selectolax":
+            try:
+                from selectolax.lexbor import LexborHTMLParser
+            except ImportError as e:
+                raise ImportError(
+                    "parser='selectolax' requires selectolax: pip install selectolax"
+                ) from e
+            self._lexbor_parser = LexborHTMLParser
+        elif parser != "lxml":
+            raise ValueError(f"Unknown HTML parser: {parser}")
         self.parser = parser
-        self.soup = None
+        self.tree = None
         self.element_counter = 0
+        # lxml parsers must not be shared between threads; one per instance
+        self._html_parser = lxml.html.HTMLParser(encoding="utf-8")
 
     def parse(
         self,
@@ -71,19 +189,124 @@ class HTMLParser:
         Returns:
             SimpleDocument with extracted content
         """
-        # Load HTML
+        # Load HTML; files are read as bytes and decoded by the parser in C
         if isinstance(html_source, (str, Path)) and Path(html_source).exists():
             html_path = Path(html_source)
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+            html_bytes = html_path.read_bytes()
             file_path = str(html_path.absolute())
         else:
-            html_content = str(html_source)
+            html_bytes = str(html_source).encode('utf-8', errors='replace')
             file_path = None
 
-        # Parse with BeautifulSoup
-        self.soup = BeautifulSoup(html_content, self.parser)
+        # Generate document ID
+        if url:
+            doc_id = self._url_to_id(url)
+        elif file_path:
+            doc_id = Path(file_path).stem
+        else:
+            doc_id = "html_doc"
+
         self.element_counter = 0
+        try:
+            if self.parser == "selectolax":
+                return self._parse_selectolax(
+                    html_bytes,
+                    doc_id=doc_id,
+                    url=url,
+                    file_path=file_path,
+                    category=category,
+                    extract_links=extract_links,
+                    extract_images=extract_images,
+                    extract_tables=extract_tables,
+                )
+
+            # Parse with lxml as UTF-8; explicitly, so encoding declarations
+            # in the markup are ignored as they were when files were read as text
+            try:
+                self._html_parser.feed(html_bytes)
+                self.tree = self._html_parser.close()
+            except etree.ParserError:
+                self.tree = None
+            if self.tree is None:
+                # Empty document (no elements or text)
+                self.tree = lxml.html.Element('html')
+
+            # Collect every element of interest in one pass over the tree;
+            # markup after </html> is parsed into a second top-level element
+            tops = itertools.chain([self.tree], self.tree.itersiblings(etree.Element))
+            page = self._collect(itertools.chain.from_iterable(
+                etree.iterwalk(top, events=('start', 'end'), tag=_WALK_TAGS)
+                for top in tops
+            ))
+
+            return self._build_document(
+                page,
+                doc_id=doc_id,
+                url=url,
+                file_path=file_path,
+                category=category,
+                extract_links=extract_links,
+                extract_images=extract_images,
+                extract_tables=extract_tables,
+            )
+        finally:
+            # The tree (with all of its text) is not needed once the
+            # document is built; drop it now rather than at the next parse
+            self.tree = None
+
+    def parse_stream(
+        self,
+        file_obj: Union[BinaryIO, TextIO],
+        url: Optional[str] = None,
+        category: Optional[DocumentCategory] = None,
+        extract_links: bool = True,
+        extract_images: bool = True,
+        extract_tables: bool = True,
+    ) -> SimpleDocument:
+        """
+        Parse HTML from an open file into a SimpleDocument.
+
+        The file is read in 32 KB chunks and fed to an lxml pull parser, so
+        the page is never held in memory as one string; elements are
+        collected as the parser emits them. The result is the same as
+        parse() on the file's content with the lxml backend, which this
+        method always uses.
+
+        Args:
+            file_obj: HTML file opened in binary (UTF-8) or text mode
+            url: Source URL (if applicable)
+            category: Optional document category
+            extract_links: Whether to extract hyperlinks
+            extract_images: Whether to extract images
+            extract_tables: Whether to extract tables
+
+        Returns:
+            SimpleDocument with extracted content
+        """
+        name = getattr(file_obj, 'name', None)
+        if isinstance(name, str) and Path(name).is_file():
+            file_path = str(Path(name).absolute())
+        else:
+            file_path = None
+
+        # No tag= filter: with it, lxml misplaces the end events of elements
+        # whose end tag is implied, so tags are filtered here instead
+        pull_parser = etree.HTMLPullParser(events=('start', 'end'), encoding='utf-8')
+
+        def events():
+            while True:
+                chunk = file_obj.read(_STREAM_CHUNK_SIZE)
+                if not chunk:
+                    break
+                if isinstance(chunk, str):
+                    chunk = chunk.encode('utf-8', errors='replace')
+                pull_parser.feed(chunk)
+                yield from pull_parser.read_events()
+            try:
+                self.tree = pull_parser.close()
+            except etree.ParserError:
+                self.tree = None
+            yield from pull_parser.read_events()
 
         # Generate document ID
         if url:
@@ -93,32 +316,216 @@ class HTMLParser:
         else:
             doc_id = "html_doc"
 
+        self.element_counter = 0
+        try:
+            page = self._collect(
+                event for event in events() if event[1].tag in _WALK_TAG_SET
+            )
+            if self.tree is None:
+                # Empty document (no elements or text)
+                self.tree = lxml.html.Element('html')
+
+            return self._build_document(
+                page,
+                doc_id=doc_id,
+                url=url,
+                file_path=file_path,
+                category=category,
+                extract_links=extract_links,
+                extract_images=extract_images,
+                extract_tables=extract_tables,
+            )
+        finally:
+            # As in parse(), release the tree once the document is built
+            self.tree = None
+
+    def _build_document(
+        self,
+        page: _PageElements,
+        doc_id: str,
+        url: Optional[str],
+        file_path: Optional[str],
+        category: Optional[DocumentCategory],
+        extract_links: bool,
+        extract_images: bool,
+        extract_tables: bool,
+    ) -> SimpleDocument:
+        """Assemble a SimpleDocument from the elements collected from self.tree."""
         # Extract metadata
-        metadata = self._extract_metadata()
+        metadata = self._extract_metadata(page)
+
+        # Extract content, figures, tables and links
+        content, figures, tables, links = self._extract_all(
+            page,
+            extract_images=extract_images,
+            extract_tables=extract_tables,
+            extract_links=extract_links,
+        )
+
+        # Create document
+        document = SimpleDocument(
+            id=doc_id,
+            format=DocumentFormat.HTML,
+            category=category or self._infer_category(page),
+            source=DocumentSource(
+                url=url,
+                file_path=file_path,
+                accessed_at=datetime.now(),
+            ),
+            metadata=metadata,
+            content=content,
+            figures=figures,
+            tables=tables,
+            links=links,
+        )
+
+        return document
+
+    def _parse_selectolax(
+        self,
+        html_bytes: bytes,
+        doc_id: str,
+        url: Optional[str],
+        file_path: Optional[str],
+        category: Optional[DocumentCategory],
+        extract_links: bool,
+        extract_images: bool,
+        extract_tables: bool,
+    ) -> SimpleDocument:
+        """
+        Parse HTML with the selectolax (lexbor) backend.
+
+        Mirrors the lxml extraction rules; elements are located with CSS
+        selectors evaluated in C. lexbor builds the tree the way browsers
+        do, so malformed markup can nest differently than with libxml2.
+        """
+        self.tree = self._lexbor_parser(html_bytes)
+        tree = self.tree
+
+        # Extract metadata (before non-content tags are removed)
+        metadata = DocumentMetadata()
+        title_tag = tree.css_first('title')
+        if title_tag is not None:
+            metadata.title = _lexbor_text(title_tag).strip()
 
-        # Extract main content
-        content = self._extract_content()
+        meta_author = tree.css_first('meta[name="author"]')
+        if meta_author is not None and meta_author.attributes.get('content'):
+            metadata.authors = [Author(name=meta_author.attributes['content'])]
+
+        if not metadata.title:
+            og_title = tree.css_first('meta[property="og:title"]')
+            if og_title is not None and og_title.attributes.get('content'):
+                metadata.title = og_title.attributes['content']
+
+        meta_keywords = tree.css_first('meta[name="keywords"]')
+        if meta_keywords is not None and meta_keywords.attributes.get('content'):
+            keywords = meta_keywords.attributes['content'].split(',')
+            metadata.keywords = [k.strip() for k in keywords if k.strip()]
+
+        meta_desc = tree.css_first('meta[name="description"]')
+        if meta_desc is not None and meta_desc.attributes.get('content') and not metadata.keywords:
+            words = meta_desc.attributes['content'].split()[:5]
+            metadata.keywords = [' '.join(words)]
+
+        # Remove script and style tags with their content
+        tree.strip_tags(list(_NON_CONTENT_TAGS))
+
+        # Find main content area (prioritize semantic tags)
+        main_content = (
+            tree.css_first('main')
+            or tree.css_first('article')
+            or tree.css_first(_LEXBOR_CONTENT_DIV)
+            or tree.body
+            or tree.root
+        )
+
+        # Extract headings and paragraphs in order
+        content = []
+        if main_content is not None:
+            for element in main_content.css(_LEXBOR_CONTENT_SELECTOR):
+                text = _lexbor_clean_text(element)
+                if len(text) < 3:
+                    continue
+                if element.tag == 'p':
+                    content.append(ContentElement(
+                        id=self._get_element_id(),
+                        type="paragraph",
+                        content=text,
+                    ))
+                else:
+                    content.append(ContentElement(
+                        id=self._get_element_id(),
+                        type="heading",
+                        content=text,
+                        level=int(element.tag[1]),
+                    ))
 
-        # Extract figures
         figures = []
         if extract_images:
-            figures = self._extract_figures()
+            figure_images = set()
+            for figure_tag in tree.css('figure'):
+                images = figure_tag.css('img')
+                figure_images.update(img.mem_id for img in images)
+                if images:
+                    caption_tag = figure_tag.css_first('figcaption')
+                    caption = _lexbor_text(caption_tag).strip() if caption_tag is not None else None
+                    figures.append(Figure(
+                        id=f"fig_{len(figures) + 1}",
+                        caption=caption,
+                        label=f"Figure {len(figures) + 1}" if caption else None,
+                    ))
+            for img in tree.css('img'):
+                alt_text = (img.attributes.get('alt') or '').strip()
+                if alt_text and img.mem_id not in figure_images:
+                    figures.append(Figure(
+                        id=f"fig_{len(figures) + 1}",
+                        caption=alt_text,
+                    ))
 
-        # Extract tables
         tables = []
         if extract_tables:
-            tables = self._extract_tables()
+            for idx, table_tag in enumerate(tree.css('table'), start=1):
+                caption_tag = table_tag.css_first('caption')
+                caption = _lexbor_text(caption_tag).strip() if caption_tag is not None else None
+                rows = []
+                for tr in table_tag.css('tr'):
+                    cells = [_lexbor_clean_text(cell) for cell in tr.css('td, th')]
+                    if cells:
+                        rows.append(cells)
+                if rows:
+                    tables.append(Table.model_construct(
+                        id=f"table_{idx}",
+                        caption=caption,
+                        label=f"Table {idx}" if caption else None,
+                        rows=rows,
+                    ))
 
-        # Extract links
         links = []
         if extract_links:
-            links = self._extract_links()
-
-        # Create document
-        document = SimpleDocument(
+            seen_urls = set()
+            for idx, a_tag in enumerate(tree.css('a[href]'), start=1):
+                href = a_tag.attributes.get('href') or ''
+                # Skip duplicates and internal anchors, then empty links
+                if href in seen_urls or href.startswith('#'):
+                    continue
+                text = _lexbor_clean_text(a_tag)
+                if not text:
+                    continue
+                seen_urls.add(href)
+                links.append(Link(id=f"link_{idx}", text=text, url=href))
+
+        if category is None and tree.css_first('article') is not None:
+            if tree.css_first(_LEXBOR_ACADEMIC_CLASS) is not None:
+                category = DocumentCategory.ACADEMIC_PAPER
+            elif tree.css_first(_LEXBOR_BLOG_CLASS) is not None:
+                category = DocumentCategory.BLOG_POST
+            else:
+                category = DocumentCategory.WEBPAGE_GENERAL
+
+        return SimpleDocument(
             id=doc_id,
             format=DocumentFormat.HTML,
-            category=category or self._infer_category(),
+            category=category,
             source=DocumentSource(
                 url=url,
                 file_path=file_path,
@@ -131,46 +538,148 @@ class HTMLParser:
             links=links,
         )
 
-        return document
+    def _collect(
+        self, events: Iterable[Tuple[str, etree._Element]]
+    ) -> _PageElements:
+        """
+        Collect the elements every extractor needs in a single pass.
+
+        Takes the ('start', 'end') events of one depth-first walk over the
+        tree, limited to _WALK_TAGS, and dispatches each element to the
+        list it belongs to, instead of one full search per extractor.
+        """
+        page = _PageElements()
+        non_content_depth = 0
+        figure_depth = 0
+        # [key, element, index of its first block] for unclosed landmarks
+        open_landmarks = []
+
+        for event, element in events:
+            tag = element.tag
+
+            if event == 'end':
+                if tag in _NON_CONTENT_TAGS:
+                    non_content_depth -= 1
+                elif tag == 'figure':
+                    figure_depth -= 1
+                for landmark in open_landmarks:
+                    if landmark[1] is element:
+                        key, _, start = landmark
+                        page.landmarks[key] = (element, start, len(page.blocks))
+                        open_landmarks.remove(landmark)
+                        break
+                continue
 
-    def _extract_metadata(self) -> DocumentMetadata:
+            # Metadata is read before script/style/noscript are emptied
+            if tag == 'title':
+                if page.title is None:
+                    page.title = element
+                continue
+            if tag == 'meta':
+                name = element.get('name')
+                if name is not None:
+                    page.meta_by_name.setdefault(name, element)
+                prop = element.get('property')
+                if prop is not None:
+                    page.meta_by_property.setdefault(prop, element)
+                continue
+
+            if tag in _NON_CONTENT_TAGS:
+                page.non_content.append(element)
+                non_content_depth += 1
+                continue
+            if tag == 'figure':
+                figure_depth += 1
+            if non_content_depth:
+                continue
+
+            if tag in _CONTENT_TAGS:
+                page.blocks.append(element)
+            elif tag == 'figure':
+                page.figures.append(element)
+            elif tag == 'img':
+                if not figure_depth:
+                    page.images.append(element)
+            elif tag == 'table':
+                page.tables.append(element)
+            elif tag == 'a':
+                if element.get('href') is not None:
+                    page.links.append(element)
+            else:
+                if tag == 'div':
+                    classes = (element.get('class') or '').translate(_ASCII_LOWER)
+                    if not any(word in classes for word in _CONTENT_DIV_WORDS):
+                        continue
+                    key = 'content_div'
+                else:
+                    key = tag
+                if key not in page.landmarks and all(
+                    landmark[0] != key for landmark in open_landmarks
+                ):
+                    open_landmarks.append([key, element, len(page.blocks)])
+
+        return page
+
+    def _extract_metadata(self, page: _PageElements) -> DocumentMetadata:
         """Extract metadata from HTML head."""
         metadata = DocumentMetadata()
 
         # Extract title
-        title_tag = self.soup.find('title')
-        if title_tag:
-            metadata.title = title_tag.get_text().strip()
+        if page.title is not None:
+            metadata.title = _text(page.title).strip()
 
         # Try to extract from meta tags
-        meta_author = self.soup.find('meta', attrs={'name': 'author'})
-        if meta_author and meta_author.get('content'):
-            author_name = meta_author['content']
+        meta_author = page.meta_by_name.get('author')
+        if meta_author is not None and meta_author.get('content'):
+            author_name = meta_author.get('content')
             metadata.authors = [Author(name=author_name)]
 
         # Try Open Graph title if no title found
         if not metadata.title:
-            og_title = self.soup.find('meta', attrs={'property': 'og:title'})
-            if og_title and og_title.get('content'):
-                metadata.title = og_title['content']
+            og_title = page.meta_by_property.get('og:title')
+            if og_title is not None and og_title.get('content'):
+                metadata.title = og_title.get('content')
 
         # Extract keywords from meta tags
-        meta_keywords = self.soup.find('meta', attrs={'name': 'keywords'})
-        if meta_keywords and meta_keywords.get('content'):
-            keywords = meta_keywords['content'].split(',')
+        meta_keywords = page.meta_by_name.get('keywords')
+        if meta_keywords is not None and meta_keywords.get('content'):
+            keywords = meta_keywords.get('content').split(',')
             metadata.keywords = [k.strip() for k in keywords if k.strip()]
 
         # Try to extract description as first keyword
-        meta_desc = self.soup.find('meta', attrs={'name': 'description'})
-        if meta_desc and meta_desc.get('content') and not metadata.keywords:
+        meta_desc = page.meta_by_name.get('description')
+        if meta_desc is not None and meta_desc.get('content') and not metadata.keywords:
             # Use first few words as keywords
-            desc = meta_desc['content']
+            desc = meta_desc.get('content')
             words = desc.split()[:5]
             metadata.keywords = [' '.join(words)]
 
         return metadata
 
-    def _extract_content(self) -> List[ContentElement]:
+    def _extract_all(
+        self,
+        page: _PageElements,
+        extract_images: bool = True,
+        extract_tables: bool = True,
+        extract_links: bool = True,
+    ) -> Tuple[List[ContentElement], List[Figure], List[Table], List[Link]]:
+        """
+        Build content, figures, tables and links from the collected elements.
+
+        Disabled extractors return empty lists.
+        """
+        # Remove script and style tags; each is emptied in place rather than
+        # dropped, so the text around it stays in separate text nodes
+        for tag in page.non_content:
+            tag.clear(keep_tail=True)
+
+        content = self._extract_content(page)
+        figures = self._extract_figures(page) if extract_images else []
+        tables = self._extract_tables(page) if extract_tables else []
+        links = self._extract_links(page) if extract_links else []
+        return content, figures, tables, links
+
+    def _extract_content(self, page: _PageElements) -> List[ContentElement]:
         """
         Extract main content elements (headings and paragraphs).
 
@@ -178,58 +687,56 @@ class HTMLParser:
         """
         content = []
 
-        # Remove script and style tags
-        for tag in self.soup(['script', 'style', 'noscript']):
-            tag.decompose()
-
         # Find main content area (prioritize semantic tags)
-        main_content = (
-            self.soup.find('main') or
-            self.soup.find('article') or
-            self.soup.find('div', class_=re.compile(r'content|main|article', re.I)) or
-            self.soup.find('body') or
-            self.soup
-        )
+        blocks = page.blocks
+        for key in ('main', 'article', 'content_div', 'body'):
+            if key in page.landmarks:
+                _, start, end = page.landmarks[key]
+                blocks = blocks[start:end]
+                break
 
         # Extract headings and paragraphs in order
-        for element in main_content.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p']):
-            text = self._get_clean_text(element)
-            if not text or len(text.strip()) < 3:
+        clean_text = self._get_clean_text
+        for element in blocks:
+            # Cleaned text is already stripped
+            text = clean_text(element)
+            if len(text) < 3:
                 continue
 
             element_id = self._get_element_id()
 
-            if element.name.startswith('h'):
-                # Heading
-                level = int(element.name[1])
+            # lxml builds .tag on every access; read it once
+            tag = element.tag
+            if tag == 'p':
+                # Paragraph
                 content.append(ContentElement(
                     id=element_id,
-                    type="heading",
+                    type="paragraph",
                     content=text,
-                    level=level,
                 ))
-            elif element.name == 'p':
-                # Paragraph
+            else:
+                # Heading (h1-h6)
                 content.append(ContentElement(
                     id=element_id,
-                    type="paragraph",
+                    type="heading",
                     content=text,
+                    level=int(tag[1]),
                 ))
 
         return content
 
-    def _extract_figures(self) -> List[Figure]:
+    def _extract_figures(self, page: _PageElements) -> List[Figure]:
         """Extract images and figures with captions."""
         figures = []
         fig_counter = 0
 
         # Method 1: Look for <figure> tags with <img> and <figcaption>
-        for figure_tag in self.soup.find_all('figure'):
-            img = figure_tag.find('img')
-            if img:
+        for figure_tag in page.figures:
+            img = _first(figure_tag.iterdescendants('img'))
+            if img is not None:
                 fig_counter += 1
-                caption_tag = figure_tag.find('figcaption')
-                caption = caption_tag.get_text().strip() if caption_tag else None
+                caption_tag = _first(figure_tag.iterdescendants('figcaption'))
+                caption = _text(caption_tag).strip() if caption_tag is not None else None
 
                 figures.append(Figure(
                     id=f"fig_{fig_counter}",
@@ -237,12 +744,8 @@ class HTMLParser:
                     label=f"Figure {fig_counter}" if caption else None,
                 ))
 
-        # Method 2: Standalone images with alt text
-        for img in self.soup.find_all('img'):
-            # Skip if already processed in a <figure>
-            if img.find_parent('figure'):
-                continue
-
+        # Method 2: Standalone images with alt text (not inside a <figure>)
+        for img in page.images:
             alt_text = img.get('alt', '').strip()
             if alt_text:
                 fig_counter += 1
@@ -253,27 +756,27 @@ class HTMLParser:
 
         return figures
 
-    def _extract_tables(self) -> List[Table]:
+    def _extract_tables(self, page: _PageElements) -> List[Table]:
         """Extract tables with cell data."""
         tables = []
+        clean_text = self._get_clean_text
 
-        for idx, table_tag in enumerate(self.soup.find_all('table'), start=1):
+        for idx, table_tag in enumerate(page.tables, start=1):
             rows = []
 
             # Extract caption if present
-            caption_tag = table_tag.find('caption')
-            caption = caption_tag.get_text().strip() if caption_tag else None
+            caption_tag = _first(table_tag.iterdescendants('caption'))
+            caption = _text(caption_tag).strip() if caption_tag is not None else None
 
             # Extract rows
-            for tr in table_tag.find_all('tr'):
-                cells = []
-                for cell in tr.find_all(['td', 'th']):
-                    cells.append(self._get_clean_text(cell))
+            for tr in table_tag.iterdescendants('tr'):
+                cells = [clean_text(cell) for cell in tr.iterdescendants('td', 'th')]
                 if cells:
                     rows.append(cells)
 
             if rows:
-                tables.append(Table(
+                # Cells are str lists built above; skip re-validating each one
+                tables.append(Table.model_construct(
                     id=f"table_{idx}",
                     caption=caption,
                     label=f"Table {idx}" if caption else None,
@@ -282,21 +785,21 @@ class HTMLParser:
 
         return tables
 
-    def _extract_links(self) -> List[Link]:
+    def _extract_links(self, page: _PageElements) -> List[Link]:
         """Extract hyperlinks with anchor text."""
         links = []
         seen_urls = set()
 
-        for idx, a_tag in enumerate(self.soup.find_all('a', href=True), start=1):
-            href = a_tag['href']
-            text = self._get_clean_text(a_tag)
+        for idx, a_tag in enumerate(page.links, start=1):
+            href = a_tag.get('href')
 
-            # Skip empty links or duplicates
-            if not text or href in seen_urls:
+            # Skip duplicates and internal anchors before reading anchor text
+            if href in seen_urls or href.startswith('#'):
                 continue
 
-            # Skip internal anchors
-            if href.startswith('#'):
+            # Skip empty links
+            text = self._get_clean_text(a_tag)
+            if not text:
                 continue
 
             seen_urls.add(href)
@@ -309,15 +812,11 @@ class HTMLParser:
 
         return links
 
-    def _get_clean_text(self, element: Tag) -> str:
+    def _get_clean_text(self, element: etree._Element) -> str:
         """Extract clean text from an element."""
-        if isinstance(element, NavigableString):
-            return str(element).strip()
-
-        text = element.get_text(separator=' ', strip=True)
-        # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        # Text nodes joined by spaces, with whitespace runs collapsed to one
+        # space; str.split() splits on the same characters as \s
+        return ' '.join(' '.join(_TEXT_NODES(element)).split())
 
     def _get_element_id(self) -> str:
         """Generate unique element ID."""
@@ -326,28 +825,30 @@ class HTMLParser:
 
     def _url_to_id(self, url: str) -> str:
         """Convert URL to a document ID."""
-        # Extract domain and path
+        # Extract domain and path; the scheme is removed wherever it occurs,
+        # so URLs embedded in a query string lose theirs too
         url = url.replace('https://', '').replace('http://', '')
-        url = url.replace('/', '_').replace('.', '_')
-        # Limit length
-        if len(url) > 50:
-            url = url[:50]
-        return url
+        # Separators to underscores in one pass, then limit length
+        return url.translate(_URL_ID_TABLE)[:50]
 
-    def _infer_category(self) -> Optional[DocumentCategory]:
+    def _infer_category(self, page: _PageElements) -> Optional[DocumentCategory]:
         """
         Attempt to infer document category from HTML structure.
 
         This is a simple heuristic - can be improved.
         """
         # Look for common indicators
-        if self.soup.find('article'):
+        if 'article' in page.landmarks:
+            # Every class attribute in the page, fetched in C and lowercased
+            # once; words have no spaces, so none can match across two values
+            classes = ' '.join(_CLASS_VALUES(self.tree)).translate(_ASCII_LOWER)
+
             # Check for academic paper indicators
-            if self.soup.find(class_=re.compile(r'abstract|citation|reference', re.I)):
+            if any(word in classes for word in _ACADEMIC_CLASS_WORDS):
                 return DocumentCategory.ACADEMIC_PAPER
 
             # Check for blog indicators
-            if self.soup.find(class_=re.compile(r'blog|post|author', re.I)):
+            if any(word in classes for word in _BLOG_CLASS_WORDS):
                 return DocumentCategory.BLOG_POST
 
             return DocumentCategory.WEBPAGE_GENERAL
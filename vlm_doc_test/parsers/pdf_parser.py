@@ -6,8 +6,10 @@ and visual elements from PDF documents with bounding box information.
 """
 
 import pymupdf as fitz
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 from datetime import datetime
 
 from ..schemas.schema_simple import (
@@ -22,6 +24,206 @@ from ..schemas.schema_simple import (
 from ..schemas.base import DocumentFormat, DocumentCategory, BoundingBox
 
 
+@lru_cache(maxsize=64)
+def _cached_page_count(path_str: str, mtime_ns: int, size: int) -> int:
+    """
+    Count the pages of a PDF once per (path, mtime, size).
+
+    The file's mtime and size are part of the key so a rewritten file is
+    counted again. Only the count is cached; the document is closed.
+    """
+    with fitz.open(path_str) as doc:
+        return len(doc)
+
+
+def _page_count(pdf_path: str) -> int:
+    """Return the cached page count for ``pdf_path``."""
+    path = Path(pdf_path).absolute()
+    stat = path.stat()
+    return _cached_page_count(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+# Minimum page count before content extraction is split across processes
+PARALLEL_MIN_PAGES = 4
+
+
+def _extract_page_content(page: fitz.Page, page_num: int) -> List[ContentElement]:
+    """Extract content elements from a single page (1-indexed page_num)."""
+    content = []
+
+    # Get text blocks with position information
+    blocks = page.get_text("dict", flags=fitz.TEXT_PRESERVE_WHITESPACE)
+
+    # One walk over the spans collects the page's font sizes (for heading
+    # detection) along with each text block's text and largest font size
+    font_sizes = []
+    add_size = font_sizes.append
+    block_summaries = []
+    for block_idx, block in enumerate(blocks.get("blocks", [])):
+        if block.get("type") != 0:  # Skip non-text blocks
+            continue
+
+        # Extract text from all lines in block; PyMuPDF always sets a
+        # span's text and size, so they are indexed rather than .get()
+        text_parts = []
+        add_text = text_parts.append
+        max_font_size = 0
+
+        for line in block.get("lines", []):
+            for span in line["spans"]:
+                size = span["size"]
+                add_size(size)
+                add_text(span["text"])
+                if size > max_font_size:
+                    max_font_size = size
+
+        text = " ".join(text_parts).strip()
+        if text:
+            block_summaries.append((block_idx, block, text, max_font_size))
+
+    # Average font size for this page
+    avg_font_size = sum(font_sizes) / len(font_sizes) if font_sizes else 12
+
+    # Classify each non-empty text block
+    for block_idx, block, text, max_font_size in block_summaries:
+        bbox_coords = block.get("bbox", [0, 0, 0, 0])
+        bbox = BoundingBox(
+            page=page_num,
+            x=bbox_coords[0],
+            y=bbox_coords[1],
+            width=bbox_coords[2] - bbox_coords[0],
+            height=bbox_coords[3] - bbox_coords[1],
+        )
+
+        # Detect if this is likely a heading (larger font size)
+        is_heading = max_font_size > avg_font_size * 1.2
+        element_type = "heading" if is_heading else "paragraph"
+
+        # Simple heading level detection (larger = higher level)
+        level = None
+        if is_heading:
+            size_ratio = max_font_size / avg_font_size
+            if size_ratio > 1.8:
+                level = 1
+            elif size_ratio > 1.4:
+                level = 2
+            else:
+                level = 3
+
+        content.append(ContentElement(
+            id=f"p{page_num}_b{block_idx}",
+            type=element_type,
+            content=text,
+            bbox=bbox,
+            level=level,
+        ))
+
+    return content
+
+
+def _extract_page_figures(page: fitz.Page, page_num: int) -> List[Figure]:
+    """Extract figures (images) from a single page (1-indexed page_num)."""
+    figures = []
+
+    # Get image list for this page
+    image_list = page.get_images(full=True)
+
+    for img_idx, img_info in enumerate(image_list):
+        xref = img_info[0]
+
+        # Get image bounding box
+        # Note: This gets the first occurrence of the image on the page
+        rects = page.get_image_rects(xref)
+        if rects:
+            rect = rects[0]
+            bbox = BoundingBox(
+                page=page_num,
+                x=rect.x0,
+                y=rect.y0,
+                width=rect.width,
+                height=rect.height,
+            )
+
+            figures.append(Figure(
+                id=f"fig_p{page_num}_i{img_idx}",
+                bbox=bbox,
+                # Caption and label detection would require more analysis
+            ))
+
+    return figures
+
+
+def _detect_page_tables(page: fitz.Page, page_num: int) -> List[Table]:
+    """Detect tables on a single page (1-indexed page_num)."""
+    tables = []
+
+    # Look for tables using find_tables() if available
+    try:
+        # PyMuPDF 1.23+ has find_tables()
+        page_tables = page.find_tables()
+
+        for tab_idx, table in enumerate(page_tables):
+            bbox_coords = table.bbox
+            bbox = BoundingBox(
+                page=page_num,
+                x=bbox_coords[0],
+                y=bbox_coords[1],
+                width=bbox_coords[2] - bbox_coords[0],
+                height=bbox_coords[3] - bbox_coords[1],
+            )
+
+            # Extract table data
+            rows = []
+            try:
+                table_data = table.extract()
+                rows = [[str(cell) if cell else "" for cell in row] for row in table_data]
+            except Exception:
+                pass
+
+            tables.append(Table(
+                id=f"tab_p{page_num}_t{tab_idx}",
+                bbox=bbox,
+                rows=rows,
+            ))
+    except AttributeError:
+        # Older PyMuPDF version without find_tables()
+        # Could implement basic table detection heuristics here
+        pass
+
+    return tables
+
+
+def _extract_page_range(
+    doc: fitz.Document,
+    start: int,
+    stop: int,
+    extract_images: bool,
+    extract_tables: bool,
+) -> Tuple[List[ContentElement], List[Figure], List[Table]]:
+    """Extract content, figures and tables for pages [start, stop) of doc."""
+    content, figures, tables = [], [], []
+    for page_idx in range(start, stop):
+        page = doc[page_idx]
+        content.extend(_extract_page_content(page, page_idx + 1))
+        if extract_images:
+            figures.extend(_extract_page_figures(page, page_idx + 1))
+        if extract_tables:
+            tables.extend(_detect_page_tables(page, page_idx + 1))
+    return content, figures, tables
+
+
+def _extract_pages_worker(
+    file_path: str,
+    page_range: tuple,
+    extract_images: bool,
+    extract_tables: bool,
+) -> Tuple[List[ContentElement], List[Figure], List[Table]]:
+    """Process-pool entry point: extract every element for pages [start, stop)."""
+    start, stop = page_range
+    with fitz.open(file_path) as doc:
+        return _extract_page_range(doc, start, stop, extract_images, extract_tables)
+
+
 class PDFParser:
     """
     PDF parser using PyMuPDF for text and structure extraction.
@@ -34,10 +236,18 @@ class PDFParser:
     - Table detection (simple approach)
     """
 
-    def __init__(self):
-        """Initialize the PDF parser."""
+    def __init__(self, num_page_workers: int = 1):
+        """
+        Initialize the PDF parser.
+
+        Args:
+            num_page_workers: Worker processes for page extraction (content,
+                figures and tables). 1 keeps extraction in-process; use e.g.
+                ``min(os.cpu_count() or 1, 4)`` for large documents.
+        """
         self.doc = None
         self.file_path = None
+        self.num_page_workers = num_page_workers
 
     def parse(
         self,
@@ -69,20 +279,27 @@ class PDFParser:
         doc_id = pdf_path.stem
 
         # Extract metadata
-        metadata = self._extract_metadata()
-
-        # Extract content elements (text blocks with structure)
-        content = self._extract_content()
-
-        # Extract figures
-        figures = []
-        if extract_images:
-            figures = self._extract_figures()
-
-        # Extract tables (basic detection for now)
-        tables = []
-        if extract_tables:
-            tables = self._detect_tables()
+        metadata = self._extract_metadata(self.doc)
+
+        page_count = len(self.doc)
+        if self.num_page_workers > 1 and page_count >= PARALLEL_MIN_PAGES:
+            # Content, figures and tables for each page range in one worker
+            content, figures, tables = self._extract_pages_parallel(
+                page_count, extract_images, extract_tables
+            )
+        else:
+            # Extract content elements (text blocks with structure)
+            content = self._extract_content()
+
+            # Extract figures
+            figures = []
+            if extract_images:
+                figures = self._extract_figures()
+
+            # Extract tables (basic detection for now)
+            tables = []
+            if extract_tables:
+                tables = self._detect_tables()
 
         # Create document
         document = SimpleDocument(
@@ -104,9 +321,75 @@ class PDFParser:
 
         return document
 
-    def _extract_metadata(self) -> DocumentMetadata:
+    def parse_iter(
+        self,
+        pdf_path: str,
+        chunk_size: int = 50,
+        extract_images: bool = True,
+        extract_tables: bool = True,
+        category: Optional[DocumentCategory] = None,
+    ) -> Iterator[SimpleDocument]:
+        """
+        Parse a PDF file incrementally, chunk_size pages at a time.
+
+        Each chunk is yielded as a partial SimpleDocument holding only that
+        chunk's content, figures and tables (the id, source and metadata are
+        those of the whole file), so peak memory grows with chunk_size
+        rather than with the page count, and the first pages can be used
+        before the last ones are parsed. Concatenating the chunks' elements
+        gives the same elements as parse().
+
+        Args:
+            pdf_path: Path to the PDF file
+            chunk_size: Pages per yielded chunk
+            extract_images: Whether to extract figure information
+            extract_tables: Whether to detect and extract tables
+            category: Optional document category (academic_paper, etc.)
+
+        Yields:
+            SimpleDocument per chunk of pages, in page order
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+
+        pdf_path = Path(pdf_path)
+        if not pdf_path.exists():
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+
+        file_path = str(pdf_path.absolute())
+        # A local handle rather than self.doc, so parse() may be called on
+        # this parser while the iterator is suspended
+        with fitz.open(file_path) as doc:
+            metadata = self._extract_metadata(doc)
+            page_count = len(doc)
+
+            for start in range(0, page_count, chunk_size):
+                content, figures, tables = _extract_page_range(
+                    doc,
+                    start,
+                    min(start + chunk_size, page_count),
+                    extract_images,
+                    extract_tables,
+                )
+                yield SimpleDocument(
+                    id=pdf_path.stem,
+                    format=DocumentFormat.PDF,
+                    category=category,
+                    source=DocumentSource(
+                        file_path=file_path,
+                        accessed_at=datetime.now(),
+                    ),
+                    metadata=metadata,
+                    content=content,
+                    figures=figures,
+                    tables=tables,
+                )
+                # Drop this chunk's elements before extracting the next one
+                del content, figures, tables
+
+    def _extract_metadata(self, doc: fitz.Document) -> DocumentMetadata:
         """Extract metadata from PDF."""
-        meta = self.doc.metadata
+        meta = doc.metadata
 
         # Parse authors if present
         authors = []
@@ -147,73 +430,44 @@ class PDFParser:
         and attempts to identify headings based on font size.
         """
         content = []
-
         for page_num, page in enumerate(self.doc, start=1):
-            # Get text blocks with position information
-            blocks = page.get_text("dict", flags=fitz.TEXT_PRESERVE_WHITESPACE)
-
-            # Calculate average font size for this page (for heading detection)
-            font_sizes = []
-            for block in blocks.get("blocks", []):
-                if block.get("type") == 0:  # Text block
-                    for line in block.get("lines", []):
-                        for span in line.get("spans", []):
-                            font_sizes.append(span.get("size", 12))
-
-            avg_font_size = sum(font_sizes) / len(font_sizes) if font_sizes else 12
-
-            # Process each text block
-            for block_idx, block in enumerate(blocks.get("blocks", [])):
-                if block.get("type") != 0:  # Skip non-text blocks
-                    continue
-
-                bbox_coords = block.get("bbox", [0, 0, 0, 0])
-                bbox = BoundingBox(
-                    page=page_num,
-                    x=bbox_coords[0],
-                    y=bbox_coords[1],
-                    width=bbox_coords[2] - bbox_coords[0],
-                    height=bbox_coords[3] - bbox_coords[1],
-                )
-
-                # Extract text from all lines in block
-                text_parts = []
-                max_font_size = 0
-
-                for line in block.get("lines", []):
-                    for span in line.get("spans", []):
-                        text_parts.append(span.get("text", ""))
-                        max_font_size = max(max_font_size, span.get("size", 12))
-
-                text = " ".join(text_parts).strip()
-                if not text:
-                    continue
-
-                # Detect if this is likely a heading (larger font size)
-                is_heading = max_font_size > avg_font_size * 1.2
-                element_type = "heading" if is_heading else "paragraph"
-
-                # Simple heading level detection (larger = higher level)
-                level = None
-                if is_heading:
-                    size_ratio = max_font_size / avg_font_size
-                    if size_ratio > 1.8:
-                        level = 1
-                    elif size_ratio > 1.4:
-                        level = 2
-                    else:
-                        level = 3
-
-                content.append(ContentElement(
-                    id=f"p{page_num}_b{block_idx}",
-                    type=element_type,
-                    content=text,
-                    bbox=bbox,
-                    level=level,
-                ))
+            content.extend(_extract_page_content(page, page_num))
 
         return content
 
+    def _extract_pages_parallel(
+        self,
+        page_count: int,
+        extract_images: bool,
+        extract_tables: bool,
+    ) -> Tuple[List[ContentElement], List[Figure], List[Table]]:
+        """
+        Extract content, figures and tables from contiguous page ranges in
+        worker processes, merged back in page order.
+        """
+        workers = min(self.num_page_workers, page_count)
+        step = -(-page_count // workers)  # ceil division
+        ranges = [
+            (start, min(start + step, page_count))
+            for start in range(0, page_count, step)
+        ]
+
+        # Documents are not picklable; each worker reopens the file
+        content, figures, tables = [], [], []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk in executor.map(
+                _extract_pages_worker,
+                [self.file_path] * len(ranges),
+                ranges,
+                [extract_images] * len(ranges),
+                [extract_tables] * len(ranges),
+            ):
+                content.extend(chunk[0])
+                figures.extend(chunk[1])
+                tables.extend(chunk[2])
+
+        return content, figures, tables
+
     def _extract_figures(self) -> List[Figure]:
         """
         Extract figures (images) from the PDF.
@@ -221,32 +475,8 @@ class PDFParser:
         Returns basic figure information with bounding boxes.
         """
         figures = []
-
         for page_num, page in enumerate(self.doc, start=1):
-            # Get image list for this page
-            image_list = page.get_images(full=True)
-
-            for img_idx, img_info in enumerate(image_list):
-                xref = img_info[0]
-
-                # Get image bounding box
-                # Note: This gets the first occurrence of the image on the page
-                rects = page.get_image_rects(xref)
-                if rects:
-                    rect = rects[0]
-                    bbox = BoundingBox(
-                        page=page_num,
-                        x=rect.x0,
-                        y=rect.y0,
-                        width=rect.width,
-                        height=rect.height,
-                    )
-
-                    figures.append(Figure(
-                        id=f"fig_p{page_num}_i{img_idx}",
-                        bbox=bbox,
-                        # Caption and label detection would require more analysis
-                    ))
+            figures.extend(_extract_page_figures(page, page_num))
 
         return figures
 
@@ -258,58 +488,19 @@ class PDFParser:
         consider using pdfplumber or dedicated table extraction tools.
         """
         tables = []
-
         for page_num, page in enumerate(self.doc, start=1):
-            # Look for tables using find_tables() if available
-            try:
-                # PyMuPDF 1.23+ has find_tables()
-                page_tables = page.find_tables()
-
-                for tab_idx, table in enumerate(page_tables):
-                    bbox_coords = table.bbox
-                    bbox = BoundingBox(
-                        page=page_num,
-                        x=bbox_coords[0],
-                        y=bbox_coords[1],
-                        width=bbox_coords[2] - bbox_coords[0],
-                        height=bbox_coords[3] - bbox_coords[1],
-                    )
-
-                    # Extract table data
-                    rows = []
-                    try:
-                        table_data = table.extract()
-                        rows = [[str(cell) if cell else "" for cell in row] for row in table_data]
-                    except Exception:
-                        pass
-
-                    tables.append(Table(
-                        id=f"tab_p{page_num}_t{tab_idx}",
-                        bbox=bbox,
-                        rows=rows,
-                    ))
-            except AttributeError:
-                # Older PyMuPDF version without find_tables()
-                # Could implement basic table detection heuristics here
-                pass
+            tables.extend(_detect_page_tables(page, page_num))
 
         return tables
 
     def get_page_count(self, pdf_path: str) -> int:
         """Get the number of pages in a PDF without full parsing."""
-        doc = fitz.open(pdf_path)
-        count = len(doc)
-        doc.close()
-        return count
+        return _page_count(pdf_path)
 
     def extract_page_text(self, pdf_path: str, page_num: int) -> str:
         """Extract plain text from a specific page (1-indexed)."""
-        doc = fitz.open(pdf_path)
-        if page_num < 1 or page_num > len(doc):
-            doc.close()
-            raise ValueError(f"Page {page_num} out of range (1-{len(doc)})")
-
-        page = doc[page_num - 1]
-        text = page.get_text()
-        doc.close()
-        return text
+        with fitz.open(pdf_path) as doc:
+            if page_num < 1 or page_num > len(doc):
+                raise ValueError(f"Page {page_num} out of range (1-{len(doc)})")
+
+            return doc[page_num - 1].get_text()
@@ -1,13 +1,16 @@
 """
-Enhanced table extraction using pdfplumber.
+Enhanced table extraction using PyMuPDF or pdfplumber.
 
-This module provides advanced table extraction capabilities
-beyond basic PyMuPDF table detection.
+This module provides configurable table extraction beyond the basic
+table detection in PDFParser. PyMuPDF's find_tables() is a port of
+pdfplumber's table finder, so both backends take the same settings.
 """
 
 import pdfplumber
+import pymupdf as fitz
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Sequence
 from dataclasses import dataclass
 
 from ..schemas.schema_simple import Table
@@ -30,20 +33,44 @@ class TableSettings:
 
 class TableExtractor:
     """
-    Enhanced table extractor using pdfplumber.
+    Enhanced table extractor using PyMuPDF or pdfplumber.
 
-    Provides more accurate table extraction than basic PyMuPDF,
-    especially for tables without explicit borders.
+    Provides configurable line- and text-based table extraction;
+    text-based extraction of tables without explicit borders always
+    uses pdfplumber.
     """
 
-    def __init__(self, settings: Optional[TableSettings] = None):
+    def __init__(self, settings: Optional[TableSettings] = None, backend: str = "pymupdf"):
         """
         Initialize table extractor.
 
         Args:
             settings: Table extraction settings
+            backend: "pymupdf" (text and drawings read by MuPDF in C) or
+                "pdfplumber" (pdfminer-based, pure Python)
         """
+        if backend not in ("pymupdf", "pdfplumber"):
+            raise ValueError(f"Unknown table extraction backend: {backend}")
         self.settings = settings or TableSettings()
+        self.backend = backend
+
+    @contextmanager
+    def _open_pages(self, pdf_path: Path) -> Iterator[Sequence[Any]]:
+        """Open a PDF with the configured backend and yield its pages."""
+        if self.backend == "pymupdf":
+            with fitz.open(pdf_path) as doc:
+                yield doc
+        else:
+            with pdfplumber.open(pdf_path) as pdf:
+                yield pdf.pages
+
+    def _find_tables(self, page, table_settings: Dict[str, Any], clip: Optional[tuple] = None):
+        """Find tables on a backend page, optionally within clip (x0, y0, x1, y1)."""
+        if self.backend == "pymupdf":
+            return page.find_tables(clip=clip, **table_settings).tables
+        if clip is not None:
+            page = page.crop(clip)
+        return page.find_tables(table_settings=table_settings)
 
     def extract_tables_from_pdf(
         self,
@@ -62,20 +89,20 @@ class TableExtractor:
         """
         tables = []
 
-        with pdfplumber.open(pdf_path) as pdf:
+        with self._open_pages(pdf_path) as pdf_pages:
             # Determine which pages to process
             if pages is None:
-                pages_to_process = range(len(pdf.pages))
+                pages_to_process = range(len(pdf_pages))
             else:
                 pages_to_process = [p - 1 for p in pages]  # Convert to 0-indexed
 
             table_counter = 0
 
             for page_idx in pages_to_process:
-                if page_idx >= len(pdf.pages):
+                if page_idx >= len(pdf_pages):
                     continue
 
-                page = pdf.pages[page_idx]
+                page = pdf_pages[page_idx]
                 page_tables = self._extract_from_page(page, page_idx + 1)
 
                 for table in page_tables:
@@ -103,7 +130,7 @@ class TableExtractor:
         }
 
         # Find tables on page
-        page_tables = page.find_tables(table_settings=table_settings)
+        page_tables = self._find_tables(page, table_settings)
 
         for idx, table_obj in enumerate(page_tables):
             # Extract table data
@@ -156,22 +183,19 @@ class TableExtractor:
         Returns:
             Extracted table or None
         """
-        with pdfplumber.open(pdf_path) as pdf:
-            if page < 1 or page > len(pdf.pages):
+        with self._open_pages(pdf_path) as pdf_pages:
+            if page < 1 or page > len(pdf_pages):
                 return None
 
-            pdf_page = pdf.pages[page - 1]
+            pdf_page = pdf_pages[page - 1]
 
-            # Crop page to region
-            cropped = pdf_page.crop(bbox)
-
-            # Extract table
+            # Extract table, limited to the region
             table_settings = {
                 "vertical_strategy": self.settings.vertical_strategy,
                 "horizontal_strategy": self.settings.horizontal_strategy,
             }
 
-            tables = cropped.find_tables(table_settings=table_settings)
+            tables = self._find_tables(pdf_page, table_settings, clip=bbox)
 
             if not tables:
                 return None
@@ -222,18 +246,18 @@ class TableExtractor:
         """
         regions = []
 
-        with pdfplumber.open(pdf_path) as pdf:
-            if page < 1 or page > len(pdf.pages):
+        with self._open_pages(pdf_path) as pdf_pages:
+            if page < 1 or page > len(pdf_pages):
                 return regions
 
-            pdf_page = pdf.pages[page - 1]
+            pdf_page = pdf_pages[page - 1]
 
             table_settings = {
                 "vertical_strategy": self.settings.vertical_strategy,
                 "horizontal_strategy": self.settings.horizontal_strategy,
             }
 
-            tables = pdf_page.find_tables(table_settings=table_settings)
+            tables = self._find_tables(pdf_page, table_settings)
 
             for table_obj in tables:
                 regions.append(table_obj.bbox)
@@ -248,7 +272,8 @@ class TableExtractor:
         """
         Extract tables using text-based strategy.
 
-        Useful for tables without borders.
+        Useful for tables without borders. Always uses the pdfplumber
+        backend, whose text-based detection is the more accurate one.
 
         Args:
             pdf_path: Path to PDF
@@ -260,9 +285,11 @@ class TableExtractor:
         # Temporarily change settings
         old_vertical = self.settings.vertical_strategy
         old_horizontal = self.settings.horizontal_strategy
+        old_backend = self.backend
 
         self.settings.vertical_strategy = "text"
         self.settings.horizontal_strategy = "text"
+        self.backend = "pdfplumber"
 
         try:
             return self.extract_tables_from_pdf(pdf_path, pages)
@@ -270,3 +297,4 @@ class TableExtractor:
             # Restore settings
             self.settings.vertical_strategy = old_vertical
             self.settings.horizontal_strategy = old_horizontal
+            self.backend = old_backend
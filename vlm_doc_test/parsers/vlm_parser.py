@@ -6,12 +6,19 @@ and extract structured information. This is the "vision" approach that should
 be compared against tool-based extraction.
 """
 
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Union, List
+from typing import Any, Dict, Optional, Tuple, Union, List
 from datetime import datetime
 import subprocess
+import hashlib
 import json
 import base64
+import queue
+import re
+import threading
+
+from pydantic import TypeAdapter, ValidationError
 
 from ..schemas.schema_simple import (
     SimpleDocument,
@@ -26,6 +33,17 @@ from ..schemas.schema_simple import (
 from ..schemas.base import DocumentFormat, DocumentCategory
 
 
+# VLM responses are free-form JSON objects; the validator is built once
+# and parses bytes or str directly
+_VLM_RESPONSE_ADAPTER = TypeAdapter(Dict[str, Any])
+
+# Fallback for responses that wrap the JSON object in prose
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+# Maximum VLM responses kept per parser, keyed on image content and prompt
+RESPONSE_CACHE_SIZE = 256
+
+
 class VLMParser:
     """
     Vision Language Model parser using GLM-4.6V.
@@ -45,6 +63,8 @@ class VLMParser:
         """
         self.api_key = api_key or self._get_api_key_from_config()
         self.mode = mode
+        self._response_cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self._response_cache_lock = threading.Lock()
 
     def _get_api_key_from_config(self) -> Optional[str]:
         """Try to read API key from zai_glmV_mcp.json config."""
@@ -82,13 +102,126 @@ class VLMParser:
         prompt = self._build_extraction_prompt(category)
 
         # Call VLM via MCP
-        vlm_response = self._call_vlm_mcp(image_path, prompt)
+        vlm_response = self._analyze_image(image_path, prompt)
 
         # Parse VLM response into structured document
         document = self._parse_vlm_response(vlm_response, image_path, category)
 
         return document
 
+    def parse_batch(
+        self,
+        pdf_paths: List[Union[str, Path]],
+        output_dir: Union[str, Path],
+        category: Optional[DocumentCategory] = None,
+        dpi: int = 150,
+        max_in_flight: int = 4,
+        queue_size: int = 4,
+    ) -> List[SimpleDocument]:
+        """
+        Parse the pages of many PDFs as a render -> VLM -> parse pipeline.
+
+        Page rendering, VLM requests and response parsing each run in their
+        own thread(s), connected by bounded queues, so throughput is limited
+        by the slowest stage rather than the sum of all three.
+
+        Args:
+            pdf_paths: PDF files to parse
+            output_dir: Directory for the rendered page images
+            category: Document category hint for better extraction
+            dpi: Rendering resolution
+            max_in_flight: Concurrent VLM requests
+            queue_size: Capacity of each inter-stage queue
+
+        Returns:
+            One SimpleDocument per page, in (PDF, page) order
+
+        Raises:
+            The first exception raised by any stage
+        """
+        import pymupdf as fitz
+
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        prompt = self._build_extraction_prompt(category)
+
+        render_q: queue.Queue = queue.Queue(maxsize=queue_size)
+        vlm_q: queue.Queue = queue.Queue(maxsize=queue_size)
+        failed = threading.Event()
+        errors: List[Exception] = []
+
+        def fail(error: Exception):
+            errors.append(error)
+            failed.set()
+
+        # Every stage keeps draining its input after a failure so that no
+        # producer is left blocked on a full queue.
+        def render():
+            try:
+                for pdf_idx, pdf_path in enumerate(pdf_paths):
+                    pdf_path = Path(pdf_path)
+                    with fitz.open(pdf_path) as doc:
+                        for page in doc:
+                            if failed.is_set():
+                                return
+                            image_path = output_dir / (
+                                f"{pdf_idx}_{pdf_path.stem}_p{page.number + 1}.png"
+                            )
+                            page.get_pixmap(dpi=dpi).save(str(image_path))
+                            render_q.put(((pdf_idx, page.number), image_path))
+            except Exception as e:
+                fail(e)
+            finally:
+                for _ in range(max_in_flight):
+                    render_q.put(None)
+
+        def analyze():
+            try:
+                while (item := render_q.get()) is not None:
+                    if failed.is_set():
+                        continue
+                    key, image_path = item
+                    try:
+                        response = self._analyze_image(image_path, prompt)
+                    except Exception as e:
+                        fail(e)
+                        continue
+                    vlm_q.put((key, image_path, response))
+            finally:
+                vlm_q.put(None)
+
+        threads = [threading.Thread(target=render, daemon=True)]
+        threads += [
+            threading.Thread(target=analyze, daemon=True)
+            for _ in range(max_in_flight)
+        ]
+        for thread in threads:
+            thread.start()
+
+        # Final stage: parse responses on the calling thread
+        documents = {}
+        finished = 0
+        while finished < max_in_flight:
+            item = vlm_q.get()
+            if item is None:
+                finished += 1
+                continue
+            if failed.is_set():
+                continue
+            key, image_path, response = item
+            try:
+                documents[key] = self._parse_vlm_response(response, image_path, category)
+            except Exception as e:
+                fail(e)
+
+        for thread in threads:
+            thread.join()
+
+        if errors:
+            raise errors[0]
+
+        return [documents[key] for key in sorted(documents)]
+
     def _build_extraction_prompt(self, category: Optional[DocumentCategory]) -> str:
         """
         Build extraction prompt based on document category.
@@ -159,6 +292,27 @@ This is TECHNICAL DOCUMENTATION. Focus on:
 
         return base_prompt
 
+    def _analyze_image(self, image_path: Path, prompt: str) -> str:
+        """
+        Call the VLM, reusing the response for identical image content.
+
+        Re-running the same image and prompt (e.g. repeated test runs)
+        returns the cached response instead of issuing another request.
+        """
+        key = (hashlib.sha256(image_path.read_bytes()).hexdigest(), prompt)
+        with self._response_cache_lock:
+            if key in self._response_cache:
+                self._response_cache.move_to_end(key)
+                return self._response_cache[key]
+
+        response = self._call_vlm_mcp(image_path, prompt)
+
+        with self._response_cache_lock:
+            self._response_cache[key] = response
+            if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+        return response
+
     def _call_vlm_mcp(self, image_path: Path, prompt: str) -> str:
         """
         Call Z.AI Vision MCP Server to analyze image.
@@ -196,14 +350,13 @@ This is TECHNICAL DOCUMENTATION. Focus on:
         Parse VLM JSON response into SimpleDocument structure.
         """
         try:
-            data = json.loads(vlm_response)
-        except json.JSONDecodeError:
+            data = _VLM_RESPONSE_ADAPTER.validate_json(vlm_response)
+        except ValidationError:
             # VLM might return text with JSON embedded
             # Try to extract JSON
-            import re
-            json_match = re.search(r'\{.*\}', vlm_response, re.DOTALL)
+            json_match = _JSON_OBJECT_RE.search(vlm_response)
             if json_match:
-                data = json.loads(json_match.group())
+                data = _VLM_RESPONSE_ADAPTER.validate_json(json_match.group())
             else:
                 raise ValueError("Could not parse VLM response as JSON")
 
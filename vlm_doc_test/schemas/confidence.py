@@ -6,8 +6,8 @@ when to escalate from fast local parsers to expensive VLM analysis.
 """
 
 from enum import Enum
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from typing import Optional, List, Dict, Any, Tuple
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ConfidenceLevel(str, Enum):
@@ -32,6 +32,9 @@ class ConfidenceLevel(str, Enum):
 
 class TextQualityMetrics(BaseModel):
     """Metrics for text extraction quality."""
+    # Immutable values: cached page confidences share them between results
+    model_config = ConfigDict(frozen=True)
+
     # Character-level metrics
     alphanumeric_ratio: float = Field(
         default=1.0,
@@ -71,6 +74,8 @@ class TextQualityMetrics(BaseModel):
 
 class LayoutMetrics(BaseModel):
     """Metrics for layout complexity and extraction reliability."""
+    model_config = ConfigDict(frozen=True)
+
     # Complexity indicators
     x_position_variance: float = Field(
         default=0.0,
@@ -96,6 +101,8 @@ class LayoutMetrics(BaseModel):
 
 class TableConfidenceMetrics(BaseModel):
     """Metrics for table extraction confidence."""
+    model_config = ConfigDict(frozen=True)
+
     has_visible_borders: bool = Field(
         default=False,
         description="Whether table has visible cell borders"
@@ -119,6 +126,8 @@ class TableConfidenceMetrics(BaseModel):
 
 class FigureConfidenceMetrics(BaseModel):
     """Metrics for figure/image extraction confidence."""
+    model_config = ConfigDict(frozen=True)
+
     has_caption: bool = Field(default=False)
     has_label: bool = Field(default=False)
     bbox_valid: bool = Field(
@@ -133,6 +142,10 @@ class FigureConfidenceMetrics(BaseModel):
 
 class PageConfidence(BaseModel):
     """Confidence metrics for a single page."""
+    # Immutable (issues is a tuple): the calculator's page cache hands the
+    # same page confidence to every result for that page
+    model_config = ConfigDict(frozen=True)
+
     page_number: int = Field(ge=1)
 
     # Component scores (0.0 - 1.0)
@@ -153,9 +166,9 @@ class PageConfidence(BaseModel):
         default=False,
         description="Whether this page needs VLM analysis"
     )
-    issues: List[str] = Field(
-        default_factory=list,
-        description="List of detected issues"
+    issues: Tuple[str, ...] = Field(
+        default_factory=tuple,
+        description="Detected issues"
     )
 
     @property
@@ -7,6 +7,7 @@ Tests confidence calculation, escalation logic, and adaptive parsing behavior.
 import pytest
 from pathlib import Path
 from datetime import datetime
+import numpy as np
 import pymupdf as fitz
 
 from ..schemas.schema_simple import (
@@ -40,6 +41,7 @@ from ..parsers.adaptive_config import (
 from ..parsers.adaptive_parser import (
     AdaptivePDFParser,
     AdaptiveResult,
+    BatchAdaptiveResults,
     ParserAttempt,
     parse_pdf_adaptive,
 )
@@ -212,6 +214,24 @@ def poor_quality_document():
     )
 
 
+def _paged_document(texts, pages):
+    """Build a document with one content element per page, cycling texts."""
+    return SimpleDocument(
+        id="paged",
+        format=DocumentFormat.PDF,
+        source=DocumentSource(file_path="paged.pdf", accessed_at=datetime.now()),
+        content=[
+            ContentElement(
+                id=f"c{page}",
+                type="paragraph",
+                content=texts[(page - 1) % len(texts)],
+                bbox=BoundingBox(page=page, x=50, y=50, width=400, height=20),
+            )
+            for page in range(1, pages + 1)
+        ],
+    )
+
+
 # =============================================================================
 # Tests for ConfidenceLevel
 # =============================================================================
@@ -367,6 +387,321 @@ class TestConfidenceCalculator:
         assert len(confidence.page_confidences) >= 1
         assert all(pc.page_number >= 1 for pc in confidence.page_confidences)
 
+    @pytest.mark.parametrize("count", [3, 100, 300])
+    def test_overlapping_blocks_detected_per_page(self, count):
+        """Overlap should be found within a page, but not across pages."""
+        def elem(i, page, y):
+            return ContentElement(
+                id=f"e{i}", type="paragraph", content="text",
+                bbox=BoundingBox(page=page, x=50, y=y, width=400, height=20),
+            )
+
+        calculator = ConfidenceCalculator()
+        stacked = [elem(i, 1, i * 30) for i in range(count)]
+        assert not calculator._check_overlapping_blocks(stacked)
+
+        other_page = stacked + [elem(count, 2, 5)]
+        assert not calculator._check_overlapping_blocks(other_page)
+
+        same_page = stacked + [elem(count, 1, (count - 1) * 30 + 20)]
+        assert calculator._check_overlapping_blocks(same_page)
+
+    def test_overlap_sweep_kernel_matches_numpy(self, monkeypatch):
+        """The JIT overlap sweep should agree with the NumPy fallback."""
+        from ..parsers import confidence_calculator
+        from ..parsers.confidence_calculator import _page_has_overlap, OVERLAP_JIT_MIN
+
+        rng = np.random.default_rng(0)
+        pages = []
+        for n in (OVERLAP_JIT_MIN, 300, 1000):
+            for spacing in (20.0, 25.0):
+                x0 = rng.choice([50.0, 320.0], size=n)
+                y0 = np.arange(n) * spacing + rng.uniform(0, 4, size=n)
+                pages.append(np.column_stack((x0, y0, x0 + 240, y0 + 20)))
+
+        jit_results = [_page_has_overlap(rects) for rects in pages]
+        monkeypatch.setattr(confidence_calculator, "_overlap_sweep_kernel", lambda: None)
+        assert jit_results == [_page_has_overlap(rects) for rects in pages]
+        assert True in jit_results and False in jit_results
+
+    def test_layout_variance_detects_columns(self):
+        """x-position variance should match the sample variance and flag columns."""
+        import statistics
+
+        def elements(xs):
+            return [
+                ContentElement(
+                    id=f"e{i}", type="paragraph", content="text",
+                    bbox=BoundingBox(page=1, x=x, y=i * 30, width=200, height=20),
+                )
+                for i, x in enumerate(xs)
+            ]
+
+        calculator = ConfidenceCalculator()
+        two_columns = [50, 320, 50, 320, 50.5, 319.5]
+        metrics = calculator._calculate_layout_metrics(elements(two_columns))
+        assert metrics.x_position_variance == pytest.approx(statistics.variance(two_columns))
+        assert metrics.has_multi_column
+
+        single = calculator._calculate_layout_metrics(elements([50, 52, 50]))
+        assert not single.has_multi_column
+
+    def test_tables_and_figures_scored_on_their_pages(self):
+        """Only a page's own tables and figures affect its scores."""
+        document = _paged_document(["Readable text of ordinary words."], 3)
+        document.tables = [
+            Table(id="t1", rows=[["", ""], ["", ""]],
+                  bbox=BoundingBox(page=2, x=50, y=300, width=400, height=100)),
+            Table(id="t2", rows=[["a", "b"], ["c", "d"]]),
+        ]
+        document.figures = [
+            Figure(id="f1", caption="A figure",
+                   bbox=BoundingBox(page=3, x=50, y=300, width=400, height=100)),
+        ]
+
+        pages = ConfidenceCalculator().calculate(document).page_confidences
+        assert [pc.table_score is not None for pc in pages] == [False, True, False]
+        assert [pc.figure_score is not None for pc in pages] == [False, False, True]
+
+    def test_tables_out_of_page_order_are_grouped(self):
+        """Tables listed out of page order should still land on their pages."""
+        document = _paged_document(["Readable text of ordinary words."], 3)
+        document.tables = [
+            Table(id=f"t{page}", rows=[["a", "b"], ["c", "d"]],
+                  bbox=BoundingBox(page=page, x=50, y=300, width=400, height=100))
+            for page in (3, 1, 3)
+        ]
+
+        pages = ConfidenceCalculator().calculate(document).page_confidences
+        assert [pc.table_score is not None for pc in pages] == [True, False, True]
+
+    def test_issues_deduplicated_in_page_order(self):
+        """Document issues keep the order of the pages that raised them."""
+        document = _paged_document(["\ufffd\ufffd x", "Readable text of ordinary words."], 4)
+        confidence = ConfidenceCalculator().calculate(document)
+
+        page_issues = [i for pc in confidence.page_confidences for i in pc.issues]
+        assert confidence.issues == list(dict.fromkeys(page_issues))
+        assert confidence.issues[0].startswith("Page 1:")
+
+    def test_group_content_by_page_sorts_only_out_of_order_pages(self):
+        """Pages come back ascending, keeping reading order within a page."""
+        document = _paged_document(["text"], 4)
+        document.content = [document.content[i] for i in (2, 0, 3, 1)] + [
+            ContentElement(id="late", type="paragraph", content="text",
+                           bbox=BoundingBox(page=1, x=50, y=90, width=400, height=20)),
+            ContentElement(id="nobox", type="paragraph", content="text"),
+        ]
+
+        calculator = ConfidenceCalculator()
+        pages = calculator._group_content_by_page(document)
+        assert list(pages) == [1, 2, 3, 4]
+        assert [e.id for e in pages[1]] == ["c1", "late", "nobox"]
+        assert [pc.page_number for pc in calculator.calculate(document).page_confidences] == [
+            1, 2, 3, 4,
+        ]
+
+    def test_multi_column_needs_two_histogram_peaks(self):
+        """Columns are histogram peaks, not just spread-out x positions."""
+        def elements(xs):
+            return [
+                ContentElement(
+                    id=f"e{i}", type="paragraph", content="text",
+                    bbox=BoundingBox(page=1, x=x, y=i * 30, width=100, height=20),
+                )
+                for i, x in enumerate(xs)
+            ]
+
+        calculator = ConfidenceCalculator()
+        # Left column straddles a bin edge
+        straddling = calculator._calculate_layout_metrics(elements([56, 57, 320] * 3))
+        assert straddling.has_multi_column
+
+        # Evenly scattered blocks have high variance but no columns
+        scattered = calculator._calculate_layout_metrics(elements(range(0, 600, 20)))
+        assert scattered.x_position_variance / 600 ** 2 > 0.02
+        assert not scattered.has_multi_column
+
+        # A centered heading above a single column is not a second column
+        centered = calculator._calculate_layout_metrics(elements([250] + [50] * 6))
+        assert not centered.has_multi_column
+
+        # Nor is an indented list next to the body text
+        indented = calculator._calculate_layout_metrics(elements([50, 90] * 4))
+        assert not indented.has_multi_column
+
+    def test_batched_page_layout_matches_single_pages(self):
+        """Layout computed for all pages at once should match page-by-page."""
+        content = [
+            ContentElement(
+                id=f"e{i}", type="heading" if i % 4 == 0 else "paragraph", content="text",
+                bbox=None if i % 5 == 0 else BoundingBox(
+                    page=i % 3 + 1, x=50 + (i % 2) * 270, y=(i % 7) * 25,
+                    width=240, height=30,
+                ),
+            )
+            for i in range(40)
+        ]
+        document = SimpleDocument(
+            id="layout",
+            format=DocumentFormat.PDF,
+            source=DocumentSource(file_path="layout.pdf", accessed_at=datetime.now()),
+            content=content,
+        )
+
+        calculator = ConfidenceCalculator()
+        pages = calculator._group_content_by_page(document)
+        confidence = calculator.calculate(document)
+        for page_conf in confidence.page_confidences:
+            expected = calculator._calculate_layout_metrics(pages[page_conf.page_number])
+            assert page_conf.layout_metrics.heading_count == expected.heading_count
+            assert page_conf.layout_metrics.x_position_variance == pytest.approx(
+                expected.x_position_variance
+            )
+            assert page_conf.layout_metrics.has_multi_column == expected.has_multi_column
+            assert (
+                page_conf.layout_metrics.has_overlapping_blocks
+                == expected.has_overlapping_blocks
+            )
+
+    def test_table_score_counts_blank_cells_and_ragged_rows(self):
+        """Whitespace-only cells count as empty; ragged rows lower the score."""
+        calculator = ConfidenceCalculator()
+
+        blank = Table(id="t1", rows=[["a", " ", "\t"], ["b", "", "c"]])
+        ragged = Table(id="t2", rows=[["a", "b"], ["c"], ["d", "e", "f"]])
+
+        assert calculator._calculate_single_table_score(blank) == pytest.approx(0.85)
+        assert calculator._calculate_single_table_score(ragged) == pytest.approx(0.7)
+
+        # The most common width need not be the first row's
+        wide_first = Table(id="t3", rows=[["a", "b", "c"], ["d", "e"], ["f", "g"], ["h", "i"]])
+        assert calculator._calculate_single_table_score(wide_first) == pytest.approx(0.7)
+        single_row = Table(id="t4", rows=[["a", "", "c"]])
+        assert calculator._calculate_single_table_score(single_row) == pytest.approx(0.75)
+
+    def test_word_metrics_match_per_word_definitions(self):
+        """Word metrics should match the per-word definitions on split() words."""
+        text = "Broken  - words , like _ this — and \U0001f600 but a 1 ok !?"
+        metrics = ConfidenceCalculator()._calculate_text_metrics([
+            ContentElement(id="c1", type="paragraph", content=text),
+        ])
+
+        words = text.split()
+        broken = sum(1 for w in words if len(w) == 1 and not w.isalnum())
+        assert metrics.broken_word_ratio == pytest.approx(broken / len(words))
+        assert metrics.avg_word_length == pytest.approx(
+            sum(len(w) for w in words) / len(words)
+        )
+
+    def test_char_class_counts_match_str_predicates(self):
+        """Fast character counting should match the per-character definitions."""
+        from ..parsers.confidence_calculator import _count_char_classes
+
+        chars = ConfidenceCalculator.REPLACEMENT_CHARS
+        for text in (
+            "Plain ASCII text, 42 words\tand\x1ccontrol\n",
+            "  leading and trailing whitespace  ",
+            "- a . _ , ! b -- x ;",
+            "Ünïcödé text\u00a0with\u2003spaces \ufffd and \x00 nulls",
+            "数据 snake_case ²³ ٣ emoji \U0001f600 lone \ud800 surrogate",
+        ):
+            expected = (
+                sum(1 for c in text if c.isalnum()),
+                sum(1 for c in text if c.isspace()),
+                sum(1 for c in text if c in chars),
+                len(text.split()),
+                sum(1 for w in text.split() if len(w) == 1 and not w.isalnum()),
+            )
+            assert _count_char_classes(text, chars) == expected
+
+    def test_page_workers_match_inline_scoring(self):
+        """Scoring pages in worker processes should give identical results."""
+        from ..parsers.confidence_calculator import PARALLEL_PAGE_MIN
+
+        document = _paged_document(
+            ["A readable paragraph of ordinary words.", "@@ ## $$ %%"],
+            pages=PARALLEL_PAGE_MIN,
+        )
+        inline = ConfidenceCalculator().calculate(document)
+        with ConfidenceCalculator(page_workers=2) as calculator:
+            parallel = calculator.calculate(document)
+            assert calculator._page_pool is not None
+
+        assert calculator._page_pool is None
+        assert parallel.page_confidences == inline.page_confidences
+        assert parallel.overall_score == inline.overall_score
+
+    def test_calculate_rescores_only_changed_pages(self):
+        """Unchanged pages should come from the page cache."""
+        calculator = ConfidenceCalculator()
+        scored_pages = []
+        original = calculator._calculate_page_confidence
+
+        def counting(page_num, **kwargs):
+            scored_pages.append(page_num)
+            return original(page_num=page_num, **kwargs)
+
+        calculator._calculate_page_confidence = counting
+
+        document = _paged_document(["A readable paragraph of ordinary words."], pages=6)
+        first = calculator.calculate(document)
+        assert sorted(scored_pages) == [1, 2, 3, 4, 5, 6]
+
+        scored_pages.clear()
+        changed = document.model_copy(deep=True)
+        changed.content[2].content = "@@ ## $$ %%"
+        second = calculator.calculate(changed)
+
+        assert scored_pages == [3]
+        assert second == ConfidenceCalculator().calculate(changed)
+        assert second.page_confidences[2] != first.page_confidences[2]
+
+    def test_cached_pages_cannot_leak_between_results(self):
+        """Edits to one result must not show up in later cached results."""
+        from pydantic import ValidationError
+
+        calculator = ConfidenceCalculator()
+        document = _paged_document(["A readable paragraph of ordinary words."], pages=2)
+        first = calculator.calculate(document)
+        expected = first.model_dump()
+
+        page = first.page_confidences[0]
+        with pytest.raises(AttributeError):
+            page.issues.append("X")
+        with pytest.raises(ValidationError):
+            page.overall_score = 0.0
+        first.page_confidences.pop()
+        first.issues.append("X")
+
+        assert calculator.calculate(document).model_dump() == expected
+
+    def test_content_score_reuses_page_text_counts(self):
+        """The document's text should not be rescanned after scoring its pages."""
+        document = _paged_document(
+            ["A readable paragraph of ordinary words.", "@@ ## $$ %%", ""], pages=7
+        )
+        expected = ConfidenceCalculator()._calculate_content_score(document)
+
+        calculator = ConfidenceCalculator()
+
+        def no_rescan(content_elements):
+            raise AssertionError("document text was rescanned")
+
+        calculator._calculate_text_metrics = no_rescan
+        assert calculator.calculate(document).content_score == expected
+
+    def test_calculate_sampled_scores_every_nth_page(self):
+        """Sampled scoring should only look at every Nth page."""
+        calculator = ConfidenceCalculator()
+        document = _paged_document(["Readable sentence with words."] * 3 + ["@@ ## $$"] * 5, pages=16)
+
+        stats = calculator.calculate_sampled(document, stride=4)
+        assert stats["content"][2] == 4
+        assert "table" not in stats
+
+        assert calculator.calculate_sampled(document, stride=8) == {}
+
 
 # =============================================================================
 # Tests for EscalationThresholds
@@ -403,6 +738,25 @@ class TestEscalationThresholds:
             table_score=None,
         ) is False
 
+    def test_should_escalate_batch_matches_scalar(self):
+        """Batch decisions should match should_escalate row by row."""
+        thresholds = EscalationThresholds()
+        rows = [
+            (0.80, None, None, None),
+            (0.65, None, None, None),
+            (0.80, 0.70, None, None),
+            (0.80, 0.80, 0.60, None),
+            (0.80, 0.80, 0.70, 0.60),
+            (0.80, 0.80, 0.70, 0.75),
+        ]
+
+        batch = thresholds.should_escalate_batch([
+            [float("nan") if v is None else v for v in row] for row in rows
+        ])
+
+        assert batch.shape == (len(rows),)
+        assert batch.tolist() == [thresholds.should_escalate(*row) for row in rows]
+
 
 # =============================================================================
 # Tests for CategoryThresholds
@@ -440,6 +794,20 @@ class TestCategoryThresholds:
 
         assert thresholds == category_thresholds.default
 
+    def test_lookup_shares_immutable_thresholds(self):
+        """Lookups should return the configured instances, which are frozen."""
+        from dataclasses import FrozenInstanceError
+
+        category_thresholds = CategoryThresholds()
+
+        assert category_thresholds.get_for_category(None) is category_thresholds.default
+        assert (
+            category_thresholds.get_for_category(DocumentCategory.NEWS_ARTICLE)
+            is category_thresholds.blog_post
+        )
+        with pytest.raises(FrozenInstanceError):
+            category_thresholds.blog_post.min_overall_confidence = 0.0
+
 
 # =============================================================================
 # Tests for AdaptivePipelineConfig
@@ -461,7 +829,7 @@ class TestAdaptivePipelineConfig:
     def test_fast_pipeline(self):
         """Fast pipeline should only include PyMuPDF."""
         config = FAST_PIPELINE
-        assert config.pipeline_order == [ParserType.PYMUPDF]
+        assert config.pipeline_order == (ParserType.PYMUPDF,)
         assert config.enable_hybrid_extraction is False
 
     def test_balanced_pipeline(self):
@@ -480,6 +848,59 @@ class TestAdaptivePipelineConfig:
         assert ParserType.DOCLING not in config.pipeline_order
         assert ParserType.VLM not in config.pipeline_order
 
+    def test_profiles_share_default_thresholds(self):
+        """Preconfigured profiles should share the immutable default thresholds."""
+        assert FAST_PIPELINE.thresholds is FULL_PIPELINE.thresholds
+        assert FAST_PIPELINE.category_thresholds is AdaptivePipelineConfig().category_thresholds
+
+    def test_pipeline_order_stored_as_tuple(self):
+        """Pipeline orders given as lists should be stored as tuples."""
+        config = AdaptivePipelineConfig(pipeline_order=[ParserType.PYMUPDF, ParserType.MARKER])
+        assert config.pipeline_order == (ParserType.PYMUPDF, ParserType.MARKER)
+
+        config.pipeline_order = [ParserType.PYMUPDF]
+        assert config.pipeline_order == (ParserType.PYMUPDF,)
+
+        # Limits are computed once per distinct pipeline
+        assert (
+            FULL_PIPELINE.limit_to_parser(ParserType.MARKER).pipeline_order
+            is FULL_PIPELINE.limit_to_parser(ParserType.MARKER).pipeline_order
+        )
+
+    def test_limit_to_parser_keeps_settings(self):
+        """Limiting should only change the pipeline order."""
+        config = AdaptivePipelineConfig(max_vlm_pages=3, speculative_escalation=False)
+
+        limited = config.limit_to_parser(ParserType.DOCLING)
+        assert limited.pipeline_order == (ParserType.PYMUPDF, ParserType.MARKER, ParserType.DOCLING)
+        assert limited.max_vlm_pages == 3
+        assert limited.speculative_escalation is False
+
+        unchanged = BALANCED_PIPELINE.limit_to_parser(ParserType.VLM)
+        assert unchanged.pipeline_order == BALANCED_PIPELINE.pipeline_order
+
+    def test_limit_to_parser_copies_every_field(self):
+        """Fields added to the config later should carry over automatically."""
+        from dataclasses import fields
+
+        limited = QUALITY_PIPELINE.limit_to_parser(ParserType.PYMUPDF)
+
+        for f in fields(AdaptivePipelineConfig):
+            if f.name != "pipeline_order":
+                assert getattr(limited, f.name) == getattr(QUALITY_PIPELINE, f.name), f.name
+
+    def test_config_dataclasses_use_slots(self):
+        """Config and result records should not carry a per-instance __dict__."""
+        attempt = ParserAttempt(
+            parser_type=ParserType.PYMUPDF,
+            document=None,
+            confidence=None,
+            duration_ns=0,
+            success=False,
+        )
+        for obj in (AdaptivePipelineConfig(), CategoryThresholds(), EscalationThresholds(), attempt):
+            assert not hasattr(obj, "__dict__")
+
     def test_get_thresholds_with_category(self):
         """Should return category-specific thresholds."""
         config = AdaptivePipelineConfig()
@@ -490,6 +911,33 @@ class TestAdaptivePipelineConfig:
         # Academic should be stricter
         assert academic_thresholds.min_content_confidence >= default_thresholds.min_content_confidence
 
+    def test_get_thresholds_covers_every_category(self):
+        """Every category should resolve, including those without overrides."""
+        custom = EscalationThresholds(min_overall_confidence=0.5)
+        config = AdaptivePipelineConfig(thresholds=custom)
+
+        assert config.get_thresholds(None) is custom
+        for category in DocumentCategory:
+            assert config.get_thresholds(category) is (
+                config.category_thresholds.get_for_category(category)
+            )
+        limited = config.limit_to_parser(ParserType.MARKER)
+        assert limited.get_thresholds(None) is custom
+
+    def test_get_thresholds_follows_reassigned_fields(self):
+        """Reassigning thresholds after a lookup should not leave stale values."""
+        config = AdaptivePipelineConfig()
+        config.get_thresholds(DocumentCategory.ACADEMIC_PAPER)
+
+        custom = EscalationThresholds(min_overall_confidence=0.5)
+        config.thresholds = custom
+        assert config.get_thresholds(None) is custom
+
+        strict = EscalationThresholds(min_overall_confidence=0.99)
+        config.category_thresholds = CategoryThresholds(academic_paper=strict)
+        assert config.get_thresholds(DocumentCategory.ACADEMIC_PAPER) is strict
+        assert config.get_thresholds(None) is custom
+
 
 # =============================================================================
 # Tests for AdaptivePDFParser
@@ -557,6 +1005,16 @@ class TestAdaptivePDFParser:
         assert "thresholds" in info
         assert "hybrid_enabled" in info
 
+    def test_force_vlm_reuses_pymupdf_parser(self, simple_pdf):
+        """Force-VLM mode should use the shared PyMuPDF parser instance."""
+        parser = AdaptivePDFParser(config=FAST_PIPELINE)
+        pymupdf_parser = parser._get_parser(ParserType.PYMUPDF)
+
+        with pytest.raises(NotImplementedError):
+            parser.parse(simple_pdf, force_vlm=True)
+
+        assert parser._parsers == {ParserType.PYMUPDF: pymupdf_parser}
+
     def test_max_escalation_level(self, simple_pdf):
         """Should respect max_escalation_level parameter."""
         # Use FULL_PIPELINE but limit to PYMUPDF
@@ -567,6 +1025,596 @@ class TestAdaptivePDFParser:
         assert all(a.parser_type == ParserType.PYMUPDF for a in result.attempts)
 
 
+    def test_speculative_escalation_overlaps_parsers(self, simple_pdf):
+        """Next parser should start while the current one is still running."""
+        import threading
+        from ..parsers.pdf_parser import PDFParser
+
+        marker_started = threading.Event()
+
+        class FirstTier(PDFParser):
+            def parse(self, pdf_path, **kwargs):
+                if not marker_started.wait(timeout=5):
+                    raise RuntimeError("next tier was not started speculatively")
+                return super().parse(pdf_path, **kwargs)
+
+        class SecondTier(PDFParser):
+            def parse(self, pdf_path, **kwargs):
+                marker_started.set()
+                return super().parse(pdf_path, **kwargs)
+
+        config = AdaptivePipelineConfig(
+            pipeline_order=[ParserType.PYMUPDF, ParserType.MARKER],
+            thresholds=EscalationThresholds(min_overall_confidence=1.01),
+            enable_hybrid_extraction=False,
+            speculative_escalation=True,
+        )
+        with AdaptivePDFParser(config=config) as parser:
+            parser._parsers = {ParserType.PYMUPDF: FirstTier(), ParserType.MARKER: SecondTier()}
+
+            result = parser.parse(simple_pdf)
+
+        assert [a.parser_type for a in result.attempts] == [ParserType.PYMUPDF, ParserType.MARKER]
+        assert all(a.success for a in result.attempts)
+        assert parser._executor is None
+
+    def test_close_shuts_down_confidence_workers(self):
+        """close() should also stop the confidence calculator's worker processes."""
+        parser = AdaptivePDFParser(config=FAST_PIPELINE)
+        parser.confidence_calculator = ConfidenceCalculator(page_workers=2)
+        parser.confidence_calculator._get_page_pool()
+
+        parser.close()
+
+        assert parser.confidence_calculator._page_pool is None
+
+    def test_speculative_escalation_off_by_default(self, simple_pdf):
+        """No speculation threads unless enabled; close() is safe either way."""
+        assert AdaptivePipelineConfig().speculative_escalation is False
+
+        parser = AdaptivePDFParser(config=FAST_PIPELINE)
+        assert parser._executor is None
+        parser.close()
+
+        # Closing a speculative parser leaves it usable, sequentially
+        parser = AdaptivePDFParser(
+            config=AdaptivePipelineConfig(
+                pipeline_order=[ParserType.PYMUPDF, ParserType.MARKER],
+                speculative_escalation=True,
+            )
+        )
+        assert parser._executor is not None
+        parser.close()
+        result = parser.parse(simple_pdf, max_escalation_level=ParserType.PYMUPDF)
+        assert [a.parser_type for a in result.attempts] == [ParserType.PYMUPDF]
+
+    def test_unneeded_parsers_are_never_loaded(self, simple_pdf):
+        """Parsers past a successful tier should not be imported or created."""
+        config = AdaptivePipelineConfig(
+            pipeline_order=[ParserType.PYMUPDF, ParserType.MARKER],
+            thresholds=EscalationThresholds(
+                min_overall_confidence=0.0,
+                min_content_confidence=0.0,
+                min_table_confidence=0.0,
+                min_figure_confidence=0.0,
+            ),
+            enable_hybrid_extraction=False,
+        )
+        parser = AdaptivePDFParser(config=config)
+
+        result = parser.parse(simple_pdf)
+
+        assert result.final_parser == ParserType.PYMUPDF
+        assert ParserType.MARKER not in parser._parsers
+
+    def test_preload_parsers_loads_pipeline(self):
+        """preload_parsers should create every pipeline parser up front."""
+        config = AdaptivePipelineConfig(
+            pipeline_order=[ParserType.PYMUPDF, ParserType.VLM],
+            preload_parsers=True,
+        )
+        parser = AdaptivePDFParser(config=config)
+
+        assert set(parser._parsers) == {ParserType.PYMUPDF, ParserType.VLM}
+
+    def test_confidence_scoring_overlaps_next_parser(self, simple_pdf):
+        """Scoring a tier should not delay the next tier's parsing."""
+        import threading
+        from ..parsers.pdf_parser import PDFParser
+
+        marker_started = threading.Event()
+
+        class SecondTier(PDFParser):
+            def parse(self, pdf_path, **kwargs):
+                marker_started.set()
+                return super().parse(pdf_path, **kwargs)
+
+        class WaitingCalculator(ConfidenceCalculator):
+            def calculate(self, document):
+                if threading.current_thread() is threading.main_thread():
+                    if not marker_started.wait(timeout=5):
+                        raise RuntimeError("scoring blocked the next tier")
+                return super().calculate(document)
+
+        config = AdaptivePipelineConfig(
+            pipeline_order=[ParserType.PYMUPDF, ParserType.MARKER],
+            thresholds=EscalationThresholds(min_overall_confidence=1.01),
+            enable_hybrid_extraction=False,
+            cache_parser_results=False,
+            speculative_escalation=True,
+        )
+        parser = AdaptivePDFParser(config=config)
+        parser.confidence_calculator = WaitingCalculator()
+        parser._parsers = {ParserType.PYMUPDF: PDFParser(), ParserType.MARKER: SecondTier()}
+
+        result = parser.parse(simple_pdf)
+
+        assert all(a.success for a in result.attempts)
+
+    def test_parse_many_overlaps_stages_in_order(self, tmp_path):
+        """One document's Marker stage should overlap the next one's PyMuPDF stage."""
+        import threading
+
+        second_started = threading.Event()
+        document = _paged_document(["A readable paragraph of ordinary words."], pages=1)
+
+        class FirstStage:
+            def parse(self, pdf_path, category=None):
+                if Path(pdf_path).name == "b.pdf":
+                    second_started.set()
+                return document.model_copy(update={"id": Path(pdf_path).stem})
+
+        class SecondStage:
+            def parse(self, pdf_path, category=None):
+                if Path(pdf_path).name == "a.pdf" and not second_started.wait(timeout=5):
+                    raise RuntimeError("next document's first stage did not overlap")
+                return document.model_copy(update={"id": Path(pdf_path).stem})
+
+        config = AdaptivePipelineConfig(
+            pipeline_order=[ParserType.PYMUPDF, ParserType.MARKER],
+            thresholds=EscalationThresholds(min_overall_confidence=1.01),
+            enable_hybrid_extraction=False,
+            speculative_escalation=False,
+            cache_parser_results=False,
+        )
+        parser = AdaptivePDFParser(config=config)
+        parser._parsers = {ParserType.PYMUPDF: FirstStage(), ParserType.MARKER: SecondStage()}
+
+        paths = [tmp_path / "a.pdf", tmp_path / "b.pdf"]
+        for path in paths:
+            path.touch()
+        results = list(parser.parse_many(paths))
+
+        assert [r.document.id for r in results] == ["a", "b"]
+        assert all(a.success for r in results for a in r.attempts)
+
+    def test_parse_many_raises_in_order(self, simple_pdf, tmp_path):
+        """A failing document should raise when it is reached."""
+        config = AdaptivePipelineConfig(
+            pipeline_order=[ParserType.PYMUPDF], enable_hybrid_extraction=False
+        )
+        parser = AdaptivePDFParser(config=config)
+
+        results = parser.parse_many([simple_pdf, tmp_path / "missing.pdf"])
+
+        assert next(results).final_parser == ParserType.PYMUPDF
+        with pytest.raises(FileNotFoundError):
+            next(results)
+
+    def test_superseded_documents_released(self, simple_pdf):
+        """Only the best attempt should keep its document unless retained."""
+        garbled = _paged_document(["@@ ## $$ %%"], pages=2)
+        readable = _paged_document(["A readable paragraph of ordinary words."], pages=2)
+
+        class StubParser:
+            def __init__(self, document):
+                self.document = document
+
+            def parse(self, pdf_path, category=None):
+                return self.document
+
+        for retain in (False, True):
+            config = AdaptivePipelineConfig(
+                pipeline_order=[ParserType.PYMUPDF, ParserType.MARKER, ParserType.DOCLING],
+                enable_hybrid_extraction=False,
+                stop_on_success=False,
+                retain_intermediate_documents=retain,
+            )
+            parser = AdaptivePDFParser(config=config)
+            parser._parsers = {
+                ParserType.PYMUPDF: StubParser(garbled),
+                ParserType.MARKER: StubParser(readable),
+                ParserType.DOCLING: StubParser(garbled),
+            }
+
+            result = parser.parse(simple_pdf)
+
+            assert result.document is readable
+            documents = [a.document for a in result.attempts]
+            if retain:
+                assert documents == [garbled, readable, garbled]
+            else:
+                assert documents == [None, readable, None]
+
+    def test_no_escalation_discards_speculative_attempt(self, simple_pdf):
+        """Attempts should only list parsers whose results were used."""
+        config = AdaptivePipelineConfig(
+            pipeline_order=[ParserType.PYMUPDF, ParserType.MARKER],
+            thresholds=EscalationThresholds(
+                min_overall_confidence=0.0,
+                min_content_confidence=0.0,
+                min_table_confidence=0.0,
+                min_figure_confidence=0.0,
+            ),
+            enable_hybrid_extraction=False,
+        )
+
+        for speculative in (True, False):
+            config.speculative_escalation = speculative
+            result = AdaptivePDFParser(config=config).parse(simple_pdf)
+            assert [a.parser_type for a in result.attempts] == [ParserType.PYMUPDF]
+
+
+    def test_parser_results_cached_until_file_changes(self, simple_pdf):
+        """Repeated parses should reuse results until the PDF is rewritten."""
+        import os
+        from ..parsers.pdf_parser import PDFParser
+
+        class CountingParser(PDFParser):
+            calls = 0
+
+            def parse(self, pdf_path, **kwargs):
+                CountingParser.calls += 1
+                return super().parse(pdf_path, **kwargs)
+
+        parser = AdaptivePDFParser(
+            config=AdaptivePipelineConfig(
+                pipeline_order=[ParserType.PYMUPDF],
+                cache_parser_results=True,
+            )
+        )
+        parser._parsers = {ParserType.PYMUPDF: CountingParser()}
+
+        first = parser.parse(simple_pdf)
+        expected = first.document.model_dump()
+        first.document.content.clear()
+        first.confidence.issues.append("X")
+
+        second = parser.parse(simple_pdf)
+        assert CountingParser.calls == 1
+        # Hits are independent copies, timed as the original parse
+        assert second.document is not first.document
+        assert second.document.model_dump() == expected
+        assert "X" not in second.confidence.issues
+        assert second.attempts[0].duration_ns == first.attempts[0].duration_ns
+
+        parser.parse(simple_pdf, category=DocumentCategory.BLOG_POST)
+        assert CountingParser.calls == 2
+
+        stat = simple_pdf.stat()
+        os.utime(simple_pdf, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        parser.parse(simple_pdf)
+        assert CountingParser.calls == 3
+
+        # Off by default
+        uncached = AdaptivePDFParser(
+            config=AdaptivePipelineConfig(pipeline_order=[ParserType.PYMUPDF])
+        )
+        uncached._parsers = {ParserType.PYMUPDF: CountingParser()}
+        uncached.parse(simple_pdf)
+        uncached.parse(simple_pdf)
+        assert CountingParser.calls == 5
+
+
+    def test_hybrid_extraction_replaces_low_confidence_pages(self, tmp_path):
+        """VLM output should replace flagged pages, with bounded concurrency."""
+        import threading
+        import time as time_module
+        from ..parsers.pdf_parser import PDFParser
+
+        pdf_path = tmp_path / "multi.pdf"
+        doc = fitz.open()
+        for i in range(5):
+            doc.new_page().insert_text((50, 50), f"Base page {i + 1}", fontsize=12)
+        doc.save(str(pdf_path))
+        doc.close()
+
+        lock = threading.Lock()
+        in_flight = []
+        peak = []
+
+        class StubVLMParser:
+            def parse(self, image_path, category=None):
+                with lock:
+                    in_flight.append(image_path)
+                    peak.append(len(in_flight))
+                time_module.sleep(0.05)
+                with lock:
+                    in_flight.remove(image_path)
+                return SimpleDocument(
+                    id="vlm",
+                    format=DocumentFormat.PDF,
+                    source=DocumentSource(file_path=str(image_path), accessed_at=datetime.now()),
+                    content=[ContentElement(id="vlm_c0", type="paragraph", content=image_path.stem)],
+                )
+
+        config = AdaptivePipelineConfig(
+            enable_per_page_decisions=False,
+            vlm_batch_size=2,
+            max_concurrent_vlm_tasks=2,
+        )
+        parser = AdaptivePDFParser(config=config)
+        parser._parsers[ParserType.VLM] = StubVLMParser()
+
+        base_document = PDFParser().parse(pdf_path)
+        base_confidence = ExtractionConfidence(
+            page_confidences=[
+                PageConfidence(page_number=p, needs_vlm=p in (2, 3, 5))
+                for p in range(1, 6)
+            ],
+            total_pages=5,
+            pages_needing_vlm=3,
+        )
+
+        merged = parser._hybrid_extraction(pdf_path, base_document, base_confidence, None)
+
+        texts = [e.content for e in merged.content]
+        assert "Base page 1" in texts and "Base page 4" in texts
+        assert not any(t in texts for t in ("Base page 2", "Base page 3", "Base page 5"))
+        assert texts[-3:] == ["page_2", "page_3", "page_5"]
+        assert len({e.id for e in merged.content}) == len(merged.content)
+        assert max(peak) <= 2
+
+    def test_hybrid_confidence_keeps_every_page(self, tmp_path):
+        """Post-hybrid confidence should score VLM output on its own pages."""
+        pdf_path = tmp_path / "multi.pdf"
+        doc = fitz.open()
+        for i in range(10):
+            doc.new_page().insert_text((50, 50), f"Base page {i + 1}", fontsize=12)
+        doc.save(str(pdf_path))
+        doc.close()
+
+        readable = "A readable paragraph of ordinary words."
+        base_document = _paged_document(
+            [readable, readable, "\ufffd\ufffd \ufffd", readable, readable, readable, "\ufffd\ufffd \ufffd"],
+            pages=10,
+        )
+
+        class StubParser:
+            def parse(self, pdf_path, category=None):
+                return base_document
+
+        class StubVLMParser:
+            def parse(self, image_path, category=None):
+                return SimpleDocument(
+                    id="vlm",
+                    format=DocumentFormat.PDF,
+                    source=DocumentSource(file_path=str(image_path), accessed_at=datetime.now()),
+                    content=[
+                        ContentElement(id=f"vlm_c{i}", type="paragraph", content=readable)
+                        for i in range(3)
+                    ],
+                )
+
+        parser = AdaptivePDFParser(config=AdaptivePipelineConfig(
+            pipeline_order=[ParserType.PYMUPDF, ParserType.VLM],
+        ))
+        parser._parsers = {
+            ParserType.PYMUPDF: StubParser(),
+            ParserType.VLM: StubVLMParser(),
+        }
+
+        result = parser.parse(pdf_path)
+
+        assert result.used_hybrid is True
+        assert result.confidence.total_pages == 10
+        assert [pc.page_number for pc in result.confidence.page_confidences] == list(range(1, 11))
+        assert result.vlm_pages == []
+        vlm_elements = [e for e in result.document.content if e.id.startswith("vlm_")]
+        assert sorted({e.bbox.page for e in vlm_elements}) == [3, 7, 10]
+        assert not any(
+            pc.layout_metrics.has_overlapping_blocks
+            for pc in result.confidence.page_confidences
+        )
+
+    def test_failed_vlm_request_stops_rendering(self, tmp_path):
+        """The first failed VLM request should stop rendering further pages."""
+        pdf_path = tmp_path / "long.pdf"
+        doc = fitz.open()
+        for i in range(20):
+            doc.new_page().insert_text((50, 50), f"Page {i + 1}", fontsize=12)
+        doc.save(str(pdf_path))
+        doc.close()
+
+        calls = []
+
+        class FailingVLMParser:
+            def parse(self, image_path, category=None):
+                calls.append(image_path)
+                raise NotImplementedError("no VLM")
+
+        parser = AdaptivePDFParser(config=AdaptivePipelineConfig(
+            vlm_batch_size=1, max_concurrent_vlm_tasks=1,
+        ))
+        parser._parsers[ParserType.VLM] = FailingVLMParser()
+        rendered_pages = []
+        original_render = parser._render_pages
+
+        def tracking_render(pdf_path, page_numbers, image_dir, rendered, stop):
+            class TrackingQueue:
+                def put(self, item, *args, **kwargs):
+                    if isinstance(item, tuple):
+                        rendered_pages.append(item[0])
+                    rendered.put(item, *args, **kwargs)
+            original_render(pdf_path, page_numbers, image_dir, TrackingQueue(), stop)
+
+        parser._render_pages = tracking_render
+
+        with pytest.raises(NotImplementedError):
+            parser._analyze_pages_with_vlm(pdf_path, list(range(1, 21)), None)
+
+        assert len(calls) <= 2
+        assert len(rendered_pages) < 20
+
+    def test_merge_documents_replaces_vlm_pages_in_order(self):
+        """Merging should drop base items on VLM pages and append VLM items by page."""
+        def elem(id, page=None):
+            bbox = BoundingBox(page=page, x=0, y=0, width=10, height=10) if page else None
+            return ContentElement(id=id, type="paragraph", content=id, bbox=bbox)
+
+        def table(id, page):
+            return Table(id=id, rows=[["a"]], bbox=BoundingBox(page=page, x=0, y=0, width=10, height=10))
+
+        base = SimpleDocument(
+            id="base",
+            format=DocumentFormat.PDF,
+            source=DocumentSource(file_path="base.pdf", accessed_at=datetime.now()),
+            content=[elem("b1", 1), elem("b2", 2), elem("loose"), elem("b3", 3)],
+            tables=[table("t1", 1), table("t3", 3)],
+        )
+
+        merged = AdaptivePDFParser()._merge_documents(
+            base,
+            vlm_contents={3: [elem("v3")], 1: [elem("v1")]},
+            vlm_tables={2: [table("vt2", 2)]},
+            vlm_figures={},
+        )
+
+        assert [e.id for e in merged.content] == ["b2", "loose", "v1", "v3"]
+        assert [t.id for t in merged.tables] == ["vt2"]
+
+    def test_hybrid_extraction_without_vlm_returns_none(self, simple_pdf):
+        """Hybrid extraction should report failure when the VLM is unavailable."""
+        from ..parsers.pdf_parser import PDFParser
+
+        parser = AdaptivePDFParser()
+        base_confidence = ExtractionConfidence(
+            page_confidences=[PageConfidence(page_number=1, needs_vlm=True)],
+            total_pages=1,
+            pages_needing_vlm=1,
+        )
+
+        assert parser._hybrid_extraction(
+            simple_pdf, PDFParser().parse(simple_pdf), base_confidence, None
+        ) is None
+
+    def test_vlm_pages_render_in_background(self, simple_pdf):
+        """Pages should be rendered off the calling thread; render errors propagate."""
+        import threading
+
+        observed = []
+
+        class StubVLMParser:
+            def parse(self, image_path, category=None):
+                observed.append(image_path.exists())
+                return _paged_document([image_path.stem], pages=1)
+
+        parser = AdaptivePDFParser()
+        parser._parsers[ParserType.VLM] = StubVLMParser()
+        original_render = parser._render_pages
+
+        def tracking_render(*args):
+            observed.append(threading.current_thread() is threading.main_thread())
+            original_render(*args)
+
+        parser._render_pages = tracking_render
+        results = parser._analyze_pages_with_vlm(simple_pdf, [1], None)
+
+        assert results[1].content[0].content == "page_1"
+        assert observed == [False, True]
+
+        with pytest.raises(IndexError):
+            parser._analyze_pages_with_vlm(simple_pdf, [1, 7], None)
+
+    def test_sampled_confidence_skips_full_scoring_when_clearly_low(self, simple_pdf):
+        """Clearly poor long documents escalate on a sampled estimate."""
+        garbled = _paged_document(["@@ ## $$ %%"], pages=40)
+        readable = _paged_document(["A readable paragraph of ordinary words."], pages=40)
+
+        class StubParser:
+            def __init__(self, document):
+                self.document = document
+
+            def parse(self, pdf_path, category=None):
+                return self.document
+
+        config = AdaptivePipelineConfig(
+            pipeline_order=[ParserType.PYMUPDF, ParserType.MARKER],
+            enable_hybrid_extraction=False,
+            stop_on_success=False,
+            confidence_eval_interval=8,
+        )
+        parser = AdaptivePDFParser(config=config)
+        parser._parsers = {
+            ParserType.PYMUPDF: StubParser(garbled),
+            ParserType.MARKER: StubParser(readable),
+        }
+
+        result = parser.parse(simple_pdf)
+        first, second = result.attempts
+
+        assert first.confidence_sampled is True
+        assert first.confidence.page_confidences == []
+        assert second.confidence_sampled is False
+        assert len(second.confidence.page_confidences) == 40
+
+        # A sampled attempt that ends up final is re-scored in full
+        config.pipeline_order = [ParserType.PYMUPDF]
+        single_tier = AdaptivePDFParser(config=config)
+        single_tier._parsers = {ParserType.PYMUPDF: StubParser(garbled)}
+        final = single_tier.parse(simple_pdf)
+        assert final.attempts[0].confidence_sampled is True
+        assert len(final.confidence.page_confidences) == 40
+
+        # Sampling is off by default
+        default_tier = AdaptivePDFParser(config=AdaptivePipelineConfig(
+            pipeline_order=[ParserType.PYMUPDF], enable_hybrid_extraction=False,
+        ))
+        default_tier._parsers = {ParserType.PYMUPDF: StubParser(garbled)}
+        assert default_tier.parse(simple_pdf).attempts[0].confidence_sampled is False
+
+
+# =============================================================================
+# Tests for BatchAdaptiveResults
+# =============================================================================
+
+class TestBatchAdaptiveResults:
+    """Tests for column-wise attempt storage."""
+
+    def test_append_grows_and_summarizes(self):
+        """Appends past capacity should keep every attempt."""
+        batch = BatchAdaptiveResults(capacity=2)
+        confidence = ExtractionConfidence(overall_score=0.8)
+        for i in range(5):
+            batch.append(ParserAttempt(
+                parser_type=ParserType.PYMUPDF if i % 2 == 0 else ParserType.MARKER,
+                document=None,
+                confidence=confidence if i < 4 else None,
+                duration_ns=500_000_000,
+                success=i < 4,
+            ))
+
+        assert len(batch) == 5
+        assert batch.durations.dtype == np.float32
+        summary = batch.summary()
+        assert summary["attempts"] == 5
+        assert summary["total_duration_seconds"] == 2.5
+        assert summary["success_rate"] == 0.8
+        assert summary["mean_confidence"] == 0.8
+        assert summary["attempts_per_parser"] == {"pymupdf": 3, "marker": 2}
+
+    def test_extend_from_adaptive_result(self, simple_pdf):
+        """Should collect all attempts of a parse result."""
+        result = AdaptivePDFParser(config=FAST_PIPELINE).parse(simple_pdf)
+
+        batch = BatchAdaptiveResults()
+        batch.extend(result)
+
+        assert len(batch) == len(result.attempts)
+        assert batch.success.all()
+        assert BatchAdaptiveResults().summary() == {"attempts": 0}
+
+
 # =============================================================================
 # Tests for convenience function
 # =============================================================================
@@ -646,6 +1694,27 @@ class TestExtractionConfidence:
         )
         assert high_ratio.needs_full_vlm is True
 
+    def test_metrics_are_frozen_and_picklable(self):
+        """Metric values should be immutable and survive pickling."""
+        import pickle
+        from pydantic import ValidationError
+
+        metrics = LayoutMetrics(heading_count=2, has_multi_column=True)
+        with pytest.raises(ValidationError):
+            metrics.heading_count = 3
+        with pytest.raises(ValidationError):
+            TextQualityMetrics().alphanumeric_ratio = 0.0
+
+        page = PageConfidence(
+            page_number=1, text_metrics=TextQualityMetrics(), layout_metrics=metrics,
+            issues=["Page 1: Multi-column layout detected"],
+        )
+        assert pickle.loads(pickle.dumps(page)) == page
+        with pytest.raises(ValidationError):
+            page.overall_score = 0.0
+        assert page.issues == ("Page 1: Multi-column layout detected",)
+        assert hash(metrics) == hash(LayoutMetrics(heading_count=2, has_multi_column=True))
+
     def test_get_vlm_pages(self):
         """Should return correct list of pages needing VLM."""
         page_confidences = [
@@ -8,6 +8,7 @@ This module tests the DoclingParser class functionality including:
 """
 
 import pytest
+from datetime import datetime
 from pathlib import Path
 
 
@@ -51,6 +52,35 @@ def test_docling_parser_with_custom_config():
     assert parser.config.batch_size == 4
 
 
+def test_docling_parser_backend_option():
+    """Test pypdfium2 backend option and rejection of unknown backends."""
+    from vlm_doc_test.parsers import DoclingParser, DoclingConfig
+
+    assert DoclingConfig().backend is None
+
+    config = DoclingConfig(backend="pypdfium2", ocr_enabled=False)
+    assert DoclingParser(config=config).config.backend == "pypdfium2"
+
+    parser = DoclingParser(config=DoclingConfig(backend="unknown"))
+    with pytest.raises(ValueError, match="Unknown Docling backend"):
+        parser._get_converter()
+
+
+def test_get_docling_parser_shared(monkeypatch):
+    """Test get_docling_parser returns one shared instance using env artifacts."""
+    from vlm_doc_test.parsers import DoclingParser, get_docling_parser
+
+    monkeypatch.setenv("DOCLING_ARTIFACTS_PATH", "/tmp/docling_models")
+    get_docling_parser.cache_clear()
+    try:
+        parser = get_docling_parser()
+        assert isinstance(parser, DoclingParser)
+        assert parser.config.artifacts_path == "/tmp/docling_models"
+        assert get_docling_parser() is parser
+    finally:
+        get_docling_parser.cache_clear()
+
+
 def test_docling_format_detection():
     """Test Docling correctly detects document formats."""
     from vlm_doc_test.parsers import DoclingParser
@@ -155,6 +185,61 @@ def test_docling_batch_convert_interface(tmp_path):
     assert callable(parser.batch_convert)
 
 
+def test_docling_batch_convert_in_process_keeps_order(tmp_path):
+    """Test batch conversion defaults to this parser's converter, in process."""
+    from types import SimpleNamespace
+    from vlm_doc_test.parsers import DoclingParser
+
+    class MockConverter:
+        def __init__(self):
+            self.calls = []
+
+        def convert(self, path):
+            self.calls.append(Path(path).name)
+            markdown = f"# {Path(path).stem}"
+            return SimpleNamespace(
+                document=SimpleNamespace(export_to_markdown=lambda: markdown)
+            )
+
+    parser = DoclingParser()
+    parser._converter = MockConverter()
+    file_paths = [Path(f"doc{i}.pdf") for i in (2, 0, 1)]
+
+    outputs = parser.batch_convert(file_paths, tmp_path / "out")
+
+    assert [p.name for p in outputs] == ["doc2.md", "doc0.md", "doc1.md"]
+    assert [p.read_text() for p in outputs] == ["# doc2", "# doc0", "# doc1"]
+    assert parser._converter.calls == ["doc2.pdf", "doc0.pdf", "doc1.pdf"]
+
+
+def test_docling_batch_worker_reuses_its_parser(tmp_path, monkeypatch):
+    """Test every task in a batch worker converts with the worker's parser."""
+    from types import SimpleNamespace
+    from vlm_doc_test.parsers import DoclingParser
+    from vlm_doc_test.utils import batch_utils
+
+    converted = []
+
+    class MockConverter:
+        def convert(self, path):
+            converted.append(Path(path).name)
+            return SimpleNamespace(
+                document=SimpleNamespace(export_to_markdown=lambda: "# Doc")
+            )
+
+    parser = DoclingParser()
+    parser._converter = MockConverter()
+    monkeypatch.setattr(batch_utils, "_worker_parser", parser)
+
+    for name in ("a", "b"):
+        batch_utils._batch_convert_worker(
+            Path(f"{name}.pdf"), tmp_path / f"{name}.md", "markdown"
+        )
+
+    assert converted == ["a.pdf", "b.pdf"]
+    assert (tmp_path / "b.md").read_text() == "# Doc"
+
+
 def test_docling_comparison_interface():
     """Test docling comparison with Marker interface."""
     from vlm_doc_test.parsers import DoclingParser
@@ -166,6 +251,49 @@ def test_docling_comparison_interface():
     assert callable(parser.compare_with_marker)
 
 
+def test_docling_comparison_runs_parsers_concurrently(monkeypatch):
+    """Test Docling and Marker overlap when compared."""
+    import time
+    from vlm_doc_test.parsers import DoclingParser
+    from vlm_doc_test.parsers import marker_parser
+    from vlm_doc_test.schemas.schema_simple import SimpleDocument, DocumentSource
+    from vlm_doc_test.schemas.base import DocumentFormat
+
+    def slow_parse(self, path):
+        time.sleep(0.2)
+        return SimpleDocument(
+            id=path.stem,
+            format=DocumentFormat.PDF,
+            source=DocumentSource(file_path=str(path), accessed_at=datetime.now()),
+        )
+
+    marker_loads = []
+
+    class SlowMarker:
+        parse = slow_parse
+
+        def __init__(self):
+            marker_loads.append(self)
+
+    monkeypatch.setattr(DoclingParser, "parse", slow_parse)
+    monkeypatch.setattr(marker_parser, "MarkerParser", SlowMarker)
+    marker_parser.get_marker_parser.cache_clear()
+    try:
+        start = time.perf_counter()
+        comparison = DoclingParser().compare_with_marker(Path("doc.pdf"))
+        elapsed = time.perf_counter() - start
+
+        # The Marker parser is shared across comparisons
+        DoclingParser().compare_with_marker(Path("doc.pdf"))
+        assert len(marker_loads) == 1
+    finally:
+        marker_parser.get_marker_parser.cache_clear()
+
+    assert elapsed < 0.35
+    assert comparison["docling_vlm"]["time_seconds"] >= 0.2
+    assert comparison["marker"]["time_seconds"] >= 0.2
+
+
 def test_docling_parse_to_markdown_interface():
     """Test parse to markdown interface."""
     from vlm_doc_test.parsers import DoclingParser
@@ -184,3 +312,31 @@ def test_docling_parse_to_dict_interface():
 
     assert hasattr(parser, 'parse_to_dict')
     assert callable(parser.parse_to_dict)
+
+
+def test_docling_batch_convert_json_serializes_directly(tmp_path):
+    """Test JSON batch output comes from the document's own JSON encoder."""
+    import json
+    from types import SimpleNamespace
+    from pydantic import BaseModel
+    from vlm_doc_test.parsers import DoclingParser
+
+    class MockDoclingDoc(BaseModel):
+        name: str
+        texts: list
+
+    class MockConverter:
+        def convert(self, path):
+            return SimpleNamespace(
+                document=MockDoclingDoc(name=Path(path).stem, texts=["Ünïcode"])
+            )
+
+    parser = DoclingParser()
+    parser._converter = MockConverter()
+
+    [output] = parser.batch_convert(
+        [Path("doc.pdf")], tmp_path, format="json", max_workers=1
+    )
+
+    assert output.name == "doc.json"
+    assert json.loads(output.read_bytes()) == parser.parse_to_dict(Path("doc.pdf"))
@@ -2,9 +2,17 @@
 Tests for HTML parser.
 """
 
+import io
+
 import pytest
 from ..parsers import HTMLParser
-from ..schemas.base import DocumentFormat
+from ..schemas.base import DocumentCategory, DocumentFormat
+
+try:
+    import selectolax  # noqa: F401
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
 
 
 def test_html_parser_basic(sample_html):
@@ -110,6 +118,83 @@ def test_html_parser_string_input():
     assert len(doc.content) == 2  # 1 heading + 1 paragraph
 
 
+def test_html_parser_skips_script_style_and_template_text():
+    """Test that non-rendered text is dropped without merging neighbours."""
+    html_string = (
+        "<html><head><title>T</title><style>p { color: red }</style></head><body>"
+        "<p>Before<script>var x = 1;</script>After</p>"
+        "<template><p>Hidden</p></template>"
+        "<figure><img src=\"a.png\"><figcaption><b>Figure</b>\n\t\t<b>1</b></figcaption></figure>"
+        "</body></html>"
+    )
+
+    parser = HTMLParser()
+    doc = parser.parse(html_string)
+
+    assert [block.content for block in doc.content] == ["Before After"]
+    assert doc.figures[0].caption == "Figure\n1"
+
+
+def test_html_parser_main_landmark_and_noscript():
+    """Test that content comes from <main> only and <noscript> is skipped."""
+    html_string = (
+        "<html><body><p>Navigation text</p>"
+        "<noscript><p>Enable JavaScript</p><img alt=\"Tracker\"></noscript>"
+        "<main><h1>Heading</h1><figure><img src=\"a.png\"></figure>"
+        "<img alt=\"Standalone\"><p>Body text</p></main>"
+        "<a href=\"#top\">Top</a><a href=\"/a\">First</a><a href=\"/a\">Again</a>"
+        "</body></html>"
+    )
+
+    parser = HTMLParser()
+    doc = parser.parse(html_string)
+
+    assert [block.content for block in doc.content] == ["Heading", "Body text"]
+    assert [fig.caption for fig in doc.figures] == [None, "Standalone"]
+    assert [(link.id, link.url) for link in doc.links] == [("link_2", "/a")]
+
+
+def test_html_parser_infers_category_from_classes():
+    """Test category hints from class names, ignoring case."""
+    parser = HTMLParser()
+
+    def category(html_string):
+        return parser.parse(html_string).category
+
+    assert category("<article><p>Text</p></article><div class=\"Paper ABSTRACT\"></div>") \
+        == DocumentCategory.ACADEMIC_PAPER
+    assert category("<article><span class=\"post-meta\">Text</span></article>") \
+        == DocumentCategory.BLOG_POST
+    assert category("<article><p class=\"body\">Text</p></article>") \
+        == DocumentCategory.WEBPAGE_GENERAL
+    assert category("<div class=\"abstract\"><p>Text</p></div>") is None
+
+
+def test_html_parser_reads_file_bytes(tmp_path):
+    """Test that files are decoded as UTF-8 by the parser, leniently."""
+    html_path = tmp_path / "page.html"
+    html_path.write_bytes(
+        b"<title>Caf\xc3\xa9</title><p>Line one\r\nline two</p><p>Bad \xe9 byte</p>"
+    )
+
+    doc = HTMLParser().parse(str(html_path))
+
+    assert doc.metadata.title == "Caf\u00e9"
+    assert [block.content for block in doc.content] == [
+        "Line one line two",
+        "Bad \ufffd byte",
+    ]
+
+
+def test_html_parser_empty_document():
+    """Test that a document with no elements parses to empty content."""
+    parser = HTMLParser()
+    doc = parser.parse("\n")
+
+    assert doc.content == []
+    assert doc.metadata.title is None
+
+
 def test_html_parser_parse_url():
     """Test parse_url convenience method."""
     html_string = "<html><body><h1>Test</h1></body></html>"
@@ -124,6 +209,89 @@ def test_html_parser_parse_url():
     assert len(doc.content) > 0
 
 
+def test_html_parser_url_document_id():
+    """Test document IDs derived from URLs."""
+    parser = HTMLParser()
+
+    doc = parser.parse("<p>Text</p>", url="https://example.com/docs/page.html")
+    assert doc.id == "example_com_docs_page_html"
+
+    doc = parser.parse("<p>Text</p>", url="http://a.org/go?to=https://b.org/" + "x" * 60)
+    assert doc.id == ("a_org_go?to=b_org_" + "x" * 60)[:50]
+
+
+def test_html_parser_parse_stream_matches_parse(sample_html):
+    """Test that streaming a file gives the same document as parse()."""
+    parser = HTMLParser()
+    expected = parser.parse(str(sample_html))
+
+    for mode, kwargs in (("rb", {}), ("r", {"encoding": "utf-8"})):
+        with open(sample_html, mode, **kwargs) as f:
+            doc = parser.parse_stream(f)
+
+        assert doc.id == expected.id
+        assert doc.source.file_path == expected.source.file_path
+        assert doc.model_dump(exclude={"source"}) == expected.model_dump(exclude={"source"})
+
+
+def test_html_parser_markup_after_closing_html_tag():
+    """Test that content after </html> is kept by parse() and parse_stream()."""
+    html_string = (
+        "<html><head><title>T</title></head><body><p>Inside body</p></body></html>"
+        "<html><p>After html</p><a href=\"/after\">Link</a></html>"
+    )
+
+    parser = HTMLParser()
+    doc = parser.parse(html_string)
+    streamed = parser.parse_stream(io.BytesIO(html_string.encode("utf-8")))
+
+    assert [link.url for link in doc.links] == ["/after"]
+    assert streamed.model_dump(exclude={"source"}) == doc.model_dump(exclude={"source"})
+
+
+def test_html_parser_releases_tree(sample_html):
+    """Test that the parsed tree is not kept once the document is built."""
+    parser = HTMLParser()
+
+    parser.parse(str(sample_html))
+    assert parser.tree is None
+
+    with open(sample_html, "rb") as f:
+        parser.parse_stream(f)
+    assert parser.tree is None
+
+
+@pytest.mark.skipif(not SELECTOLAX_AVAILABLE, reason="selectolax not installed")
+def test_html_parser_selectolax_matches_lxml(sample_html):
+    """Test that the selectolax backend extracts the same document as lxml."""
+    expected = HTMLParser().parse(str(sample_html))
+    doc = HTMLParser(parser="selectolax").parse(str(sample_html))
+
+    assert doc.model_dump(exclude={"source"}) == expected.model_dump(exclude={"source"})
+
+
+@pytest.mark.skipif(not SELECTOLAX_AVAILABLE, reason="selectolax not installed")
+def test_html_parser_selectolax_skips_non_content():
+    """Test that the selectolax backend drops script text and inner figures."""
+    html_string = (
+        "<html><body><article class=\"post\"><p>Before<script>x = 1;</script>After</p>"
+        "<figure><img src=\"a.png\"><figcaption>Cap</figcaption></figure>"
+        "<img alt=\"Standalone\"></article></body></html>"
+    )
+
+    doc = HTMLParser(parser="selectolax").parse(html_string)
+
+    assert [block.content for block in doc.content] == ["Before After"]
+    assert [fig.caption for fig in doc.figures] == ["Cap", "Standalone"]
+    assert doc.category == DocumentCategory.BLOG_POST
+
+
+def test_html_parser_unknown_backend():
+    """Test that unknown parser backends are rejected."""
+    with pytest.raises(ValueError):
+        HTMLParser(parser="html5lib")
+
+
 def test_html_parser_json_serialization(sample_html):
     """Test JSON serialization."""
     parser = HTMLParser()
@@ -27,6 +27,8 @@ def test_marker_config_defaults():
     assert config.extract_images is True
     assert config.max_pages is None
     assert config.output_format == "markdown"
+    assert config.torch_device is None
+    assert config.model_dtype is None
 
 
 def test_marker_parser_initialization():
@@ -49,6 +51,67 @@ def test_marker_parser_with_custom_config():
     assert parser.config.extract_images is False
 
 
+def test_marker_parsers_share_models(monkeypatch):
+    """Test that all MarkerParser instances load one shared model dict."""
+    import sys
+    import types
+    from vlm_doc_test.parsers import MarkerParser, MarkerConfig
+    from vlm_doc_test.parsers.marker_parser import _shared_models
+
+    calls = []
+    fake_models = types.ModuleType("marker.models")
+    fake_models.create_model_dict = lambda **kwargs: calls.append(kwargs) or {"model": object()}
+    monkeypatch.setitem(sys.modules, "marker", types.ModuleType("marker"))
+    monkeypatch.setitem(sys.modules, "marker.models", fake_models)
+    _shared_models.cache_clear()
+    try:
+        first, second = MarkerParser(), MarkerParser()
+        assert first._load_models() is second._load_models()
+        assert calls == [{}]
+
+        cpu_parser = MarkerParser(MarkerConfig(torch_device="cpu"))
+        assert cpu_parser._load_models() is not first._load_models()
+        assert calls == [{}, {"device": "cpu"}]
+    finally:
+        _shared_models.cache_clear()
+
+
+def test_marker_tf32_is_opt_in(monkeypatch):
+    """Test float32 matmul precision is only changed when allow_tf32 is set."""
+    import sys
+    import types
+    from vlm_doc_test.parsers import MarkerParser, MarkerConfig
+    from vlm_doc_test.parsers.marker_parser import _shared_models
+
+    precisions = []
+    fake_torch = types.ModuleType("torch")
+    fake_torch.set_float32_matmul_precision = precisions.append
+    fake_models = types.ModuleType("marker.models")
+    fake_models.create_model_dict = lambda **kwargs: {"model": object()}
+    monkeypatch.setitem(sys.modules, "torch", fake_torch)
+    monkeypatch.setitem(sys.modules, "marker", types.ModuleType("marker"))
+    monkeypatch.setitem(sys.modules, "marker.models", fake_models)
+    _shared_models.cache_clear()
+    try:
+        assert MarkerConfig().allow_tf32 is False
+        MarkerParser(MarkerConfig(torch_device="cuda"))._load_models()
+        assert precisions == []
+
+        MarkerParser(MarkerConfig(torch_device="cuda", allow_tf32=True))._load_models()
+        assert precisions == ["high"]
+    finally:
+        _shared_models.cache_clear()
+
+
+def test_get_marker_parser_shared():
+    """Test get_marker_parser returns one shared instance."""
+    from vlm_doc_test.parsers import MarkerParser, get_marker_parser
+
+    parser = get_marker_parser()
+    assert isinstance(parser, MarkerParser)
+    assert get_marker_parser() is parser
+
+
 @pytest.mark.slow
 def test_marker_parse_pdf(sample_pdf):
     """Test parsing PDF with marker (slow - loads models)."""
@@ -146,6 +209,49 @@ def test_marker_batch_convert_interface(tmp_path):
     assert callable(parser.batch_convert)
 
 
+def test_marker_batch_convert_in_process_keeps_order(tmp_path, monkeypatch):
+    """Test batch conversion defaults to converting in this process, in order."""
+    from vlm_doc_test.parsers import MarkerParser
+
+    converted = []
+
+    def fake_parse_to_markdown(pdf_path, output_path=None):
+        converted.append(pdf_path.name)
+        output_path.write_text(f"# {pdf_path.stem}", encoding="utf-8")
+        return f"# {pdf_path.stem}"
+
+    parser = MarkerParser()
+    monkeypatch.setattr(parser, "parse_to_markdown", fake_parse_to_markdown)
+    pdf_paths = [Path(f"doc{i}.pdf") for i in (2, 0, 1)]
+
+    outputs = parser.batch_convert(pdf_paths, tmp_path / "out")
+
+    assert [p.name for p in outputs] == ["doc2.md", "doc0.md", "doc1.md"]
+    assert [p.read_text() for p in outputs] == ["# doc2", "# doc0", "# doc1"]
+    assert converted == ["doc2.pdf", "doc0.pdf", "doc1.pdf"]
+
+
+def test_marker_batch_worker_reuses_its_parser(tmp_path, monkeypatch):
+    """Test every task in a batch worker converts with the worker's parser."""
+    from vlm_doc_test.parsers import MarkerParser
+    from vlm_doc_test.utils import batch_utils
+
+    converted = []
+    parser = MarkerParser()
+    monkeypatch.setattr(
+        parser, "parse_to_json",
+        lambda pdf_path, output_path=None: converted.append(pdf_path.name),
+    )
+    monkeypatch.setattr(batch_utils, "_worker_parser", parser)
+
+    for name in ("a", "b"):
+        batch_utils._batch_convert_worker(
+            Path(f"{name}.pdf"), tmp_path / f"{name}.json", "json"
+        )
+
+    assert converted == ["a.pdf", "b.pdf"]
+
+
 def test_marker_comparison_interface(sample_pdf):
     """Test marker comparison with PyMuPDF interface."""
     from vlm_doc_test.parsers import MarkerParser
@@ -155,3 +261,44 @@ def test_marker_comparison_interface(sample_pdf):
     # Just test the interface exists
     assert hasattr(parser, 'compare_with_pymupdf')
     assert callable(parser.compare_with_pymupdf)
+
+
+def test_marker_comparison_times_only_parsing(monkeypatch):
+    """Test PyMuPDF parser construction is kept out of the measured time."""
+    import time
+    from datetime import datetime
+    from vlm_doc_test import parsers
+    from vlm_doc_test.parsers import MarkerParser
+    from vlm_doc_test.schemas.schema_simple import (
+        SimpleDocument, DocumentSource, ContentElement,
+    )
+    from vlm_doc_test.schemas.base import DocumentFormat
+
+    def make_doc(*texts):
+        return SimpleDocument(
+            id="doc",
+            format=DocumentFormat.PDF,
+            source=DocumentSource(accessed_at=datetime.now()),
+            content=[
+                ContentElement(id=f"e{i}", type="paragraph", content=text)
+                for i, text in enumerate(texts)
+            ],
+        )
+
+    class SlowInitPDFParser:
+        def __init__(self):
+            time.sleep(0.3)
+
+        def parse(self, pdf_path):
+            return make_doc("abc", "de")
+
+    monkeypatch.setattr(parsers, "PDFParser", SlowInitPDFParser)
+    parser = MarkerParser()
+    monkeypatch.setattr(parser, "parse", lambda pdf_path: make_doc("abcd"))
+
+    comparison = parser.compare_with_pymupdf(Path("doc.pdf"))
+
+    assert comparison["pymupdf"]["time_seconds"] < 0.3
+    assert comparison["pymupdf"]["content_elements"] == 2
+    assert comparison["pymupdf"]["total_text_length"] == 5
+    assert comparison["marker"]["total_text_length"] == 4
@@ -86,3 +86,91 @@ def test_pdf_parser_json_serialization(sample_pdf):
     json_output = doc.model_dump_json()
     assert len(json_output) > 0
     assert "Sample Document" in json_output
+
+
+def test_pdf_parser_page_helpers_reopen_modified_file(tmp_path):
+    """Test the cached page count and page text pick up a rewritten file."""
+    import pymupdf as fitz
+
+    pdf_path = tmp_path / "rewritten.pdf"
+
+    doc = fitz.open()
+    doc.new_page().insert_text((50, 50), "First version", fontsize=12)
+    doc.save(str(pdf_path))
+    doc.close()
+
+    parser = PDFParser()
+    assert parser.get_page_count(str(pdf_path)) == 1
+    assert "First version" in parser.extract_page_text(str(pdf_path), 1)
+
+    doc = fitz.open()
+    for _ in range(2):
+        doc.new_page().insert_text((50, 50), "Second version", fontsize=12)
+    doc.save(str(pdf_path))
+    doc.close()
+
+    assert parser.get_page_count(str(pdf_path)) == 2
+    assert "Second version" in parser.extract_page_text(str(pdf_path), 2)
+
+    with pytest.raises(ValueError):
+        parser.extract_page_text(str(pdf_path), 3)
+
+
+def test_pdf_parser_parallel_pages_match_sequential(tmp_path):
+    """Test multi-process page extraction matches the in-process result."""
+    import pymupdf as fitz
+
+    pdf_path = tmp_path / "multipage.pdf"
+    doc = fitz.open()
+    pixmap = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 8, 8), False)
+    for i in range(6):
+        page = doc.new_page()
+        page.insert_text((50, 50), f"Page {i + 1}", fontsize=18)
+        page.insert_text((50, 100), f"Content for page {i + 1}", fontsize=12)
+        if i % 2:
+            page.insert_image(fitz.Rect(50, 150, 150, 250), pixmap=pixmap)
+            # A 2x2 ruled table
+            for y in (300, 330, 360):
+                page.draw_line((50, y), (250, y))
+            for x in (50, 150, 250):
+                page.draw_line((x, 300), (x, 360))
+            page.insert_text((55, 320), "A", fontsize=10)
+            page.insert_text((155, 320), "B", fontsize=10)
+    doc.save(str(pdf_path))
+    doc.close()
+
+    sequential = PDFParser().parse(str(pdf_path))
+    parallel = PDFParser(num_page_workers=4).parse(str(pdf_path))
+
+    assert parallel.model_dump(exclude={"source"}) == sequential.model_dump(exclude={"source"})
+    assert {e.bbox.page for e in parallel.content} == set(range(1, 7))
+    assert [f.bbox.page for f in parallel.figures] == [2, 4, 6]
+    assert [t.bbox.page for t in parallel.tables] == [2, 4, 6]
+
+
+def test_pdf_parser_parse_iter_chunks(tmp_path):
+    """Test that parse_iter yields page chunks adding up to parse()."""
+    import pymupdf as fitz
+
+    pdf_path = tmp_path / "chunked.pdf"
+    doc = fitz.open()
+    for i in range(5):
+        page = doc.new_page()
+        page.insert_text((50, 50), f"Page {i + 1}", fontsize=18)
+        page.insert_text((50, 100), f"Content for page {i + 1}", fontsize=12)
+    doc.set_metadata({"title": "Chunked"})
+    doc.save(str(pdf_path))
+    doc.close()
+
+    parser = PDFParser()
+    expected = parser.parse(str(pdf_path))
+    chunks = list(parser.parse_iter(str(pdf_path), chunk_size=2))
+
+    assert [sorted({e.bbox.page for e in c.content}) for c in chunks] == [[1, 2], [3, 4], [5]]
+    assert all(c.id == "chunked" and c.metadata.title == "Chunked" for c in chunks)
+    assert [e.model_dump() for c in chunks for e in c.content] == [
+        e.model_dump() for e in expected.content
+    ]
+
+    with pytest.raises(ValueError):
+        next(parser.parse_iter(str(pdf_path), chunk_size=0))
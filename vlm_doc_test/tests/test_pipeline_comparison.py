@@ -54,6 +54,19 @@ def test_comparison_framework_initialization():
     assert comparison.parsers == {}
 
 
+def test_comparison_framework_with_parsers(sample_pdf):
+    """Test pre-built parser instances are used instead of defaults."""
+    from vlm_doc_test.validation.pipeline_comparison import PDFPipelineComparison
+    from vlm_doc_test.parsers import PDFParser
+
+    pdf_parser = PDFParser()
+    comparison = PDFPipelineComparison(parsers={"pymupdf": pdf_parser})
+
+    assert comparison._get_parser("pymupdf") is pdf_parser
+    result = comparison.compare_all(sample_pdf, pipelines=["pymupdf"])
+    assert result.pipelines["pymupdf"].success is True
+
+
 def test_get_parser_pymupdf():
     """Test getting PyMuPDF parser."""
     from vlm_doc_test.validation.pipeline_comparison import PDFPipelineComparison
@@ -153,6 +166,49 @@ def test_compare_all_multiple_pipelines(sample_pdf):
     assert result.fastest_pipeline != "none"
 
 
+def test_compare_all_warmup(sample_pdf):
+    """Test warm-up parses once per pipeline before the timed run."""
+    from vlm_doc_test.validation.pipeline_comparison import PDFPipelineComparison
+    from vlm_doc_test.parsers import PDFParser
+
+    parsed = []
+
+    class CountingParser(PDFParser):
+        calls = 0
+
+        def parse(self, pdf_path, **kwargs):
+            CountingParser.calls += 1
+            parsed.append(Path(pdf_path))
+            return super().parse(pdf_path, **kwargs)
+
+    comparison = PDFPipelineComparison(parsers={"pymupdf": CountingParser()})
+    comparison.compare_all(sample_pdf, pipelines=["pymupdf"], warmup=True)
+    comparison.compare_all(sample_pdf, pipelines=["pymupdf"], warmup=True)
+    assert CountingParser.calls == 3  # one warm-up + two timed runs
+    assert parsed[1:] == [sample_pdf, sample_pdf]
+    assert not parsed[0].parent.exists()  # warm-up directory is cleaned up
+
+    CountingParser.calls = 0
+    cold = PDFPipelineComparison(parsers={"pymupdf": CountingParser()})
+    cold.compare_all(sample_pdf, pipelines=["pymupdf"])
+    assert CountingParser.calls == 1  # warm-up is opt-in
+
+
+def test_compare_all_parallel(sample_pdf):
+    """Test parallel comparison matches sequential pipeline order and results."""
+    from vlm_doc_test.validation.pipeline_comparison import PDFPipelineComparison
+
+    comparison = PDFPipelineComparison()
+    result = comparison.compare_all(
+        sample_pdf, pipelines=["pymupdf", "invalid"], parallel=True
+    )
+
+    assert list(result.pipelines) == ["pymupdf", "invalid"]
+    assert result.pipelines["pymupdf"].success is True
+    assert result.pipelines["invalid"].error == "Parser not available"
+    assert result.fastest_pipeline == "pymupdf"
+
+
 def test_comparison_result_structure(sample_pdf):
     """Test ComparisonResult has correct structure."""
     from vlm_doc_test.validation.pipeline_comparison import PDFPipelineComparison
@@ -210,6 +266,21 @@ def test_generate_json_report(sample_pdf):
     assert "pipelines" in data
 
 
+def test_generate_report_json_without_orjson(sample_pdf, monkeypatch):
+    """Test JSON report falls back to stdlib json and matches orjson output."""
+    from vlm_doc_test.validation import pipeline_comparison
+    import json
+
+    comparison = pipeline_comparison.PDFPipelineComparison()
+    result = comparison.compare_all(sample_pdf, pipelines=["pymupdf"])
+    report = comparison.generate_report(result, format="json")
+
+    monkeypatch.setattr(pipeline_comparison, "orjson", None)
+    fallback = comparison.generate_report(result, format="json")
+
+    assert json.loads(fallback) == json.loads(report)
+
+
 def test_generate_report_invalid_format(sample_pdf):
     """Test generating report with invalid format raises error."""
     from vlm_doc_test.validation.pipeline_comparison import PDFPipelineComparison
@@ -231,6 +302,86 @@ def test_batch_compare_interface():
     assert callable(comparison.batch_compare)
 
 
+def test_batch_compare_with_workers(sample_pdf, tmp_path):
+    """Test batch comparison in worker processes keeps input order and reports."""
+    import shutil
+    from vlm_doc_test.validation.pipeline_comparison import PDFPipelineComparison
+
+    second_pdf = tmp_path / "second.pdf"
+    shutil.copy(sample_pdf, second_pdf)
+    pdf_paths = [sample_pdf, second_pdf, sample_pdf]
+
+    comparison = PDFPipelineComparison()
+    results = comparison.batch_compare(
+        pdf_paths,
+        tmp_path / "reports",
+        pipelines=["pymupdf", "invalid"],
+        num_workers=2,
+        max_concurrent_results=2,
+    )
+
+    assert [r.pdf_path for r in results] == [str(p) for p in pdf_paths]
+    assert all(r.pipelines["pymupdf"].success for r in results)
+    assert all(list(r.pipelines) == ["pymupdf", "invalid"] for r in results)
+    assert (tmp_path / "reports" / "second_comparison.md").exists()
+    assert (tmp_path / "reports" / "summary.md").exists()
+    assert comparison.batch_compare([], tmp_path / "empty", pipelines=["pymupdf"]) == []
+
+
+def test_batch_compare_workers_limited_to_in_flight_pdfs(sample_pdf, tmp_path, monkeypatch):
+    """Test the worker count never exceeds max_concurrent_results."""
+    from concurrent.futures import ProcessPoolExecutor
+    from vlm_doc_test.validation import pipeline_comparison
+
+    pool_sizes = []
+
+    class RecordingExecutor(ProcessPoolExecutor):
+        def __init__(self, max_workers=None, **kwargs):
+            pool_sizes.append(max_workers)
+            super().__init__(max_workers=max_workers, **kwargs)
+
+    monkeypatch.setattr(pipeline_comparison, "ProcessPoolExecutor", RecordingExecutor)
+
+    comparison = pipeline_comparison.PDFPipelineComparison()
+    results = comparison.batch_compare(
+        [sample_pdf] * 4, tmp_path, pipelines=["pymupdf"],
+        num_workers=8, max_concurrent_results=2,
+    )
+    assert pool_sizes == [2]
+    assert len(results) == 4
+
+    comparison.batch_compare(
+        [sample_pdf] * 2, tmp_path, pipelines=["pymupdf"],
+        num_workers=8, max_concurrent_results=1,
+    )
+    assert pool_sizes == [2]  # one PDF at a time runs in this process
+
+
+def test_batch_compare_keeps_gpu_pipelines_in_process(sample_pdf, tmp_path):
+    """Test GPU pipelines run on this process's parsers when using workers."""
+    from vlm_doc_test.validation.pipeline_comparison import PDFPipelineComparison
+    from vlm_doc_test.parsers import PDFParser
+
+    parsed = []
+
+    class InProcessParser(PDFParser):
+        def parse(self, pdf_path, **kwargs):
+            parsed.append(pdf_path)
+            return super().parse(pdf_path, **kwargs)
+
+    comparison = PDFPipelineComparison(parsers={"marker": InProcessParser()})
+    results = comparison.batch_compare(
+        [sample_pdf, sample_pdf],
+        tmp_path,
+        pipelines=["pymupdf", "marker"],
+        num_workers=2,
+    )
+
+    assert parsed.count(sample_pdf) == 2
+    assert all(r.pipelines["marker"].success for r in results)
+    assert all(r.pipelines["pymupdf"].success for r in results)
+
+
 def test_comparison_to_dict(sample_pdf):
     """Test conversion of ComparisonResult to dict."""
     from vlm_doc_test.validation.pipeline_comparison import PDFPipelineComparison
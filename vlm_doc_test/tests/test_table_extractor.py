@@ -1,8 +1,8 @@
 """
-Tests for enhanced table extraction using pdfplumber.
+Tests for enhanced table extraction using PyMuPDF and pdfplumber.
 
 This module tests the TableExtractor class functionality including:
-- Table extraction from PDFs
+- Table extraction from PDFs, with both backends
 - Region-based extraction
 - Text-based strategy for borderless tables
 - Table detection
@@ -89,6 +89,39 @@ class TestTableExtractor:
         # Should find at least one table
         assert len(tables) >= 0  # pdfplumber might not detect all tables
 
+    def test_backends_extract_same_ruled_table(self, tmp_path):
+        """Test that the PyMuPDF and pdfplumber backends agree on a ruled table."""
+        import fitz
+        doc = fitz.open()
+        page = doc.new_page(width=595, height=842)
+
+        for i in range(3):
+            page.draw_line((50, 100 + i * 30), (350, 100 + i * 30))
+        for i in range(3):
+            page.draw_line((50 + i * 150, 100), (50 + i * 150, 160))
+        page.insert_text((60, 120), "Name", fontsize=10)
+        page.insert_text((210, 120), "Value", fontsize=10)
+        page.insert_text((60, 150), "Item 1", fontsize=10)
+
+        pdf_path = tmp_path / "ruled_table.pdf"
+        doc.save(pdf_path)
+        doc.close()
+
+        tables = {
+            backend: TableExtractor(backend=backend).extract_tables_from_pdf(pdf_path)
+            for backend in ("pymupdf", "pdfplumber")
+        }
+
+        assert [t.rows for t in tables["pymupdf"]] == [[["Name", "Value"], ["Item 1", ""]]]
+        assert [t.model_dump() for t in tables["pymupdf"]] == [
+            t.model_dump() for t in tables["pdfplumber"]
+        ]
+
+    def test_unknown_backend(self):
+        """Test that unknown backends are rejected."""
+        with pytest.raises(ValueError):
+            TableExtractor(backend="camelot")
+
     def test_extract_tables_from_nonexistent_pdf(self):
         """Test that extracting from nonexistent PDF raises error."""
         extractor = TableExtractor()
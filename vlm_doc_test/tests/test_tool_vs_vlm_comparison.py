@@ -1,7 +1,7 @@
 """
 Tool vs VLM Comparison Tests.
 
-Tests that compare traditional tool-based parsing (PyMuPDF, pdfplumber, BeautifulSoup)
+Tests that compare traditional tool-based parsing (PyMuPDF, pdfplumber, lxml)
 against VLM-based parsing (GLM-4.6V) to validate equivalence.
 
 This implements the core concept from TESTING.md: equivalence testing between
@@ -176,6 +176,59 @@ class TestToolVsVLMComparison:
         with pytest.raises(FileNotFoundError):
             parser.parse("/nonexistent/image.png")
 
+    def test_vlm_parser_parse_batch_pipeline(self, tmp_path):
+        """Test batch parsing renders, analyzes and parses every page in order."""
+        import json
+        import pymupdf as fitz
+
+        pdf_paths = []
+        for name, pages in [("first", 3), ("second", 2)]:
+            pdf_path = tmp_path / f"{name}.pdf"
+            doc = fitz.open()
+            for i in range(pages):
+                doc.new_page().insert_text((50, 50), f"{name} {i + 1}", fontsize=12)
+            doc.save(str(pdf_path))
+            doc.close()
+            pdf_paths.append(pdf_path)
+
+        class StubVLMParser(VLMParser):
+            def _call_vlm_mcp(self, image_path, prompt):
+                return json.dumps({"title": image_path.stem, "content": []})
+
+        documents = StubVLMParser().parse_batch(
+            pdf_paths, tmp_path / "pages", max_in_flight=2, queue_size=1
+        )
+
+        assert [d.metadata.title for d in documents] == [
+            "0_first_p1", "0_first_p2", "0_first_p3", "1_second_p1", "1_second_p2",
+        ]
+
+    def test_vlm_parser_reuses_responses_for_identical_images(self, tmp_path):
+        """Test identical image content is sent to the VLM only once."""
+        for name in ("a.png", "b.png"):
+            (tmp_path / name).write_bytes(b"same image bytes")
+        (tmp_path / "c.png").write_bytes(b"other image bytes")
+
+        class CountingVLMParser(VLMParser):
+            calls = 0
+
+            def _call_vlm_mcp(self, image_path, prompt):
+                CountingVLMParser.calls += 1
+                return 'Here you go: {"title": "Cached", "content": []} Done.'
+
+        parser = CountingVLMParser()
+        documents = [parser.parse(tmp_path / n) for n in ("a.png", "b.png", "c.png")]
+
+        assert CountingVLMParser.calls == 2
+        assert all(d.metadata.title == "Cached" for d in documents)
+
+    def test_vlm_parser_parse_batch_propagates_errors(self, sample_pdf, tmp_path):
+        """Test batch parsing surfaces VLM stage errors."""
+        parser = VLMParser()
+
+        with pytest.raises(NotImplementedError):
+            parser.parse_batch([sample_pdf], tmp_path / "pages")
+
     def test_equivalence_checker_with_similar_documents(self, sample_document_pair):
         """
         Test equivalence checker can compare tool and VLM outputs.
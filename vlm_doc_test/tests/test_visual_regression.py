@@ -209,3 +209,21 @@ def test_visual_regression_size_mismatch(sample_image, tmp_path):
     # Should handle size difference (resize to match)
     assert result is not None
     assert "baseline_size" in result.details
+
+
+def test_visual_regression_pixel_diff_count():
+    """Test pixel diff counts any-channel differences for RGB and grayscale."""
+    rng = np.random.default_rng(0)
+    img1 = rng.integers(0, 2, size=(40, 50, 3), dtype=np.uint8)
+    img2 = rng.integers(0, 2, size=(40, 50, 3), dtype=np.uint8)
+
+    tester = VisualRegressionTester()
+
+    expected_rgb = int(np.any(img1 != img2, axis=2).sum())
+    diff_count, total, _ = tester._calculate_pixel_diff(img1, img2)
+    assert diff_count == expected_rgb
+    assert total == 40 * 50
+
+    expected_gray = int((img1[:, :, 0] != img2[:, :, 0]).sum())
+    diff_count, _, _ = tester._calculate_pixel_diff(img1[:, :, 0], img2[:, :, 0])
+    assert diff_count == expected_gray
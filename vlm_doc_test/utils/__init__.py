@@ -6,6 +6,7 @@ and document manipulation.
 """
 
 from .web_scraper import WebScraper, ScrapeResult
+from .batch_utils import run_batch_conversion
 from .markdown_utils import (
     parse_markdown_to_content,
     extract_title_from_markdown,
@@ -18,4 +19,5 @@ __all__ = [
     "parse_markdown_to_content",
     "extract_title_from_markdown",
     "count_headings_by_level",
+    "run_batch_conversion",
 ]
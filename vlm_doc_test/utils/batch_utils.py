@@ -0,0 +1,82 @@
+"""
+Batch conversion utilities for model-backed parsers.
+
+This module provides the shared runner behind ``batch_convert`` of the
+Marker and Docling parsers, converting files in this process or in a pool
+of worker processes that each load one parser.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+
+# Parser of a batch worker process, created by _init_batch_worker
+_worker_parser: Optional[Any] = None
+
+
+def _init_batch_worker(load_parser: Callable[[Any], Any], config: Any) -> None:
+    """Load one parser per worker process, shared by all of its tasks."""
+    global _worker_parser
+    _worker_parser = load_parser(config)
+
+
+def _batch_convert_worker(input_path: Path, output_path: Path, format: str) -> None:
+    """Convert one file in a worker process (module-level so it pickles)."""
+    _worker_parser._convert_file(input_path, output_path, format)
+
+
+def run_batch_conversion(
+    parser: Any,
+    input_paths: List[Path],
+    output_dir: Path,
+    format: str,
+    max_workers: int,
+    load_parser: Callable[[Any], Any],
+) -> List[Path]:
+    """
+    Convert files with ``parser._convert_file``, optionally in worker processes.
+
+    With ``max_workers > 1`` the files are converted in spawned worker
+    processes; each worker calls ``load_parser(parser.config)`` once at
+    start-up and reuses the returned parser for all of its files.
+
+    Args:
+        parser: Parser used in process; its ``config`` is sent to workers
+        input_paths: Files to convert
+        output_dir: Output directory
+        format: Output format ("markdown", "json")
+        max_workers: Worker processes; 1 converts in this process
+        load_parser: Module-level function building a loaded parser from a config
+
+    Returns:
+        List of output file paths, in the order of ``input_paths``
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_paths = [
+        output_dir / (input_path.stem + (".md" if format == "markdown" else ".json"))
+        for input_path in input_paths
+    ]
+
+    max_workers = max(1, min(max_workers, len(input_paths)))
+
+    if max_workers == 1:
+        for input_path, output_path in zip(input_paths, output_paths):
+            parser._convert_file(input_path, output_path, format)
+    else:
+        # Spawn rather than fork: torch/CUDA state does not survive a fork
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_batch_worker,
+            initargs=(load_parser, parser.config),
+        ) as executor:
+            # Consume results so worker errors are raised here
+            list(executor.map(
+                _batch_convert_worker,
+                input_paths,
+                output_paths,
+                [format] * len(input_paths),
+            ))
+
+    return output_paths
@@ -5,10 +5,14 @@ This module provides shared functions for converting markdown text
 to structured ContentElement objects, used by multiple parsers.
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
+
+from pydantic import TypeAdapter
 
 from ..schemas.schema_simple import ContentElement
 
+_CONTENT_ELEMENTS = TypeAdapter(List[ContentElement])
+
 
 def parse_markdown_to_content(
     markdown: str,
@@ -43,89 +47,58 @@ def parse_markdown_to_content(
         >>> elements[1].type
         'paragraph'
     """
-    content = []
-    lines = markdown.split('\n')
-    element_id = 0
+    # Elements are collected as (type, text, level) and validated together
+    # at the end; one pydantic call is cheaper than one per element
+    elements: List[Tuple[str, str, Optional[int]]] = []
 
     if merge_paragraphs:
         # Accumulate consecutive lines into paragraphs
         current_paragraph: List[str] = []
 
-        for line in lines:
+        for line in markdown.split('\n'):
             line = line.strip()
 
             if not line:
                 # Empty line ends current paragraph
                 if current_paragraph:
-                    element_id += 1
-                    content.append(ContentElement(
-                        id=f"{id_prefix}_{element_id}",
-                        type="paragraph",
-                        content=" ".join(current_paragraph),
-                    ))
+                    elements.append(("paragraph", " ".join(current_paragraph), None))
                     current_paragraph = []
-                continue
-
-            if line.startswith('#'):
+            elif line[0] == '#':
                 # Heading - save pending paragraph first
                 if current_paragraph:
-                    element_id += 1
-                    content.append(ContentElement(
-                        id=f"{id_prefix}_{element_id}",
-                        type="paragraph",
-                        content=" ".join(current_paragraph),
-                    ))
+                    elements.append(("paragraph", " ".join(current_paragraph), None))
                     current_paragraph = []
 
                 # Parse heading
-                level = len(line) - len(line.lstrip('#'))
-                heading_text = line.lstrip('#').strip()
-
-                element_id += 1
-                content.append(ContentElement(
-                    id=f"{id_prefix}_{element_id}",
-                    type="heading",
-                    content=heading_text,
-                    level=level,
-                ))
+                heading_text = line.lstrip('#')
+                elements.append(("heading", heading_text.strip(), len(line) - len(heading_text)))
             else:
                 # Regular text - accumulate
                 current_paragraph.append(line)
 
         # Add final paragraph
         if current_paragraph:
-            element_id += 1
-            content.append(ContentElement(
-                id=f"{id_prefix}_{element_id}",
-                type="paragraph",
-                content=" ".join(current_paragraph),
-            ))
+            elements.append(("paragraph", " ".join(current_paragraph), None))
     else:
         # Simple mode: each non-empty line is a separate element
-        for line in lines:
+        for line in markdown.split('\n'):
             line = line.strip()
             if not line:
                 continue
 
-            element_id += 1
-
-            if line.startswith('#'):
-                level = len(line) - len(line.lstrip('#'))
-                text = line.lstrip('#').strip()
-                content.append(ContentElement(
-                    id=f"{id_prefix}_{element_id}",
-                    type="heading",
-                    content=text,
-                    level=level,
-                ))
+            if line[0] == '#':
+                text = line.lstrip('#')
+                elements.append(("heading", text.strip(), len(line) - len(text)))
             else:
-                content.append(ContentElement(
-                    id=f"{id_prefix}_{element_id}",
-                    type="paragraph",
-                    content=line,
-                ))
-
-    return content
+                elements.append(("paragraph", line, None))
+
+    # Paragraphs leave level unset, as when built one by one
+    return _CONTENT_ELEMENTS.validate_python([
+        {"id": f"{id_prefix}_{number}", "type": kind, "content": text, "level": level}
+        if level is not None else
+        {"id": f"{id_prefix}_{number}", "type": kind, "content": text}
+        for number, (kind, text, level) in enumerate(elements, start=1)
+    ])
 
 
 def extract_title_from_markdown(markdown: str) -> Optional[str]:
@@ -5,14 +5,54 @@ This module provides a unified interface for comparing different PDF extraction
 pipelines: PyMuPDF, pdfplumber, Marker-PDF, Docling+VLM, and remote VLM APIs.
 """
 
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    as_completed,
+    wait,
+)
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
+import json
+import os
+import tempfile
 import time
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to stdlib json
+    orjson = None
+
 from ..schemas.schema_simple import SimpleDocument
-from ..parsers import PDFParser, MarkerParser, DoclingParser
+from ..parsers import PDFParser, get_marker_parser, get_docling_parser
+
+
+# Pipelines that run local models on the GPU; these are never run
+# concurrently with each other to avoid VRAM contention.
+GPU_PIPELINES = frozenset({"marker", "docling"})
+
+# Default parser factory per pipeline name; heavy parsers are shared
+# process-wide so their models load once.
+PARSER_FACTORIES = {
+    "pymupdf": PDFParser,
+    "marker": get_marker_parser,
+    "docling": get_docling_parser,
+}
+
+
+@lru_cache(maxsize=1)
+def _warmup_pdf_bytes() -> bytes:
+    """Build (once per process) a tiny one-page PDF in memory for parser warm-up."""
+    import pymupdf as fitz
+
+    with fitz.open() as doc:
+        doc.new_page().insert_text((72, 72), "Warm-up", fontsize=12)
+        return doc.tobytes()
 
 
 @dataclass
@@ -55,26 +95,35 @@ class PDFPipelineComparison:
     5. GLM-4.6V API - Remote VLM (optional)
     """
 
-    def __init__(self):
-        """Initialize comparison framework."""
-        self.parsers = {}
+    def __init__(self, parsers: Optional[Dict[str, Any]] = None):
+        """
+        Initialize comparison framework.
+
+        Args:
+            parsers: Pre-built parser instances keyed by pipeline name.
+                Pipelines not listed here are created on first use from
+                PARSER_FACTORIES.
+        """
+        self._provided_parsers = dict(parsers or {})
+        self.parsers = dict(self._provided_parsers)
+        self._warmed: set = set()
 
     def _get_parser(self, pipeline: str):
         """Get or create parser for pipeline."""
-        if pipeline not in self.parsers:
-            if pipeline == "pymupdf":
-                self.parsers[pipeline] = PDFParser()
-            elif pipeline == "marker":
-                self.parsers[pipeline] = MarkerParser()
-            elif pipeline == "docling":
-                self.parsers[pipeline] = DoclingParser()
+        parser = self.parsers.get(pipeline)
+        if parser is None:
+            factory = PARSER_FACTORIES.get(pipeline)
+            if factory is not None:
+                parser = self.parsers[pipeline] = factory()
 
-        return self.parsers.get(pipeline)
+        return parser
 
     def compare_all(
         self,
         pdf_path: Path,
         pipelines: Optional[List[str]] = None,
+        parallel: bool = False,
+        warmup: bool = False,
     ) -> ComparisonResult:
         """
         Compare all available pipelines on a PDF.
@@ -82,6 +131,10 @@ class PDFPipelineComparison:
         Args:
             pdf_path: Path to PDF file
             pipelines: List of pipelines to test (None = all)
+            parallel: Run independent pipelines in separate processes.
+                GPU pipelines still run one at a time.
+            warmup: Run each parser once on a tiny PDF before timing, so
+                reported times exclude model loading and other cold-start cost
 
         Returns:
             ComparisonResult with metrics
@@ -89,6 +142,23 @@ class PDFPipelineComparison:
         if pipelines is None:
             pipelines = ["pymupdf", "marker", "docling"]
 
+        # Run each pipeline
+        if parallel and len(pipelines) > 1:
+            results = self._run_pipelines_parallel(pipelines, pdf_path, warmup)
+        else:
+            results = {
+                metrics.pipeline_name: metrics
+                for metrics in self._run_pipelines(pipelines, pdf_path, warmup)
+            }
+
+        return self._build_result(pdf_path, results)
+
+    def _build_result(
+        self,
+        pdf_path: Path,
+        results: Dict[str, PipelineMetrics],
+    ) -> ComparisonResult:
+        """Summarize per-pipeline metrics for one PDF into a ComparisonResult."""
         # Get PDF info
         pdf_size_bytes = pdf_path.stat().st_size
         pdf_size_mb = pdf_size_bytes / (1024 * 1024)
@@ -103,12 +173,6 @@ class PDFPipelineComparison:
             # PDF may be corrupted, password-protected, or inaccessible
             pass
 
-        # Run each pipeline
-        results = {}
-        for pipeline_name in pipelines:
-            metrics = self._run_pipeline(pipeline_name, pdf_path)
-            results[pipeline_name] = metrics
-
         # Find fastest and most content
         successful_pipelines = {k: v for k, v in results.items() if v.success}
 
@@ -131,6 +195,80 @@ class PDFPipelineComparison:
             comparison_time=datetime.now(),
         )
 
+    def _run_pipelines(
+        self,
+        pipelines: List[str],
+        pdf_path: Path,
+        warmup: bool = False,
+    ) -> List[PipelineMetrics]:
+        """Run pipelines one after another in this process."""
+        results = []
+        for pipeline_name in pipelines:
+            if warmup:
+                self._warm_up(pipeline_name)
+            results.append(self._run_pipeline(pipeline_name, pdf_path))
+        return results
+
+    def _warm_up(self, pipeline_name: str):
+        """Parse a tiny PDF once with this pipeline's parser, discarding the result."""
+        if pipeline_name in self._warmed:
+            return
+        self._warmed.add(pipeline_name)
+
+        parser = self._get_parser(pipeline_name)
+        if parser is None:
+            return
+        # Parsers take file paths, so write the PDF to a temporary directory
+        with tempfile.TemporaryDirectory(prefix="pipeline_warmup_") as tmp_dir:
+            pdf_path = Path(tmp_dir) / "warmup.pdf"
+            pdf_path.write_bytes(_warmup_pdf_bytes())
+            try:
+                parser.parse(pdf_path)
+            except Exception:
+                # Failures are reported by the timed run
+                pass
+
+    def _run_pipelines_parallel(
+        self,
+        pipelines: List[str],
+        pdf_path: Path,
+        warmup: bool = False,
+    ) -> Dict[str, PipelineMetrics]:
+        """
+        Run pipelines concurrently, one process per independent group.
+
+        CPU pipelines each get their own group; all GPU pipelines share a
+        single group so they run sequentially in one worker.
+        """
+        groups = [[name] for name in pipelines if name not in GPU_PIPELINES]
+        gpu_group = [name for name in pipelines if name in GPU_PIPELINES]
+        if gpu_group:
+            groups.append(gpu_group)
+
+        max_workers = min(len(groups), os.cpu_count() or 1)
+        collected: Dict[str, PipelineMetrics] = {}
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    _run_pipelines_worker,
+                    group,
+                    pdf_path,
+                    {
+                        name: self._provided_parsers[name]
+                        for name in group
+                        if name in self._provided_parsers
+                    },
+                    warmup,
+                )
+                for group in groups
+            ]
+            for future in as_completed(futures):
+                for metrics in future.result():
+                    collected[metrics.pipeline_name] = metrics
+
+        # Preserve the requested pipeline order in reports
+        return {name: collected[name] for name in pipelines}
+
     def _run_pipeline(
         self,
         pipeline_name: str,
@@ -171,7 +309,7 @@ class PDFPipelineComparison:
                 links_extracted=len(document.links),
                 total_text_length=sum(len(e.content) for e in document.content),
                 uses_local_model=pipeline_name == "docling",
-                uses_gpu=pipeline_name in ["marker", "docling"],
+                uses_gpu=pipeline_name in GPU_PIPELINES,
             )
 
             return metrics
@@ -211,8 +349,7 @@ class PDFPipelineComparison:
         elif format == "markdown":
             return self._generate_markdown_report(result)
         elif format == "json":
-            import json
-            return json.dumps(self._comparison_to_dict(result), indent=2)
+            return self._generate_json_report(result)
         else:
             raise ValueError(f"Unknown format: {format}")
 
@@ -291,6 +428,15 @@ class PDFPipelineComparison:
 
         return "\n".join(lines)
 
+    def _generate_json_report(self, result: ComparisonResult) -> str:
+        """Generate JSON report."""
+        data = self._comparison_to_dict(result)
+        if orjson is not None:
+            return orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            ).decode()
+        return json.dumps(data, indent=2)
+
     def _comparison_to_dict(self, result: ComparisonResult) -> Dict[str, Any]:
         """Convert comparison result to dictionary."""
         return {
@@ -322,27 +468,39 @@ class PDFPipelineComparison:
         pdf_paths: List[Path],
         output_dir: Path,
         pipelines: Optional[List[str]] = None,
+        num_workers: int = 1,
+        max_concurrent_results: int = 32,
     ) -> List[ComparisonResult]:
         """
         Compare multiple PDFs across pipelines.
 
+        With ``num_workers > 1`` the CPU pipelines of each PDF run in worker
+        processes, one PDF per task, while GPU pipelines keep running one
+        at a time in this process. Each report is written as soon as its
+        PDF completes, and at most ``max_concurrent_results`` PDFs are
+        submitted to the workers at once.
+
         Args:
             pdf_paths: List of PDF paths
             output_dir: Directory to save reports
             pipelines: List of pipelines to test
+            num_workers: Worker processes (default: 1, which compares
+                every PDF in this process)
+            max_concurrent_results: Maximum PDFs in flight at once
 
         Returns:
-            List of comparison results
+            List of comparison results, in the order of ``pdf_paths``
         """
         output_dir.mkdir(parents=True, exist_ok=True)
-        results = []
+        results: List[Optional[ComparisonResult]] = [None] * len(pdf_paths)
 
-        for pdf_path in pdf_paths:
-            result = self.compare_all(pdf_path, pipelines)
-            results.append(result)
+        for index, result in self._iter_batch(
+            pdf_paths, pipelines, num_workers, max_concurrent_results
+        ):
+            results[index] = result
 
             # Save individual report
-            report_path = output_dir / f"{pdf_path.stem}_comparison.md"
+            report_path = output_dir / f"{pdf_paths[index].stem}_comparison.md"
             report = self.generate_report(result, format="markdown")
             report_path.write_text(report, encoding='utf-8')
 
@@ -353,6 +511,58 @@ class PDFPipelineComparison:
 
         return results
 
+    def _iter_batch(
+        self,
+        pdf_paths: List[Path],
+        pipelines: Optional[List[str]],
+        num_workers: int,
+        max_concurrent_results: int,
+    ) -> Iterator[Tuple[int, ComparisonResult]]:
+        """Yield ``(index, result)`` for each PDF of a batch, in completion order."""
+        if pipelines is None:
+            pipelines = ["pymupdf", "marker", "docling"]
+        cpu_pipelines = [name for name in pipelines if name not in GPU_PIPELINES]
+        gpu_pipelines = [name for name in pipelines if name in GPU_PIPELINES]
+        max_in_flight = max(1, max_concurrent_results)
+        # More workers than PDFs in flight would sit idle
+        num_workers = max(1, min(num_workers, max_in_flight, len(pdf_paths)))
+
+        if num_workers == 1 or not cpu_pipelines:
+            for index, pdf_path in enumerate(pdf_paths):
+                yield index, self.compare_all(pdf_path, pipelines)
+            return
+
+        parsers = {
+            name: parser
+            for name, parser in self._provided_parsers.items()
+            if name in cpu_pipelines
+        }
+
+        pending = enumerate(pdf_paths)
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            def submit(pdf_path: Path) -> Future:
+                return executor.submit(
+                    _run_pipelines_worker, cpu_pipelines, pdf_path, parsers
+                )
+
+            in_flight = {submit(p): i for i, p in islice(pending, max_in_flight)}
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = in_flight.pop(future)
+                    # Refill the freed slot before running the GPU pipelines
+                    next_item = next(pending, None)
+                    if next_item is not None:
+                        in_flight[submit(next_item[1])] = next_item[0]
+
+                    # GPU pipelines stay in this process, one at a time
+                    pdf_path = pdf_paths[index]
+                    metrics = future.result() + self._run_pipelines(gpu_pipelines, pdf_path)
+                    by_name = {m.pipeline_name: m for m in metrics}
+                    yield index, self._build_result(
+                        pdf_path, {name: by_name[name] for name in pipelines}
+                    )
+
     def _generate_batch_summary(self, results: List[ComparisonResult]) -> str:
         """Generate summary for batch comparison."""
         lines = []
@@ -380,3 +590,14 @@ class PDFPipelineComparison:
             lines.append("")
 
         return "\n".join(lines)
+
+
+def _run_pipelines_worker(
+    pipeline_names: List[str],
+    pdf_path: Path,
+    parsers: Dict[str, Any],
+    warmup: bool = False,
+) -> List[PipelineMetrics]:
+    """Process-pool entry point: run pipelines sequentially in this process."""
+    comparison = PDFPipelineComparison(parsers=parsers)
+    return comparison._run_pipelines(pipeline_names, pdf_path, warmup)
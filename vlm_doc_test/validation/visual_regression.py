@@ -12,6 +12,28 @@ from PIL import Image
 from skimage.metrics import structural_similarity as ssim
 from dataclasses import dataclass
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to NumPy
+    njit = None
+
+
+def _count_diff_pixels_u8(img1: np.ndarray, img2: np.ndarray) -> int:
+    """Count (H, W, C) uint8 pixels where any channel differs."""
+    height, width, channels = img1.shape
+    count = 0
+    for y in range(height):
+        for x in range(width):
+            for c in range(channels):
+                if img1[y, x, c] != img2[y, x, c]:
+                    count += 1
+                    break
+    return count
+
+
+if njit is not None:
+    _count_diff_pixels_u8 = njit(cache=True)(_count_diff_pixels_u8)
+
 
 @dataclass
 class VisualComparisonResult:
@@ -164,17 +186,23 @@ class VisualRegressionTester:
         Returns:
             (diff_count, total_pixels, diff_percentage)
         """
-        # Calculate absolute difference
-        diff = np.abs(img1.astype(np.int16) - img2.astype(np.int16))
-
-        # Count pixels with any difference (across any channel)
-        if len(diff.shape) == 3:
-            diff_mask = np.any(diff > 0, axis=2)
+        total_pixels = img1.shape[0] * img1.shape[1]
+
+        if njit is not None and img1.dtype == np.uint8 and img2.dtype == np.uint8:
+            # Native scan over contiguous uint8 buffers
+            if img1.ndim == 2:
+                img1 = img1[:, :, np.newaxis]
+                img2 = img2[:, :, np.newaxis]
+            diff_count = _count_diff_pixels_u8(
+                np.ascontiguousarray(img1),
+                np.ascontiguousarray(img2),
+            )
         else:
-            diff_mask = diff > 0
+            # Count pixels with any difference (across any channel)
+            diff = img1 != img2
+            diff_mask = np.any(diff, axis=2) if diff.ndim == 3 else diff
+            diff_count = np.sum(diff_mask)
 
-        diff_count = np.sum(diff_mask)
-        total_pixels = diff_mask.size
         diff_percentage = (diff_count / total_pixels) * 100
 
         return int(diff_count), int(total_pixels), float(diff_percentage)